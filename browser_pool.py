@@ -0,0 +1,86 @@
+"""
+Shared Chromium instances for the scrapers.
+
+Launching Chromium costs seconds and hundreds of MB, so each thread keeps one
+long-lived browser per headless setting and scrapers open their contexts on it. Playwright's sync API is bound to the thread that started it, which
+is why browsers are shared within a thread rather than across threads.
+"""
+
+from playwright.sync_api import sync_playwright, Browser
+import atexit
+import threading
+from typing import Dict
+
+# Launch flags for the scrapers' Chromium instances. Chromium has no flags for
+# skipping images or scripts; the basic scraper blocks those per request instead.
+CHROMIUM_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-web-security',
+    '--disable-features=VizDisplayCompositor',
+    '--disable-background-timer-throttling',
+    '--disable-backgrounding-occluded-windows',
+    '--disable-renderer-backgrounding',
+    '--disable-features=TranslateUI',
+    '--disable-ipc-flooding-protection',
+    '--disable-gpu',
+    '--disable-software-rasterizer',
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--metrics-recording-only',
+    '--no-first-run',
+    '--safebrowsing-disable-auto-update',
+    '--disable-client-side-phishing-detection',
+    '--disable-component-update',
+    '--disable-domain-reliability'
+]
+
+_local = threading.local()
+
+def get_browser(headless: bool = False) -> Browser:
+    """
+    Get this thread's shared Chromium browser, launching it on first use.
+
+    Args:
+        headless: Whether the browser runs in headless mode
+
+    Returns:
+        Browser to open contexts on. Callers close their contexts, not the browser.
+    """
+    browsers: Dict[bool, Browser] = getattr(_local, 'browsers', None)
+    if browsers is None:
+        _local.playwright = sync_playwright().start()
+        browsers = _local.browsers = {}
+
+    browser = browsers.get(headless)
+    if browser is None or not browser.is_connected():
+        browser = browsers[headless] = _local.playwright.chromium.launch(
+            headless=headless,
+            args=CHROMIUM_ARGS
+        )
+        print(f"🌐 Launched shared Chromium (headless={headless})")
+    return browser
+
+def shutdown_browser():
+    """
+    Close this thread's shared browsers and stop its Playwright driver.
+
+    Worker threads call this before exiting; the main thread's browsers are closed at exit.
+    """
+    browsers = getattr(_local, 'browsers', None)
+    if browsers is None:
+        return
+
+    for browser in browsers.values():
+        try:
+            browser.close()
+        except Exception:
+            pass
+    _local.playwright.stop()
+    del _local.browsers
+    del _local.playwright
+
+atexit.register(shutdown_browser)
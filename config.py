@@ -1,4 +1,6 @@
 import os
+import logging
+import sys
 from typing import Optional
 
 class Config:
@@ -11,10 +13,16 @@ class Config:
     # DUCKDB_PATH = os.getenv('DUCKDB_PATH', ':memory:')
     DUCKDB_PATH = os.getenv('DUCKDB_PATH', './data/newegg_data.duckdb')
     
+    # DuckDB tuning (empty or 0 keeps DuckDB's own default)
+    DUCKDB_THREADS = int(os.getenv('DUCKDB_THREADS', '0'))
+    DUCKDB_MEMORY_LIMIT = os.getenv('DUCKDB_MEMORY_LIMIT', '')  # e.g. '4GB'
+    DUCKDB_PRESERVE_INSERTION_ORDER = os.getenv('DUCKDB_PRESERVE_INSERTION_ORDER', 'false').lower() == 'true'
+    
     # Scraper configuration
     HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
     MAX_REVIEW_PAGES = int(os.getenv('MAX_REVIEW_PAGES', '0'))  # 0 = all pages
     REQUEST_DELAY = float(os.getenv('REQUEST_DELAY', '1.0'))  # seconds between requests
+    USE_BROWSER = os.getenv('USE_BROWSER', 'true').lower() == 'true'  # false = HTTP-only product metadata
     
     # Enhanced scraper specific settings
     USER_AGENT_STRATEGY = os.getenv('USER_AGENT_STRATEGY', 'random')  # random, sequential, weighted
@@ -25,43 +33,118 @@ class Config:
     OUTPUT_DIR = os.getenv('OUTPUT_DIR', './data')
     EXPORT_CSV = os.getenv('EXPORT_CSV', 'false').lower() == 'true'
     
+    # Result cache configuration
+    CACHE_ENABLED = os.getenv('CACHE_ENABLED', 'true').lower() == 'true'
+    CACHE_TTL = float(os.getenv('CACHE_TTL', '21600'))  # seconds a scraped result is reused (6h)
+    CACHE_DIR = os.getenv('CACHE_DIR', './data/cache')
+    
     # Logging configuration
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FILE = os.getenv('LOG_FILE', './logs/scraper.log')
     
+    # Derived values, computed once at import time
+    _SCRAPER_TYPE_LOWER = SCRAPER_TYPE.lower()
+    _IS_ENHANCED = _SCRAPER_TYPE_LOWER == 'enhanced'
+    _IS_BASIC = _SCRAPER_TYPE_LOWER == 'basic'
+    _MAX_REVIEW_PAGES_OR_NONE = None if MAX_REVIEW_PAGES == 0 else MAX_REVIEW_PAGES
+    
+    @classmethod
+    def apply_overrides(cls, **overrides):
+        """
+        Override settings with typed values, e.g. from command line arguments.
+        
+        None values are skipped, so unset arguments keep the environment's settings.
+        Derived values are recomputed afterwards.
+        
+        Args:
+            **overrides: Setting names (e.g. SCRAPER_TYPE, HEADLESS) and their values
+        """
+        for name, value in overrides.items():
+            if not hasattr(cls, name):
+                raise AttributeError(f"Unknown setting: {name}")
+            if value is not None:
+                setattr(cls, name, value)
+        
+        cls._SCRAPER_TYPE_LOWER = cls.SCRAPER_TYPE.lower()
+        cls._IS_ENHANCED = cls._SCRAPER_TYPE_LOWER == 'enhanced'
+        cls._IS_BASIC = cls._SCRAPER_TYPE_LOWER == 'basic'
+        cls._MAX_REVIEW_PAGES_OR_NONE = None if cls.MAX_REVIEW_PAGES == 0 else cls.MAX_REVIEW_PAGES
+    
     @classmethod
     def get_max_review_pages(cls) -> Optional[int]:
         """Get max review pages, returning None if set to 0 (all pages)."""
-        return None if cls.MAX_REVIEW_PAGES == 0 else cls.MAX_REVIEW_PAGES
+        return cls._MAX_REVIEW_PAGES_OR_NONE
     
     @classmethod
     def is_enhanced_scraper(cls) -> bool:
         """Check if enhanced scraper is selected."""
-        return cls.SCRAPER_TYPE.lower() == 'enhanced'
+        return cls._IS_ENHANCED
     
     @classmethod
     def is_basic_scraper(cls) -> bool:
         """Check if basic scraper is selected."""
-        return cls.SCRAPER_TYPE.lower() == 'basic'
+        return cls._IS_BASIC
     
     @classmethod
-    def print_config(cls):
-        """Print current configuration."""
-        print("🔧 CONFIGURATION")
-        print("=" * 50)
-        print(f"Scraper Type: {cls.SCRAPER_TYPE.upper()}")
-        print(f"Database Path: {cls.DUCKDB_PATH}")
-        print(f"Headless Mode: {cls.HEADLESS}")
-        print(f"Max Review Pages: {cls.get_max_review_pages() or 'All'}")
-        print(f"Request Delay: {cls.REQUEST_DELAY}s")
-        print(f"Output Directory: {cls.OUTPUT_DIR}")
-        print(f"Export CSV: {cls.EXPORT_CSV}")
-        print(f"Log Level: {cls.LOG_LEVEL}")
+    def setup_logging(cls):
+        """
+        Configure the root logger from LOG_LEVEL and LOG_FILE.
+        
+        Console output keeps the plain message format used by the scripts' prints,
+        while the log file gets timestamps and logger names. Safe to call repeatedly.
+        """
+        if getattr(cls, '_logging_configured', False):
+            return
+        cls._logging_configured = True
+        
+        root = logging.getLogger()
+        root.setLevel(getattr(logging, cls.LOG_LEVEL.upper(), logging.INFO))
+        
+        console = logging.StreamHandler()
+        console.setFormatter(logging.Formatter('%(message)s'))
+        root.addHandler(console)
+        
+        if cls.LOG_FILE:
+            log_dir = os.path.dirname(cls.LOG_FILE)
+            if log_dir:
+                os.makedirs(log_dir, exist_ok=True)
+            file_handler = logging.FileHandler(cls.LOG_FILE)
+            file_handler.setFormatter(logging.Formatter('%(asctime)s %(name)s %(levelname)s %(message)s'))
+            root.addHandler(file_handler)
+    
+    @classmethod
+    def format_config(cls) -> str:
+        """Format the current configuration as a printable block."""
+        lines = [
+            "🔧 CONFIGURATION",
+            "=" * 50,
+            f"Scraper Type: {cls.SCRAPER_TYPE.upper()}",
+            f"Database Path: {cls.DUCKDB_PATH}",
+            f"DuckDB Threads: {cls.DUCKDB_THREADS or 'Default'}",
+            f"DuckDB Memory Limit: {cls.DUCKDB_MEMORY_LIMIT or 'Default'}",
+            f"Headless Mode: {cls.HEADLESS}",
+            f"Use Browser: {cls.USE_BROWSER}",
+            f"Max Review Pages: {cls.get_max_review_pages() or 'All'}",
+            f"Request Delay: {cls.REQUEST_DELAY}s",
+            f"Output Directory: {cls.OUTPUT_DIR}",
+            f"Export CSV: {cls.EXPORT_CSV}",
+            f"Result Cache: {f'{cls.CACHE_TTL:g}s TTL' if cls.CACHE_ENABLED else 'Disabled'}",
+            f"Log Level: {cls.LOG_LEVEL}",
+        ]
         
         if cls.is_enhanced_scraper():
-            print("\n🚀 ENHANCED SCRAPER SETTINGS:")
-            print(f"User Agent Strategy: {cls.USER_AGENT_STRATEGY}")
-            print(f"Max Workers: {cls.MAX_WORKERS}")
-            print(f"Rate Limit: {cls.RATE_LIMIT_PER_SECOND} req/s")
+            lines += [
+                "\n🚀 ENHANCED SCRAPER SETTINGS:",
+                f"User Agent Strategy: {cls.USER_AGENT_STRATEGY}",
+                f"Max Workers: {cls.MAX_WORKERS}",
+                f"Rate Limit: {cls.RATE_LIMIT_PER_SECOND} req/s",
+            ]
         
-        print("=" * 50) 
\ No newline at end of file
+        lines.append("=" * 50)
+        return "\n".join(lines)
+    
+    @classmethod
+    def print_config(cls):
+        """Print current configuration."""
+        # One write for the whole block rather than a print per line
+        sys.stdout.write(cls.format_config() + "\n") 
\ No newline at end of file
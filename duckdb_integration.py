@@ -1,9 +1,334 @@
 import duckdb
-import json
+import logging
 import os
+import re
+import atexit
+import threading
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 import pandas as pd
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Column order of the review batch frame registered for bulk inserts
+REVIEW_COLUMNS = [
+    "review_id", "product_item_number", "page_number", "review_index", "title", "rating",
+    "author", "date", "is_verified", "ownership", "pros", "cons", "overall_review",
+    "full_content", "timestamp", "scraped_at", "rating_int"
+]
+
+# Explicit dtypes for the batch frame so DuckDB scans typed NumPy arrays
+# instead of boxed Python objects. Timestamps stay strings and are cast in SQL.
+_REVIEW_DTYPES = {
+    "page_number": "int32",
+    "review_index": "int32",
+    "is_verified": "bool",
+    "rating_int": "Int8",
+}
+
+# Columns refreshed when a review is re-scraped. Review ids are positional
+# (page_N_review_M), so the review at a given id changes as new reviews are
+# posted and an existing row has to be updated rather than kept. The key and
+# the indexed product_item_number column cannot be assigned in an upsert.
+_REVIEW_UPDATE_SET = ", ".join(
+    f"{column} = EXCLUDED.{column}"
+    for column in REVIEW_COLUMNS
+    if column not in ("review_id", "product_item_number")
+)
+
+# SQL versions of the Python parsers below, for backfills and JSON loads.
+# Each is formatted with the source column or expression.
+_PRICE_VALUE_SQL = "TRY_CAST(replace(regexp_extract({}, '\\d[\\d,]*(\\.\\d+)?'), ',', '') AS DECIMAL(10,2))"
+_REVIEWS_COUNT_VALUE_SQL = "TRY_CAST(replace(regexp_extract({}, '\\d[\\d,]*'), ',', '') AS INTEGER)"
+_RATING_VALUE_SQL = "TRY_CAST(regexp_extract({}, '\\d+(\\.\\d+)?') AS FLOAT)"
+_RATING_INT_SQL = "TRY_CAST(SUBSTR({}, 1, 1) AS TINYINT)"
+
+# Full schema as one idempotent script, run once per opened connection
+_SCHEMA_SQL = f"""
+    -- Products table
+    CREATE TABLE IF NOT EXISTS products (
+        item_number VARCHAR PRIMARY KEY,
+        title VARCHAR,
+        brand VARCHAR,
+        price VARCHAR,
+        rating VARCHAR,
+        reviews_count VARCHAR,
+        description TEXT,
+        product_url VARCHAR,
+        scraped_at TIMESTAMP,
+        price_value DECIMAL(10,2),
+        reviews_count_value INTEGER,
+        rating_value FLOAT
+    );
+    
+    -- Numeric copies of the display strings, added to older databases and backfilled
+    ALTER TABLE products ADD COLUMN IF NOT EXISTS price_value DECIMAL(10,2);
+    ALTER TABLE products ADD COLUMN IF NOT EXISTS reviews_count_value INTEGER;
+    ALTER TABLE products ADD COLUMN IF NOT EXISTS rating_value FLOAT;
+    UPDATE products SET
+        price_value = {_PRICE_VALUE_SQL.format("price")},
+        reviews_count_value = {_REVIEWS_COUNT_VALUE_SQL.format("reviews_count")},
+        rating_value = {_RATING_VALUE_SQL.format("rating")}
+    WHERE price_value IS NULL AND reviews_count_value IS NULL AND rating_value IS NULL;
+    
+    -- Reviews table (denormalized for easier querying)
+    CREATE TABLE IF NOT EXISTS reviews (
+        review_id VARCHAR PRIMARY KEY,
+        product_item_number VARCHAR,
+        page_number INTEGER,
+        review_index INTEGER,
+        title VARCHAR,
+        rating VARCHAR,
+        author VARCHAR,
+        date VARCHAR,
+        is_verified BOOLEAN,
+        ownership VARCHAR,
+        pros TEXT,
+        cons TEXT,
+        overall_review TEXT,
+        full_content TEXT,
+        timestamp TIMESTAMP,
+        scraped_at TIMESTAMP,
+        rating_int TINYINT
+    );
+    
+    -- Databases created before rating_int existed get the column and a backfill
+    ALTER TABLE reviews ADD COLUMN IF NOT EXISTS rating_int TINYINT;
+    UPDATE reviews SET rating_int = {_RATING_INT_SQL.format("rating")}
+    WHERE rating_int IS NULL AND {_RATING_INT_SQL.format("rating")} IS NOT NULL;
+    
+    -- Every per-product query filters on the item number. rating_int and date are
+    -- left out because DuckDB cannot upsert into columns covered by an index.
+    CREATE INDEX IF NOT EXISTS idx_reviews_item ON reviews (product_item_number);
+    
+    -- Metadata table
+    CREATE TABLE IF NOT EXISTS scraping_metadata (
+        product_url VARCHAR PRIMARY KEY,
+        scraped_at TIMESTAMP,
+        total_review_pages INTEGER,
+        total_reviews INTEGER,
+        scraper_version VARCHAR
+    );
+    
+    -- State of the reviews table the FTS index was last built from (one row)
+    CREATE TABLE IF NOT EXISTS fts_index_state (
+        reviews_count BIGINT,
+        last_scraped_at TIMESTAMP
+    );
+"""
+
+# Write statements are built once at import time so each insert only binds
+# parameters. DuckDB's Python API has no reusable prepared statement handle.
+PRODUCT_COLUMNS = [
+    "item_number", "title", "brand", "price", "rating", "reviews_count", "description",
+    "product_url", "scraped_at", "price_value", "reviews_count_value", "rating_value"
+]
+
+_PRODUCT_UPSERT = "ON CONFLICT (item_number) DO UPDATE SET " + ", ".join(
+    f"{column} = EXCLUDED.{column}" for column in PRODUCT_COLUMNS if column != "item_number"
+)
+
+_INSERT_PRODUCT_SQL = f"""
+    INSERT INTO products ({", ".join(PRODUCT_COLUMNS)})
+    VALUES ({", ".join("?" for _ in PRODUCT_COLUMNS)})
+    {_PRODUCT_UPSERT}
+"""
+
+_DELETE_LEGACY_REVIEWS_SQL = """
+    DELETE FROM reviews
+    WHERE product_item_number = ? AND NOT starts_with(review_id, ? || ':')
+"""
+
+_REVIEW_COLUMN_LIST = ", ".join(REVIEW_COLUMNS)
+
+# Review timestamps arrive as ISO-8601 strings and are parsed by DuckDB in bulk
+_REVIEW_SELECT_LIST = ", ".join(
+    "CAST(timestamp AS TIMESTAMP)" if column == "timestamp" else column
+    for column in REVIEW_COLUMNS
+)
+
+_UPSERT_REVIEWS_SQL = f"""
+    INSERT INTO reviews ({_REVIEW_COLUMN_LIST})
+    SELECT {_REVIEW_SELECT_LIST} FROM reviews_batch
+    ON CONFLICT (review_id) DO UPDATE SET {_REVIEW_UPDATE_SET}
+"""
+
+METADATA_COLUMNS = [
+    "product_url", "scraped_at", "total_review_pages", "total_reviews", "scraper_version"
+]
+
+_METADATA_UPSERT = "ON CONFLICT (product_url) DO UPDATE SET " + ", ".join(
+    f"{column} = EXCLUDED.{column}" for column in METADATA_COLUMNS if column != "product_url"
+)
+
+_INSERT_METADATA_SQL = f"""
+    INSERT INTO scraping_metadata ({", ".join(METADATA_COLUMNS)})
+    VALUES ({", ".join("?" for _ in METADATA_COLUMNS)})
+    {_METADATA_UPSERT}
+"""
+
+# Bulk load of scraper JSON output (one result object, or an array of them),
+# read and unnested by DuckDB. Each statement takes the file path as its only
+# parameter and mirrors what insert_scraped_data does per result.
+_JSON_SOURCE = "read_json_auto(?)"
+
+# Explicit type for the nested review pages. Without it a file with no reviews
+# is read as JSON[] and cannot be flattened.
+_JSON_REVIEW_PAGES_TYPE = """STRUCT(
+    review_id VARCHAR, page_number INTEGER, review_index INTEGER, title VARCHAR,
+    rating VARCHAR, author VARCHAR, date VARCHAR, is_verified BOOLEAN, ownership VARCHAR,
+    pros VARCHAR, cons VARCHAR, overall_review VARCHAR, full_content VARCHAR,
+    "timestamp" VARCHAR
+)[][]"""
+
+_JSON_PRODUCTS_SQL = f"""
+    INSERT INTO products ({", ".join(PRODUCT_COLUMNS)})
+    SELECT
+        product.item_number, product.title, product.brand, product.price, product.rating,
+        product.reviews_count, product.description, product.product_url,
+        CAST(metadata.scraped_at AS TIMESTAMP),
+        {_PRICE_VALUE_SQL.format("product.price")},
+        {_REVIEWS_COUNT_VALUE_SQL.format("product.reviews_count")},
+        {_RATING_VALUE_SQL.format("product.rating")}
+    FROM {_JSON_SOURCE}
+    {_PRODUCT_UPSERT}
+"""
+
+_JSON_DELETE_LEGACY_REVIEWS_SQL = f"""
+    DELETE FROM reviews
+    WHERE product_item_number IN (SELECT product.item_number FROM {_JSON_SOURCE})
+    AND NOT starts_with(review_id, product_item_number || ':')
+"""
+
+_JSON_REVIEWS_SQL = f"""
+    INSERT INTO reviews ({_REVIEW_COLUMN_LIST})
+    SELECT
+        item_number || ':' || r.review_id, item_number, r.page_number, r.review_index,
+        r.title, r.rating, r.author, r.date, r.is_verified, r.ownership, r.pros, r.cons,
+        r.overall_review, r.full_content, CAST(r.timestamp AS TIMESTAMP), scraped_at,
+        {_RATING_INT_SQL.format("r.rating")}
+    FROM (
+        SELECT
+            product.item_number AS item_number,
+            CAST(metadata.scraped_at AS TIMESTAMP) AS scraped_at,
+            unnest(flatten(CAST(reviews AS {_JSON_REVIEW_PAGES_TYPE}))) AS r
+        FROM {_JSON_SOURCE}
+    ) src
+    ON CONFLICT (review_id) DO UPDATE SET {_REVIEW_UPDATE_SET}
+"""
+
+_JSON_METADATA_SQL = f"""
+    INSERT INTO scraping_metadata ({", ".join(METADATA_COLUMNS)})
+    SELECT
+        metadata.product_url, CAST(metadata.scraped_at AS TIMESTAMP),
+        metadata.total_review_pages, metadata.total_reviews, metadata.scraper_version
+    FROM {_JSON_SOURCE}
+    {_METADATA_UPSERT}
+"""
+
+# Per-product queries shared by the DataFrame getters and the CSV export
+_PRODUCT_SUMMARY_SQL = """
+    SELECT 
+        p.item_number,
+        p.title,
+        p.brand,
+        p.price,
+        p.rating,
+        p.reviews_count,
+        COUNT(r.review_id) as actual_reviews,
+        AVG(r.rating_int) as avg_rating,
+        COUNT(CASE WHEN r.is_verified = true THEN 1 END) as verified_reviews,
+        p.scraped_at
+    FROM products p
+    LEFT JOIN reviews r ON p.item_number = r.product_item_number
+    WHERE p.item_number = ?
+    GROUP BY p.item_number, p.title, p.brand, p.price, p.rating, p.reviews_count, p.scraped_at
+"""
+
+_RATING_DISTRIBUTION_SQL = """
+    SELECT 
+        rating,
+        COUNT(*) as count,
+        ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (), 2) as percentage
+    FROM reviews
+    WHERE product_item_number = ?
+    GROUP BY rating_int, rating
+    ORDER BY rating_int DESC
+"""
+
+def _content_column(full: bool, preview_chars: int) -> str:
+    """Select list entry for review text: the full body, or a preview cut in SQL."""
+    return "full_content" if full else f"SUBSTR(full_content, 1, {int(preview_chars)}) as content_preview"
+
+_PRODUCT_REVIEWS_SQL = """
+    SELECT * FROM reviews WHERE product_item_number = ? ORDER BY page_number, review_index
+"""
+
+# Review listing used by query_db.py --reviews
+_REVIEWS_PREVIEW_SQL = """
+    SELECT title, rating, author, date, is_verified, 
+           SUBSTR(full_content, 1, 200) as content_preview
+    FROM reviews 
+    WHERE product_item_number = ?
+    ORDER BY date DESC
+    LIMIT ?
+"""
+
+# Process-wide pool of open connections, keyed by absolute database path
+_POOL: Dict[str, duckdb.DuckDBPyConnection] = {}
+_POOL_LOCK = threading.Lock()
+
+# Query result caches of the pooled connections, under the same keys. Every instance
+# on a connection shares its cache, so an insert through one invalidates it for all.
+_POOL_CACHES: Dict[str, Dict[tuple, pd.DataFrame]] = {}
+
+# id() of connections and cursors with a transaction() open. Pooled connections are
+# shared between NeweggDuckDB instances, so this can't live on the instance.
+_ACTIVE_TRANSACTIONS: Set[int] = set()
+
+def close_pooled_connections():
+    """Close every pooled DuckDB connection."""
+    with _POOL_LOCK:
+        for conn in _POOL.values():
+            conn.close()
+        _POOL.clear()
+        _POOL_CACHES.clear()
+
+atexit.register(close_pooled_connections)
+
+def _review_key(item_number: str, review_id: str) -> str:
+    """
+    Build the stored review primary key.
+    
+    Scraped review ids (page_N_review_M) are only unique within one product,
+    so they are namespaced by the product item number.
+    """
+    return f"{item_number}:{review_id}"
+
+def _sql_literal(value: str) -> str:
+    """Quote a string as a SQL literal, for spots like COPY TO that can't take a parameter."""
+    return "'" + value.replace("'", "''") + "'"
+
+# First number in a display string: "$1,299.99" -> "1,299.99", "(1,234)" -> "1,234"
+_NUMBER_RE = re.compile(r'\d[\d,]*(?:\.\d+)?')
+
+def _parse_number(text: str) -> Optional[float]:
+    """Parse the first number in a scraped display string, or None if there isn't one."""
+    match = _NUMBER_RE.search(text) if text else None
+    return float(match.group().replace(',', '')) if match else None
+
+def _parse_count(text: str) -> Optional[int]:
+    """Parse a scraped count like '(1,234)' as an integer, or None if there isn't one."""
+    number = _parse_number(text)
+    return int(number) if number is not None else None
+
+def _parse_rating_int(rating: str) -> Optional[int]:
+    """Parse the star count from a review rating like '4/5', or None if unrated."""
+    if rating and rating[0].isdigit():
+        return int(rating[0])
+    return None
 
 class NeweggDuckDB:
     """
@@ -11,6 +336,9 @@ class NeweggDuckDB:
     Handles data insertion, querying, and analysis.
     """
     
+    # Set once INSTALL fts has failed so later instances don't retry the download
+    _fts_install_failed = False
+    
     def __init__(self, db_path: str = None):
         """
         Initialize DuckDB connection.
@@ -30,140 +358,338 @@ class NeweggDuckDB:
             os.makedirs(os.path.dirname(db_path), exist_ok=True)
         
         self.db_path = db_path
-        self.conn = duckdb.connect(db_path)
-        self._create_tables()
+        # Query results keyed by (method, item_number, *args), dropped when that product is re-inserted
+        self.conn, self._summary_cache = self._get_connection(db_path)
+        self.fts_enabled = self._load_fts()
+        
+        logger.info("🦆 Connected to DuckDB: %s", db_path)
+    
+    def _get_connection(self, db_path: str) -> Tuple[duckdb.DuckDBPyConnection, Dict[tuple, pd.DataFrame]]:
+        """
+        Get the pooled connection for a database file, opening it on first use.
+        
+        In-memory databases are never pooled since each connection is its own database.
+        
+        Returns:
+            The connection and the query result cache shared by its users
+        """
+        if db_path == ':memory:':
+            return self._open(db_path), {}
         
-        print(f"🦆 Connected to DuckDB: {db_path}")
+        key = os.path.abspath(db_path)
+        with _POOL_LOCK:
+            conn = _POOL.get(key)
+            if conn is None:
+                conn = _POOL[key] = self._open(db_path)
+                _POOL_CACHES[key] = {}
+            return conn, _POOL_CACHES[key]
     
-    def _create_tables(self):
+    def _open(self, db_path: str) -> duckdb.DuckDBPyConnection:
+        """Open a new connection with the configured settings and make sure the schema exists."""
+        conn = duckdb.connect(db_path, config=self._connection_config())
+        self._create_tables(conn)
+        return conn
+    
+    @staticmethod
+    def _connection_config() -> Dict[str, object]:
+        """
+        DuckDB settings from Config, applied when a connection is opened.
+        
+        Insertion order is not preserved by default, which lets DuckDB run scans and
+        aggregates in parallel; queries whose row order matters say so with ORDER BY.
+        """
+        settings: Dict[str, object] = {
+            'preserve_insertion_order': Config.DUCKDB_PRESERVE_INSERTION_ORDER
+        }
+        if Config.DUCKDB_THREADS:
+            settings['threads'] = Config.DUCKDB_THREADS
+        if Config.DUCKDB_MEMORY_LIMIT:
+            settings['memory_limit'] = Config.DUCKDB_MEMORY_LIMIT
+        return settings
+    
+    def _create_tables(self, conn: duckdb.DuckDBPyConnection):
         """Create the necessary tables for Newegg data."""
+        conn.execute(_SCHEMA_SQL)
+        logger.debug("✅ DuckDB tables created successfully")
+    
+    def _cache_get(self, key: tuple) -> Optional[pd.DataFrame]:
+        """Get a copy of a cached query result, or None if it isn't cached."""
+        cached = self._summary_cache.get(key)
+        return None if cached is None else cached.copy()
+    
+    def _cache_put(self, key: tuple, df: pd.DataFrame) -> pd.DataFrame:
+        """Cache a query result and hand the caller its own copy."""
+        self._summary_cache[key] = df
+        return df.copy()
+    
+    def _invalidate_cache(self, item_number: str):
+        """Drop cached results for a product, plus the all-products summary."""
+        # In place, since the cache is shared with the other instances on this connection
+        for key in [key for key in self._summary_cache if key[1] is None or key[1] == item_number]:
+            self._summary_cache.pop(key, None)
+    
+    @contextmanager
+    def transaction(self, conn: Optional[duckdb.DuckDBPyConnection] = None) -> Iterator[duckdb.DuckDBPyConnection]:
+        """
+        Group several writes into one transaction and one commit.
         
-        # Products table
-        self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS products (
-                item_number VARCHAR PRIMARY KEY,
-                title VARCHAR,
-                brand VARCHAR,
-                price VARCHAR,
-                rating VARCHAR,
-                reviews_count VARCHAR,
-                description TEXT,
-                product_url VARCHAR,
-                scraped_at TIMESTAMP
-            )
-        """)
+        The insert methods called inside join this transaction instead of committing
+        on their own. Nested uses join the outer transaction, and any error rolls
+        back everything written since it began.
         
-        # Reviews table (denormalized for easier querying)
-        self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS reviews (
-                review_id VARCHAR PRIMARY KEY,
-                product_item_number VARCHAR,
-                page_number INTEGER,
-                review_index INTEGER,
-                title VARCHAR,
-                rating VARCHAR,
-                author VARCHAR,
-                date VARCHAR,
-                is_verified BOOLEAN,
-                ownership VARCHAR,
-                pros TEXT,
-                cons TEXT,
-                overall_review TEXT,
-                full_content TEXT,
-                timestamp TIMESTAMP,
-                scraped_at TIMESTAMP
-            )
-        """)
+        Args:
+            conn: Connection or cursor to use. Defaults to the shared connection.
+        
+        Returns:
+            Context manager yielding the connection in the transaction
+        """
+        if conn is None:
+            conn = self.conn
+        
+        if id(conn) in _ACTIVE_TRANSACTIONS:
+            yield conn
+            return
+        
+        conn.execute("BEGIN TRANSACTION")
+        _ACTIVE_TRANSACTIONS.add(id(conn))
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            # Results cached inside the transaction may show rows that are now gone
+            self._summary_cache.clear()
+            raise
+        else:
+            conn.execute("COMMIT")
+        finally:
+            _ACTIVE_TRANSACTIONS.discard(id(conn))
+    
+    def thread_handle(self) -> duckdb.DuckDBPyConnection:
+        """
+        Get a cursor for use from a single worker thread.
+        
+        A DuckDB connection must not be shared between threads, but cursors on it can
+        run queries and inserts independently. Pass the cursor to insert_scraped_data
+        and close it when the worker is done.
+        
+        Returns:
+            New cursor on this database
+        """
+        return self.conn.cursor()
+    
+    def _load_fts(self) -> bool:
+        """Load DuckDB's full-text search extension, installing it if needed."""
+        try:
+            self.conn.execute("LOAD fts")
+            return True
+        except duckdb.Error:
+            if NeweggDuckDB._fts_install_failed:
+                return False
         
-        # Metadata table
+        try:
+            self.conn.execute("INSTALL fts")
+            self.conn.execute("LOAD fts")
+            return True
+        except duckdb.Error as e:
+            NeweggDuckDB._fts_install_failed = True
+            logger.warning("⚠️ Full-text search unavailable, falling back to LIKE search: %s", e)
+            return False
+    
+    def _rebuild_fts_index(self):
+        """(Re)build the BM25 index over the review text columns."""
         self.conn.execute("""
-            CREATE TABLE IF NOT EXISTS scraping_metadata (
-                product_url VARCHAR PRIMARY KEY,
-                scraped_at TIMESTAMP,
-                total_review_pages INTEGER,
-                total_reviews INTEGER,
-                scraper_version VARCHAR
+            PRAGMA create_fts_index(
+                'reviews', 'review_id',
+                'title', 'pros', 'cons', 'overall_review', 'full_content',
+                stemmer = 'porter', overwrite = 1
             )
         """)
+    
+    def _ensure_fts_index(self):
+        """
+        Build the BM25 index if it is missing or older than the reviews table.
+        
+        The index is a snapshot, so rather than rebuilding the whole thing on every
+        insert (and from every worker's cursor at once), writes leave it stale and
+        the next search rebuilds it once. Every write bumps the review count or the
+        latest scraped_at, which is how a stale index is told apart.
+        """
+        state = self.conn.execute("SELECT COUNT(*), MAX(scraped_at) FROM reviews").fetchone()
+        if self._has_fts_index():
+            built = self.conn.execute("SELECT reviews_count, last_scraped_at FROM fts_index_state").fetchone()
+            if built == state:
+                return
+        
+        self._rebuild_fts_index()
+        with self.transaction():
+            self.conn.execute("DELETE FROM fts_index_state")
+            self.conn.execute("INSERT INTO fts_index_state VALUES (?, ?)", list(state))
+    
+    def _has_fts_index(self) -> bool:
+        """Check whether the reviews FTS index has been built in this database."""
+        return self.conn.execute("""
+            SELECT COUNT(*) FROM duckdb_schemas() WHERE schema_name = 'fts_main_reviews'
+        """).fetchone()[0] > 0
+    
+    def _upsert_product(self, conn: duckdb.DuckDBPyConnection, product: Dict, scraped_at: datetime):
+        """Upsert a product row and drop its reviews stored under the old page-local ids."""
+        item_number = product["item_number"]
+        conn.execute(_INSERT_PRODUCT_SQL, [
+            item_number,
+            product["title"],
+            product["brand"],
+            product["price"],
+            product["rating"],
+            product["reviews_count"],
+            product["description"],
+            product["product_url"],
+            scraped_at,
+            _parse_number(product["price"]),
+            _parse_count(product["reviews_count"]),
+            _parse_number(product["rating"])
+        ])
+        conn.execute(_DELETE_LEGACY_REVIEWS_SQL, [item_number, item_number])
+    
+    def _upsert_reviews(self, conn: duckdb.DuckDBPyConnection, item_number: str,
+                        scraped_at: datetime, reviews: List[Dict]) -> int:
+        """
+        Upsert a batch of reviews through a registered DataFrame.
         
-        print("✅ DuckDB tables created successfully")
+        The frame is built column by column straight from the review dicts, so no
+        intermediate row tuples are materialized.
+        
+        Returns:
+            Number of reviews written
+        """
+        if not reviews:
+            return 0
+        
+        columns = {
+            "review_id": [_review_key(item_number, review["review_id"]) for review in reviews],
+            "product_item_number": item_number,
+            **{
+                name: [review[name] for review in reviews]
+                for name in REVIEW_COLUMNS[2:15]
+            },
+            "scraped_at": scraped_at,
+        }
+        columns["rating_int"] = [_parse_rating_int(rating) for rating in columns["rating"]]
+        reviews_df = pd.DataFrame(columns, columns=REVIEW_COLUMNS).astype(_REVIEW_DTYPES)
+        
+        conn.register("reviews_batch", reviews_df)
+        try:
+            conn.execute(_UPSERT_REVIEWS_SQL)
+        finally:
+            conn.unregister("reviews_batch")
+        return len(reviews)
     
-    def insert_scraped_data(self, scraped_data: Dict):
+    def insert_scraped_data(self, scraped_data: Dict, conn: Optional[duckdb.DuckDBPyConnection] = None):
         """
         Insert scraped data into DuckDB tables.
         
         Args:
-            scraped_data: Data from scrape_newegg_product function
+            scraped_data: Data from scrape_newegg_product function. Its reviews list may be
+                empty when the pages were already written with append_reviews_batch.
+            conn: Cursor to write through, from thread_handle() when called from a
+                worker thread. Defaults to the shared connection.
         """
+        if conn is None:
+            conn = self.conn
+        
+        product = scraped_data["product"]
+        metadata = scraped_data["metadata"]
+        item_number = product["item_number"]
+        scraped_at = datetime.fromisoformat(metadata["scraped_at"])
+        
         try:
-            # Insert product data
-            product = scraped_data["product"]
-            self.conn.execute("""
-                INSERT OR REPLACE INTO products 
-                (item_number, title, brand, price, rating, reviews_count, description, product_url, scraped_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
-                product["item_number"],
-                product["title"],
-                product["brand"],
-                product["price"],
-                product["rating"],
-                product["reviews_count"],
-                product["description"],
-                product["product_url"],
-                datetime.fromisoformat(scraped_data["metadata"]["scraped_at"])
-            ])
+            with self.transaction(conn):
+                # Insert product data
+                self._upsert_product(conn, product, scraped_at)
+                
+                # Insert all review pages in a single batch
+                self._upsert_reviews(conn, item_number, scraped_at, [
+                    review for page_reviews in scraped_data["reviews"] for review in page_reviews
+                ])
+                
+                # Insert metadata
+                conn.execute(_INSERT_METADATA_SQL, [
+                    metadata["product_url"],
+                    scraped_at,
+                    metadata["total_review_pages"],
+                    metadata["total_reviews"],
+                    metadata["scraper_version"]
+                ])
             
-            # Insert reviews data
-            reviews = scraped_data["reviews"]
-            for page_reviews in reviews:
-                for review in page_reviews:
-                    # product_url, product_title, product_brand, product_price,
-                    # product_rating, product_reviews_count, product_item_number,
-                    self.conn.execute("""
-                        INSERT OR REPLACE INTO reviews 
-                        (review_id, product_item_number, page_number, review_index, title, rating, author, date, 
-                         is_verified, ownership, pros, cons, overall_review, full_content, timestamp, scraped_at) 
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, [
-                        review["review_id"],
-                        product["item_number"],
-                        review["page_number"],
-                        review["review_index"],
-                        review["title"],
-                        review["rating"],
-                        review["author"],
-                        review["date"],
-                        review["is_verified"],
-                        review["ownership"],
-                        review["pros"],
-                        review["cons"],
-                        review["overall_review"],
-                        review["full_content"],
-                        datetime.fromisoformat(review["timestamp"]),
-                        datetime.fromisoformat(scraped_data["metadata"]["scraped_at"])
-                    ])
-            # Insert metadata
-            metadata = scraped_data["metadata"]
-            self.conn.execute("""
-                INSERT OR REPLACE INTO scraping_metadata 
-                (product_url, scraped_at, total_review_pages, total_reviews, scraper_version)
-                VALUES (?, ?, ?, ?, ?)
-            """, [
-                metadata["product_url"],
-                datetime.fromisoformat(metadata["scraped_at"]),
-                metadata["total_review_pages"],
-                metadata["total_reviews"],
-                metadata["scraper_version"]
-            ])
+            self._invalidate_cache(item_number)
             
-            print(f"✅ Successfully inserted data for {product['title']}")
-            print(f"   - {metadata['total_reviews']} reviews")
-            print(f"   - {metadata['total_review_pages']} pages")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✅ Inserted %s (%d reviews, %d pages)", product['title'],
+                            metadata['total_reviews'], metadata['total_review_pages'])
             
         except Exception as e:
-            print(f"❌ Error inserting data: {e}")
+            logger.error("❌ Error inserting data: %s", e)
+            raise
+    
+    def append_reviews_batch(self, product: Dict, scraped_at: str, page_reviews: List[Dict],
+                             conn: Optional[duckdb.DuckDBPyConnection] = None):
+        """
+        Write one page of reviews as soon as it is scraped.
+        
+        Matches the scrapers' review_sink signature, so reviews go straight to the
+        database instead of accumulating in memory. Call insert_scraped_data with the
+        final result afterwards to record the scrape metadata.
+        
+        Args:
+            product: Product info from the scraper (upserted so the reviews have a parent row)
+            scraped_at: ISO timestamp the scrape started
+            page_reviews: Reviews from one review page
+            conn: Cursor to write through. Defaults to the shared connection.
+        """
+        if conn is None:
+            conn = self.conn
+        
+        item_number = product["item_number"]
+        scraped_at = datetime.fromisoformat(scraped_at)
+        
+        try:
+            with self.transaction(conn):
+                self._upsert_product(conn, product, scraped_at)
+                count = self._upsert_reviews(conn, item_number, scraped_at, page_reviews)
+            self._invalidate_cache(item_number)
+            logger.debug("✅ Appended %d reviews for %s", count, item_number)
+        except Exception as e:
+            logger.error("❌ Error appending reviews: %s", e)
+            raise
+    
+    def insert_from_json(self, json_path: str, conn: Optional[duckdb.DuckDBPyConnection] = None):
+        """
+        Bulk load a scraper JSON output file with DuckDB's JSON reader.
+        
+        The file may hold a single scrape result or an array of them. Rows are read,
+        unnested and upserted in SQL, with the same keys and parsed columns as
+        insert_scraped_data, which remains the path for live scrapes.
+        
+        Args:
+            json_path: Path to a JSON file written by the scrapers
+            conn: Cursor to write through, from thread_handle(). Defaults to the shared connection.
+        """
+        if conn is None:
+            conn = self.conn
+        
+        try:
+            with self.transaction(conn):
+                conn.execute(_JSON_PRODUCTS_SQL, [json_path])
+                conn.execute(_JSON_DELETE_LEGACY_REVIEWS_SQL, [json_path])
+                conn.execute(_JSON_REVIEWS_SQL, [json_path])
+                conn.execute(_JSON_METADATA_SQL, [json_path])
+        except Exception as e:
+            logger.error("❌ Error loading %s: %s", json_path, e)
             raise
+        
+        # Any product in the file may have changed
+        self._summary_cache.clear()
+        
+        logger.info("✅ Loaded %s", json_path)
     
     def get_product_summary(self, item_number: str = None) -> pd.DataFrame:
         """
@@ -175,25 +701,13 @@ class NeweggDuckDB:
         Returns:
             DataFrame with product summary
         """
+        key = ("product_summary", item_number)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
         if item_number:
-            query = """
-                SELECT 
-                    p.item_number,
-                    p.title,
-                    p.brand,
-                    p.price,
-                    p.rating,
-                    p.reviews_count,
-                    COUNT(r.review_id) as actual_reviews,
-                    AVG(CAST(SUBSTR(r.rating, 1, 1) AS INTEGER)) as avg_rating,
-                    COUNT(CASE WHEN r.is_verified = true THEN 1 END) as verified_reviews,
-                    p.scraped_at
-                FROM products p
-                LEFT JOIN reviews r ON p.item_number = r.product_item_number
-                WHERE p.item_number = ?
-                GROUP BY p.item_number, p.title, p.brand, p.price, p.rating, p.reviews_count, p.scraped_at
-            """
-            return self.conn.execute(query, [item_number]).df()
+            return self._cache_put(key, self.conn.execute(_PRODUCT_SUMMARY_SQL, [item_number]).df())
         else:
             query = """
                 SELECT 
@@ -204,27 +718,33 @@ class NeweggDuckDB:
                     p.rating,
                     p.reviews_count,
                     COUNT(r.review_id) as actual_reviews,
-                    AVG(CAST(SUBSTR(r.rating, 1, 1) AS INTEGER)) as avg_rating,
+                    AVG(r.rating_int) as avg_rating,
                     COUNT(CASE WHEN r.is_verified = true THEN 1 END) as verified_reviews,
                     p.scraped_at
                 FROM products p
                 LEFT JOIN reviews r ON p.item_number = r.product_item_number
                 GROUP BY p.item_number, p.title, p.brand, p.price, p.rating, p.reviews_count, p.scraped_at
             """
-            return self.conn.execute(query).df()
+            return self._cache_put(key, self.conn.execute(query).df())
     
-    def get_reviews_by_rating(self, item_number: str, min_rating: int = 4) -> pd.DataFrame:
+    def get_reviews_by_rating(self, item_number: str, min_rating: int = 4, full: bool = False) -> pd.DataFrame:
         """
         Get reviews filtered by minimum rating.
         
         Args:
             item_number: Product item number
             min_rating: Minimum rating (1-5)
+            full: Return full_content instead of a 200 character content_preview
         
         Returns:
             DataFrame with filtered reviews
         """
-        query = """
+        key = ("reviews_by_rating", item_number, min_rating, full)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        query = f"""
             SELECT 
                 review_id,
                 title,
@@ -235,13 +755,13 @@ class NeweggDuckDB:
                 pros,
                 cons,
                 overall_review,
-                SUBSTR(full_content, 1, 200) as content_preview
+                {_content_column(full, 200)}
             FROM reviews
             WHERE product_item_number = ? 
-            AND CAST(SUBSTR(rating, 1, 1) AS INTEGER) >= ?
-            ORDER BY CAST(SUBSTR(rating, 1, 1) AS INTEGER) DESC, date DESC
+            AND rating_int >= ?
+            ORDER BY rating_int DESC, date DESC
         """
-        return self.conn.execute(query, [item_number, min_rating]).df()
+        return self._cache_put(key, self.conn.execute(query, [item_number, min_rating]).df())
     
     def get_rating_distribution(self, item_number: str) -> pd.DataFrame:
         """
@@ -253,30 +773,54 @@ class NeweggDuckDB:
         Returns:
             DataFrame with rating distribution
         """
-        query = """
-            SELECT 
-                rating,
-                COUNT(*) as count,
-                ROUND(COUNT(*) * 100.0 / SUM(COUNT(*)) OVER (), 2) as percentage
-            FROM reviews
-            WHERE product_item_number = ?
-            GROUP BY rating
-            ORDER BY CAST(SUBSTR(rating, 1, 1) AS INTEGER) DESC
-        """
-        return self.conn.execute(query, [item_number]).df()
+        key = ("rating_distribution", item_number)
+        cached = self._cache_get(key)
+        if cached is not None:
+            return cached
+        
+        return self._cache_put(key, self.conn.execute(_RATING_DISTRIBUTION_SQL, [item_number]).df())
     
-    def search_reviews(self, item_number: str, search_term: str) -> pd.DataFrame:
+    def search_reviews(self, item_number: str, search_term: str, full: bool = False) -> pd.DataFrame:
         """
         Search reviews for specific terms.
         
+        Uses the BM25 full-text index when the fts extension is available, ranking
+        matches by relevance. Otherwise falls back to a substring scan ordered by date.
+        
         Args:
             item_number: Product item number
             search_term: Term to search for
+            full: Return full_content instead of a 300 character content_preview
         
         Returns:
             DataFrame with matching reviews
         """
-        query = """
+        if self.fts_enabled:
+            self._ensure_fts_index()
+            
+            query = f"""
+                SELECT 
+                    review_id,
+                    title,
+                    rating,
+                    author,
+                    date,
+                    is_verified,
+                    pros,
+                    cons,
+                    overall_review,
+                    {_content_column(full, 300)}
+                FROM (
+                    SELECT *, fts_main_reviews.match_bm25(review_id, ?) AS score
+                    FROM reviews
+                    WHERE product_item_number = ?
+                ) matches
+                WHERE score IS NOT NULL
+                ORDER BY score DESC
+            """
+            return self.conn.execute(query, [search_term, item_number]).df()
+        
+        query = f"""
             SELECT 
                 review_id,
                 title,
@@ -287,34 +831,52 @@ class NeweggDuckDB:
                 pros,
                 cons,
                 overall_review,
-                SUBSTR(full_content, 1, 300) as content_preview
-            FROM reviews
+                {_content_column(full, 300)}
+            FROM reviews, (SELECT ? AS pat) q
             WHERE product_item_number = ?
             AND (
-                LOWER(title) LIKE LOWER(?) OR
-                LOWER(pros) LIKE LOWER(?) OR
-                LOWER(cons) LIKE LOWER(?) OR
-                LOWER(overall_review) LIKE LOWER(?) OR
-                LOWER(full_content) LIKE LOWER(?)
+                title ILIKE q.pat OR
+                pros ILIKE q.pat OR
+                cons ILIKE q.pat OR
+                overall_review ILIKE q.pat OR
+                full_content ILIKE q.pat
             )
             ORDER BY date DESC
         """
         search_pattern = f"%{search_term}%"
-        return self.conn.execute(query, [item_number, search_pattern, search_pattern, 
-                                       search_pattern, search_pattern, search_pattern]).df()
+        return self.conn.execute(query, [search_pattern, item_number]).df()
+    
+    def get_reviews(self, item_number: str, limit: int = 20) -> duckdb.DuckDBPyConnection:
+        """
+        Get a preview listing of a product's reviews.
+        
+        Returned as an executed cursor rather than a DataFrame, so callers that only
+        print the rows can read them with fetchall() without going through pandas.
+        The cursor is its own, so later queries on the shared connection don't
+        replace the result.
+        
+        Args:
+            item_number: Product item number
+            limit: Number of reviews to return
+        
+        Returns:
+            Cursor holding the result, with column names in its description. Close it when done.
+        """
+        return self.conn.cursor().execute(_REVIEWS_PREVIEW_SQL, [item_number, limit])
     
-    def get_recent_reviews(self, item_number: str, limit: int = 10) -> pd.DataFrame:
+    def get_recent_reviews(self, item_number: str, limit: int = 10, full: bool = False) -> pd.DataFrame:
         """
         Get most recent reviews for a product.
         
         Args:
             item_number: Product item number
             limit: Number of reviews to return
+            full: Return full_content instead of a 200 character content_preview
         
         Returns:
             DataFrame with recent reviews
         """
-        query = """
+        query = f"""
             SELECT 
                 review_id,
                 title,
@@ -322,7 +884,7 @@ class NeweggDuckDB:
                 author,
                 date,
                 is_verified,
-                SUBSTR(full_content, 1, 200) as content_preview
+                {_content_column(full, 200)}
             FROM reviews
             WHERE product_item_number = ?
             ORDER BY date DESC
@@ -340,38 +902,38 @@ class NeweggDuckDB:
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Export product summary
-        summary_df = self.get_product_summary(item_number)
-        if not summary_df.empty:
-            summary_df.to_csv(f"{output_dir}/product_summary_{item_number}_{timestamp}.csv", index=False)
-        
-        # Export all reviews
-        reviews_query = """
-            SELECT * FROM reviews WHERE product_item_number = ?
-        """
-        reviews_df = self.conn.execute(reviews_query, [item_number]).df()
-        if not reviews_df.empty:
-            reviews_df.to_csv(f"{output_dir}/reviews_{item_number}_{timestamp}.csv", index=False)
+        # Each file is streamed straight to disk by DuckDB's CSV writer
+        exports = (
+            ("product_summary", _PRODUCT_SUMMARY_SQL),
+            ("reviews", _PRODUCT_REVIEWS_SQL),
+            ("rating_distribution", _RATING_DISTRIBUTION_SQL),
+        )
+        for name, query in exports:
+            path = f"{output_dir}/{name}_{item_number}_{timestamp}.csv"
+            written = self.conn.execute(
+                f"COPY ({query}) TO {_sql_literal(path)} (HEADER, FORMAT CSV)", [item_number]
+            ).fetchone()[0]
+            # Leave no header-only file behind when there is no data
+            if not written:
+                os.remove(path)
         
-        # Export rating distribution
-        rating_df = self.get_rating_distribution(item_number)
-        if not rating_df.empty:
-            rating_df.to_csv(f"{output_dir}/rating_distribution_{item_number}_{timestamp}.csv", index=False)
-        
-        print(f"✅ Exported data to {output_dir}/")
+        logger.info("✅ Exported data to %s/", output_dir)
     
     def close(self):
-        """Close the DuckDB connection."""
-        self.conn.close()
+        """
+        Release the DuckDB connection.
+        
+        File-backed connections stay open in the pool for reuse and are closed at exit.
+        """
+        if self.db_path == ':memory:':
+            self.conn.close()
 
 def example_usage():
     """Example of how to use the DuckDB integration."""
     
-    # Load scraped data (assuming you have a JSON file)
-    try:
-        with open("scraped_data.json", "r") as f:
-            scraped_data = json.load(f)
-    except FileNotFoundError:
+    # Scraped data written by the scraper
+    json_path = "scraped_data.json"
+    if not os.path.exists(json_path):
         print("❌ No scraped_data.json found. Please run the scraper first.")
         return
     
@@ -379,11 +941,13 @@ def example_usage():
     db = NeweggDuckDB("newegg_data.duckdb")
     
     try:
-        # Insert the scraped data
-        db.insert_scraped_data(scraped_data)
+        # Load the scraped data straight from the JSON file
+        db.insert_from_json(json_path)
         
         # Get product summary
-        item_number = scraped_data["product"]["item_number"]
+        item_number = db.conn.execute(
+            "SELECT product.item_number FROM read_json_auto(?)", [json_path]
+        ).fetchone()[0]
         print("\n📊 PRODUCT SUMMARY")
         print("=" * 50)
         summary = db.get_product_summary(item_number)
@@ -417,4 +981,5 @@ def example_usage():
         db.close()
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     example_usage() 
\ No newline at end of file
@@ -1,16 +1,98 @@
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from playwright.sync_api import Browser
 import time
 import random
 import re
 import asyncio
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-import json
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
+import orjson
 from config import Config
 from user_agents import UserAgentRotator, BrowserProfile
 from rate_limiter import TokenBucketRateLimiter, RateLimitConfig, AdaptiveDelay
-import threading
+from browser_pool import get_browser, shutdown_browser
+from product_parser import parse_product_html, parse_review_sections
+from result_cache import get_result_cache
+from review_api import REVIEW_API_PATTERN, CapturedReviewRequest, fetch_reviews
+from concurrent.futures import ThreadPoolExecutor
+import queue
+from bisect import bisect_right
+
+# Star count from a review's rating class (e.g. "rating rating-4") and its posted date
+_RATING_RE = re.compile(r'rating-(\d+)')
+_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+
+def _first_matches(pattern: re.Pattern, texts: List[Optional[str]]) -> List[Optional[str]]:
+    """
+    First group-1 match of a pattern in each text, scanning all texts at once.
+    
+    The texts are joined with newlines (which the patterns never match across) and
+    each match is mapped back to its text by offset.
+    """
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text or "") + 1
+    
+    found: List[Optional[str]] = [None] * len(texts)
+    for match in pattern.finditer("\n".join(text or "" for text in texts)):
+        owner = bisect_right(starts, match.start()) - 1
+        if found[owner] is None:
+            found[owner] = match.group(1)
+    return found
+
+# Review elements on a review page, and the fallback selectors for each field inside one
+REVIEW_CELL_SELECTOR = 'div.comments-cell.has-side-left.is-active'
+_REVIEW_FIELD_SELECTORS = {
+    "cell": REVIEW_CELL_SELECTOR,
+    "title": '.comments-title-content, .review-title, .comment-title, h3, h4, .title',
+    "rating": '.rating',
+    "content": '.comments-content, .review-content, .comment-content, .review-text, .content, p',
+    "author": '.comments-name, .review-author, .comment-author, .author, .user-name, .username',
+    "details": '.comments-text',
+    "verified": '.comments-verified-owner',
+}
+
+# Reviews tab candidates, tried in order
+REVIEWS_TAB_SELECTORS = (
+    'a.tab-nav[data-nav-title="Reviews"]',
+    'a[href*="reviews"]',
+    'a[data-nav-title*="Review"]',
+    '.tab-nav[data-nav-title*="Review"]',
+)
+
+# Review pagination controls
+NEXT_PAGE_SELECTOR = '.paginations-next:not(.is-disabled)'
+PAGE_BUTTON_SELECTOR = '.paginations li a.button'
+ACTIVE_PAGE_SELECTOR = PAGE_BUTTON_SELECTOR + '.is-active'
+
+# Highest page number in the review pagination, or 0 when there is none
+_TOTAL_REVIEW_PAGES_JS = """
+(sel) => Math.max(0, ...Array.from(
+    document.querySelectorAll(sel),
+    (a) => parseInt(a.innerText.trim(), 10)
+).filter((n) => !isNaN(n)))
+"""
+
+# Reads every review's fields in the page. A selector list matches its first
+# element in document order, like locator(...).first did.
+_EXTRACT_REVIEWS_JS = """
+(sel) => Array.from(document.querySelectorAll(sel.cell), (el) => {
+    const text = (selector) => {
+        const node = el.querySelector(selector);
+        return node ? node.innerText.trim() : null;
+    };
+    const rating = el.querySelector(sel.rating);
+    return {
+        title: text(sel.title),
+        rating_class: rating ? (rating.getAttribute('class') || '') : null,
+        content: text(sel.content),
+        author: text(sel.author),
+        details: text(sel.details),
+        verified: el.querySelector(sel.verified) !== null
+    };
+})
+"""
 
 class EnhancedNeweggScraper:
     """
@@ -19,7 +101,9 @@ class EnhancedNeweggScraper:
     
     def __init__(self, headless: bool = False, 
                  user_agent_strategy: str = "random",
-                 rate_limit_config: Optional[RateLimitConfig] = None):
+                 rate_limit_config: Optional[RateLimitConfig] = None,
+                 browser: Optional[Browser] = None,
+                 rate_limiter: Optional[TokenBucketRateLimiter] = None):
         """
         Initialize enhanced scraper.
         
@@ -27,68 +111,40 @@ class EnhancedNeweggScraper:
             headless: Whether to run browser in headless mode
             user_agent_strategy: "random", "sequential", or "weighted"
             rate_limit_config: Rate limiting configuration
+            browser: Browser to open contexts on. Defaults to this thread's shared browser.
+            rate_limiter: Limiter shared with other scrapers. Defaults to a private one
+                built from rate_limit_config.
         """
         self.headless = headless
         self.user_agent_rotator = UserAgentRotator(user_agent_strategy)
-        self.rate_limiter = TokenBucketRateLimiter(rate_limit_config or RateLimitConfig())
+        self.rate_limiter = rate_limiter or TokenBucketRateLimiter(rate_limit_config or RateLimitConfig())
         self.adaptive_delay = AdaptiveDelay()
         
-        self.browser = None
+        self.browser = browser
         self.context = None
         self.page = None
         self.current_profile = None
-        
-        # Thread safety
-        self.lock = threading.Lock()
+        self._api_headers: Dict[str, str] = {}
+        self._review_request: Optional[CapturedReviewRequest] = None
     
     def __enter__(self):
-        """Context manager entry for browser setup."""
-        self._setup_browser()
+        """Context manager entry. The browser is attached lazily on the first scrape."""
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit for browser cleanup."""
         self._cleanup()
     
-    def _setup_browser(self):
-        """Initialize browser with anti-detection measures and user agent rotation."""
-        playwright = sync_playwright().start()
-        
+    def _ensure_browser(self):
+        """Attach to the shared browser unless one was passed in, launching it if needed."""
+        if self.browser is None:
+            self.browser = get_browser(self.headless)
+    
+    def _new_context(self):
+        """Open a fresh browser context and page with a rotated user agent profile."""
         # Get a new browser profile
         self.current_profile = self.user_agent_rotator.get_next_profile()
         
-        self.browser = playwright.chromium.launch(
-            headless=self.headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
-                '--disable-extensions',
-                '--disable-plugins',
-                '--disable-images',
-                '--disable-javascript',
-                '--disable-background-timer-throttling',
-                '--disable-backgrounding-occluded-windows',
-                '--disable-renderer-backgrounding',
-                '--disable-features=TranslateUI',
-                '--disable-ipc-flooding-protection',
-                '--disable-gpu',
-                '--disable-software-rasterizer',
-                '--disable-background-networking',
-                '--disable-default-apps',
-                '--disable-sync',
-                '--metrics-recording-only',
-                '--no-first-run',
-                '--safebrowsing-disable-auto-update',
-                '--disable-client-side-phishing-detection',
-                '--disable-component-update',
-                '--disable-domain-reliability'
-            ]
-        )
-        
         # Create context with rotated user agent and headers
         headers = self.user_agent_rotator.get_headers(self.current_profile)
         viewport = self.user_agent_rotator.get_viewport(self.current_profile)
@@ -100,46 +156,61 @@ class EnhancedNeweggScraper:
         )
         
         self.page = self.context.new_page()
+        self._api_headers = self._build_api_headers()
+        self._review_request = None
         self._setup_request_interception()
         
         print(f"🔄 Using browser profile: {self.current_profile.user_agent[:50]}...")
     
+    def _close_context(self):
+        """Close the current browser context, leaving the shared browser running."""
+        if self.context:
+            self.context.close()
+        self.context = None
+        self.page = None
+    
     def _cleanup(self):
         """Clean up browser resources."""
-        if self.browser:
-            self.browser.close()
+        self._close_context()
+    
+    def _build_api_headers(self) -> Dict[str, str]:
+        """Build the static review API header overlay for the current profile."""
+        return {
+            'Origin': 'https://www.newegg.com',
+            'X-Requested-With': 'XMLHttpRequest',
+            'Accept': 'application/json, text/plain, */*',
+            'Content-Type': 'application/json',
+            'User-Agent': self.current_profile.user_agent,
+            'Sec-Fetch-Dest': 'empty',
+            'Sec-Fetch-Mode': 'cors',
+            'Sec-Fetch-Site': 'same-origin',
+            'Accept-Language': self.current_profile.accept_language,
+            'Accept-Encoding': self.current_profile.accept_encoding,
+            'Connection': 'keep-alive',
+            'Cache-Control': 'no-cache',
+            'Pragma': 'no-cache',
+            'Sec-Ch-Ua': self.current_profile.sec_ch_ua,
+            'Sec-Ch-Ua-Mobile': self.current_profile.sec_ch_ua_mobile,
+            'Sec-Ch-Ua-Platform': self.current_profile.sec_ch_ua_platform
+        }
     
     def _setup_request_interception(self):
-        """Set up request interception with rotated headers."""
+        """Set up request interception with rotated headers for review API requests."""
         def handle_request(route):
             request = route.request
-            if 'api/ProductReview' in request.url:
-                # Use current profile headers for API requests
-                headers = {
-                    **request.headers,
-                    'Referer': self.page.url,
-                    'Origin': 'https://www.newegg.com',
-                    'X-Requested-With': 'XMLHttpRequest',
-                    'Accept': 'application/json, text/plain, */*',
-                    'Content-Type': 'application/json',
-                    'User-Agent': self.current_profile.user_agent,
-                    'Sec-Fetch-Dest': 'empty',
-                    'Sec-Fetch-Mode': 'cors',
-                    'Sec-Fetch-Site': 'same-origin',
-                    'Accept-Language': self.current_profile.accept_language,
-                    'Accept-Encoding': self.current_profile.accept_encoding,
-                    'Connection': 'keep-alive',
-                    'Cache-Control': 'no-cache',
-                    'Pragma': 'no-cache',
-                    'Sec-Ch-Ua': self.current_profile.sec_ch_ua,
-                    'Sec-Ch-Ua-Mobile': self.current_profile.sec_ch_ua_mobile,
-                    'Sec-Ch-Ua-Platform': self.current_profile.sec_ch_ua_platform
-                }
-                route.continue_(headers=headers)
-            else:
-                route.continue_()
+            # Use current profile headers for API requests; only Referer varies per request
+            headers = {
+                **request.headers,
+                **self._api_headers,
+                'Referer': self.page.url
+            }
+            # Keep the first one so later pages can be requested directly
+            if self._review_request is None:
+                self._review_request = CapturedReviewRequest.from_request(request, headers)
+            route.continue_(headers=headers)
         
-        self.page.route("**/*", handle_request)
+        # Only review API requests are routed; everything else never leaves the browser
+        self.page.route(REVIEW_API_PATTERN, handle_request)
     
     def _rate_limited_delay(self):
         """Apply rate limiting and adaptive delays."""
@@ -154,33 +225,60 @@ class EnhancedNeweggScraper:
         time.sleep(delay)
     
     def _rotate_user_agent(self):
-        """Rotate to a new user agent profile."""
-        with self.lock:
-            old_profile = self.current_profile
-            self.current_profile = self.user_agent_rotator.get_next_profile()
+        """
+        Rotate to a new user agent profile.
+        
+        No lock is needed: a scraper and its Playwright objects are only used by
+        the thread that created them, and scrape_many gives each worker its own.
+        """
+        old_profile = self.current_profile
+        self.current_profile = self.user_agent_rotator.get_next_profile()
+        
+        if old_profile != self.current_profile:
+            print(f"🔄 Rotating user agent to: {self.current_profile.user_agent[:50]}...")
             
-            if old_profile != self.current_profile:
-                print(f"🔄 Rotating user agent to: {self.current_profile.user_agent[:50]}...")
-                
-                # Update page headers
-                headers = self.user_agent_rotator.get_headers(self.current_profile)
-                self.page.set_extra_http_headers(headers)
+            # Update page headers
+            headers = self.user_agent_rotator.get_headers(self.current_profile)
+            self.page.set_extra_http_headers(headers)
+            self._api_headers = self._build_api_headers()
     
-    def scrape_product(self, url: str, max_review_pages: Optional[int] = None) -> Dict:
+    def scrape_product(self, url: str, max_review_pages: Optional[int] = None,
+                       review_sink: Optional[Callable[[Dict, str, List[Dict]], None]] = None) -> Dict:
         """
         Scrape complete product information including reviews with enhanced features.
         
         Args:
             url: Newegg product URL
             max_review_pages: Maximum number of review pages to scrape
+            review_sink: Called as review_sink(product_info, scraped_at, page_reviews) for each
+                review page, e.g. NeweggDuckDB.append_reviews_batch. The result's reviews list
+                is then empty. A cached result is replayed through the sink page by page; with
+                the cache enabled, pages are also kept until the finished result is cached.
         
         Returns:
             Dictionary with product info and reviews, ready for DuckDB insertion
         """
         print(f"🔍 Scraping product: {url}")
         
-        start_time = time.time()
+        # Serve recent results from the on-disk cache without touching the browser
+        cache = get_result_cache()
+        if cache is not None:
+            cached = cache.get(url, max_review_pages)
+            if cached is not None:
+                print(f"♻️  Using cached result from {cached['metadata']['scraped_at']}")
+                if review_sink is None:
+                    return cached
+                for page_reviews in cached["reviews"]:
+                    review_sink(cached["product"], cached["metadata"]["scraped_at"], page_reviews)
+                return {**cached, "reviews": []}
+        
+        # Each product gets its own context on the shared browser
+        self._ensure_browser()
+        self._new_context()
+        
+        start_time = time.monotonic()
         success = False
+        scraped_at = datetime.now().isoformat()
         
         try:
             # Apply rate limiting
@@ -196,16 +294,25 @@ class EnhancedNeweggScraper:
             # Extract product information
             product_info = self._extract_product_info()
             
-            # Extract reviews
-            reviews = self._scrape_reviews(max_pages=max_review_pages)
+            # Extract reviews, a page at a time. Pages sent to the sink are only kept
+            # when the finished result goes to the cache.
+            reviews = []
+            total_pages = total_reviews = 0
+            for page_reviews in self._iter_review_pages(max_pages=max_review_pages):
+                total_pages += 1
+                total_reviews += len(page_reviews)
+                if review_sink is None or cache is not None:
+                    reviews.append(page_reviews)
+                if review_sink is not None:
+                    review_sink(product_info, scraped_at, page_reviews)
             
             # Prepare result
             result = {
                 "metadata": {
                     "product_url": url,
-                    "scraped_at": datetime.now().isoformat(),
-                    "total_review_pages": len(reviews) if reviews else 0,
-                    "total_reviews": sum(len(page_reviews) for page_reviews in reviews) if reviews else 0,
+                    "scraped_at": scraped_at,
+                    "total_review_pages": total_pages,
+                    "total_reviews": total_reviews,
                     "scraper_version": "3.0",
                     "user_agent": self.current_profile.user_agent,
                     "browser_profile": f"{self.current_profile.sec_ch_ua_platform} - {self.current_profile.sec_ch_ua}"
@@ -215,18 +322,23 @@ class EnhancedNeweggScraper:
             }
             
             success = True
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             
             # Record success for adaptive rate limiting
             self.rate_limiter.record_request(True, response_time)
             self.adaptive_delay.calculate_delay(response_time, False)
             
+            if cache is not None:
+                cache.set(url, max_review_pages, result)
+            if review_sink is not None:
+                result["reviews"] = []
+            
             print(f"✅ Scraping complete: {result['metadata']['total_reviews']} reviews from {result['metadata']['total_review_pages']} pages")
             return result
             
         except Exception as e:
             success = False
-            response_time = time.time() - start_time
+            response_time = time.monotonic() - start_time
             
             # Record failure for adaptive rate limiting
             self.rate_limiter.record_request(False, response_time)
@@ -234,85 +346,27 @@ class EnhancedNeweggScraper:
             
             print(f"❌ Scraping failed: {str(e)}")
             raise e
+        
+        finally:
+            self._close_context()
     
     def _extract_product_info(self) -> Dict:
         """Extract product information from the current page."""
         print("📦 Extracting product information...")
         
-        html = self.page.content()
-        soup = BeautifulSoup(html, "lxml")
-        
-        product_info = {
-            "title": self._extract_text(soup, [
-                "h1.product-title",
-                ".product-title",
-                "h1",
-                "[data-testid='product-title']"
-            ], "Title not found"),
-            
-            "brand": self._extract_text(soup, [
-                "div.product-breadcrumb a",
-                ".breadcrumbs a[href*='AMD']",
-                ".seller-store-link a",
-                "a[href*='AMD/BrandStore']"
-            ], "Brand not found"),
-            
-            "price": self._extract_text(soup, [
-                "li.price-current strong",
-                ".price-current strong",
-                ".price-current",
-                "span.price-current-label + strong"
-            ], "Price not found"),
-            
-            "rating": self._extract_text(soup, [
-                "i.rating",
-                "span.rating",
-                ".product-rating i.rating"
-            ], "No rating"),
-            
-            "reviews_count": self._extract_text(soup, [
-                "span.item-rating-num",
-                ".product-rating span[title*='reviews']",
-                ".product-reviews span"
-            ], "0"),
-            
-            "description": self._extract_text(soup, [
-                "div.product-bullets ul",
-                ".product-bullets",
-                "ul.product-bullets"
-            ], "Description not found"),
-
-            "product_url": self.page.url,
-            "item_number": self._extract_item_number(self.page.url)
-        }
+        product_info = parse_product_html(self.page.content(), self.page.url)
         
         print(f"✅ Product info extracted: {product_info['title']}")
         return product_info
     
-    def _extract_text(self, soup: BeautifulSoup, selectors: List[str], default: str) -> str:
-        """Extract text using multiple selector fallbacks."""
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = element.get_text(strip=True)
-                if text and text != "$":
-                    return text
-        return default
-    
-    def _extract_item_number(self, url: str) -> str:
-        """Extract item number from URL."""
-        match = re.search(r'/p/([A-Z0-9]+)', url)
-        return match.group(1) if match else "Unknown"
-    
-    def _scrape_reviews(self, max_pages: Optional[int] = None) -> List[List[Dict]]:
-        """Scrape reviews from all available pages."""
+    def _iter_review_pages(self, max_pages: Optional[int] = None) -> Iterator[List[Dict]]:
+        """Scrape reviews from all available pages, yielding each page's reviews as it is read."""
         print("📝 Starting review extraction...")
         
         if not self._navigate_to_reviews():
             print("❌ Could not navigate to reviews section")
-            return []
+            return
         
-        all_reviews = []
         current_page = 1
         
         while True:
@@ -324,8 +378,8 @@ class EnhancedNeweggScraper:
             page_reviews = self._extract_page_reviews(current_page)
             
             if page_reviews:
-                all_reviews.append(page_reviews)
                 print(f"✅ Extracted {len(page_reviews)} reviews from page {current_page}")
+                yield page_reviews
             else:
                 print(f"⚠️ No reviews found on page {current_page}")
                 break
@@ -334,13 +388,56 @@ class EnhancedNeweggScraper:
                 print(f"🛑 Reached maximum page limit ({max_pages})")
                 break
             
+            # Once page 1 has shown the API request, fetch the rest directly
+            if current_page == 1 and self._review_request is not None:
+                api_pages = self._fetch_pages_via_api(max_pages)
+                if api_pages is not None:
+                    yield from api_pages
+                    break
+            
             if not self._navigate_to_next_page():
                 print("🏁 No more pages available")
                 break
             
             current_page += 1
+    
+    def _fetch_pages_via_api(self, max_pages: Optional[int]) -> Optional[List[List[Dict]]]:
+        """
+        Fetch review pages 2..N concurrently through the captured review API request.
+        
+        Returns:
+            Review pages in order, or None to fall back to clicking through the pagination
+        """
+        total_pages = self.page.evaluate(_TOTAL_REVIEW_PAGES_JS, PAGE_BUTTON_SELECTOR)
+        if not total_pages:
+            return None
+        
+        last_page = min(total_pages, max_pages) if max_pages is not None else total_pages
+        page_numbers = list(range(2, last_page + 1))
+        if not page_numbers:
+            return []
+        
+        cookies = "; ".join(f"{c['name']}={c['value']}" for c in self.context.cookies(self.page.url))
+        print(f"⚡ Fetching review pages 2-{last_page} through the review API...")
         
-        return all_reviews
+        try:
+            pages = fetch_reviews(
+                self._review_request, page_numbers,
+                cookies=cookies,
+                concurrency=Config.MAX_WORKERS,
+                before_request=lambda: self.rate_limiter.acquire(timeout=5.0)
+            )
+        except Exception as e:
+            print(f"⚠️ Review API fetch failed, clicking through pages instead: {e}")
+            return None
+        
+        if not all(pages.get(page_number) for page_number in page_numbers):
+            print("⚠️ Review API response not recognized, clicking through pages instead")
+            return None
+        
+        for page_number in page_numbers:
+            print(f"✅ Extracted {len(pages[page_number])} reviews from page {page_number}")
+        return [pages[page_number] for page_number in page_numbers]
     
     def _navigate_to_reviews(self) -> bool:
         """Navigate to the reviews section of the product page."""
@@ -348,19 +445,11 @@ class EnhancedNeweggScraper:
         
         self._scroll_down(800)
         
-        selectors = [
-            'a.tab-nav[data-nav-title="Reviews"]',
-            'a[href*="reviews"]',
-            'a[data-nav-title*="Review"]',
-            '.tab-nav[data-nav-title*="Review"]'
-        ]
-        
-        for selector in selectors:
+        for selector in REVIEWS_TAB_SELECTORS:
             try:
                 element = self.page.locator(selector).first
                 if element.count() > 0:
                     element.scroll_into_view_if_needed()
-                    self._rate_limited_delay()
                     
                     if element.is_visible():
                         element.click()
@@ -379,17 +468,25 @@ class EnhancedNeweggScraper:
     def _extract_page_reviews(self, page_number: int) -> List[Dict]:
         """Extract reviews from the current page."""
         try:
-            self.page.wait_for_selector('div.comments-cell.has-side-left.is-active', timeout=15000)
+            self.page.wait_for_selector(REVIEW_CELL_SELECTOR, timeout=15000)
         except Exception:
             print("⚠️ No review elements found on this page")
             return []
         
-        reviews = []
-        review_elements = self.page.locator('div.comments-cell.has-side-left.is-active').all()
+        # One round-trip for every field of every review on the page
+        raw_reviews = self.page.evaluate(_EXTRACT_REVIEWS_JS, _REVIEW_FIELD_SELECTORS)
+        
+        # Dates and star counts for the whole page in one regex scan each
+        dates = _first_matches(_DATE_RE, [raw["details"] for raw in raw_reviews])
+        stars = _first_matches(_RATING_RE, [raw["rating_class"] for raw in raw_reviews])
+        for raw, date, star in zip(raw_reviews, dates, stars):
+            raw["date"] = date
+            raw["stars"] = star
         
-        for i, element in enumerate(review_elements):
+        reviews = []
+        for i, raw in enumerate(raw_reviews):
             try:
-                review_data = self._extract_single_review(element, i + 1, page_number)
+                review_data = self._extract_single_review(raw, i + 1, page_number)
                 reviews.append(review_data)
             except Exception as e:
                 print(f"Error extracting review {i + 1}: {e}")
@@ -397,39 +494,28 @@ class EnhancedNeweggScraper:
         
         return reviews
     
-    def _extract_single_review(self, element, review_index: int, page_number: int) -> Dict:
-        """Extract data from a single review element."""
-        title_element = element.locator('.comments-title-content, .review-title, .comment-title, h3, h4, .title').first
-        title = title_element.inner_text().strip() if title_element.count() > 0 else f"Review {review_index}"
-        
-        rating_element = element.locator('.rating').first
-        rating = "N/A"
-        if rating_element.count() > 0:
-            rating_class = rating_element.get_attribute("class") or ""
-            rating_match = re.search(r'rating-(\d+)', rating_class)
-            rating = f"{rating_match.group(1)}/5" if rating_match else "N/A"
-        
-        content_element = element.locator('.comments-content, .review-content, .comment-content, .review-text, .content, p').first
-        content = content_element.inner_text().strip() if content_element.count() > 0 else "No content found"
+    def _extract_single_review(self, raw: Dict, review_index: int, page_number: int) -> Dict:
+        """
+        Build a review record from the fields read out of one review element.
         
-        author_element = element.locator('.comments-name, .review-author, .comment-author, .author, .user-name, .username').first
-        author = author_element.inner_text().strip() if author_element.count() > 0 else "Anonymous"
+        Args:
+            raw: Element fields from _EXTRACT_REVIEWS_JS (missing elements are None),
+                plus the "date" and "stars" matches found for the page
+            review_index: 1-based position of the review on its page
+            page_number: Review page number
+        """
+        title = raw["title"] if raw["title"] is not None else f"Review {review_index}"
         
-        date_element = element.locator('.comments-text').first
-        date = "N/A"
-        if date_element.count() > 0:
-            date_text = date_element.inner_text().strip()
-            date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', date_text)
-            date = date_match.group(1) if date_match else "N/A"
+        rating = f"{raw['stars']}/5" if raw["stars"] else "N/A"
         
-        verified_element = element.locator('.comments-verified-owner').first
-        is_verified = verified_element.count() > 0
+        content = raw["content"] if raw["content"] is not None else "No content found"
+        author = raw["author"] if raw["author"] is not None else "Anonymous"
         
+        date = raw["date"] or "N/A"
         ownership = "N/A"
-        if date_element.count() > 0:
-            ownership_text = date_element.inner_text().strip()
-            if "Ownership:" in ownership_text:
-                ownership = ownership_text.split("Ownership:")[1].strip()
+        details = raw["details"]
+        if details is not None and "Ownership:" in details:
+            ownership = details.split("Ownership:")[1].strip()
         
         pros, cons, overall_review = self._parse_review_sections(content)
         
@@ -441,7 +527,7 @@ class EnhancedNeweggScraper:
             "rating": rating,
             "author": author,
             "date": date,
-            "is_verified": is_verified,
+            "is_verified": raw["verified"],
             "ownership": ownership,
             "pros": pros,
             "cons": cons,
@@ -452,71 +538,34 @@ class EnhancedNeweggScraper:
     
     def _parse_review_sections(self, content: str) -> Tuple[str, str, str]:
         """Parse pros, cons, and overall review from review content."""
-        pros = ""
-        cons = ""
-        overall_review = ""
-        
-        if not content:
-            return "Not specified", "Not specified", "Not specified"
-        
-        lines = content.split('\n')
-        current_section = ""
-        
-        for line in lines:
-            trimmed_line = line.strip()
-            if trimmed_line.lower().startswith('pros:'):
-                current_section = 'pros'
-                pros = trimmed_line.replace('pros:', '').strip()
-            elif trimmed_line.lower().startswith('cons:'):
-                current_section = 'cons'
-                cons = trimmed_line.replace('cons:', '').strip()
-            elif trimmed_line.lower().startswith('overall review:') or trimmed_line.lower().startswith('overall:'):
-                current_section = 'overall'
-                overall_review = trimmed_line.replace('overall review:', '').replace('overall:', '').strip()
-            elif trimmed_line and current_section:
-                if current_section == 'pros':
-                    pros += (pros + ' ' if pros else '') + trimmed_line
-                elif current_section == 'cons':
-                    cons += (cons + ' ' if cons else '') + trimmed_line
-                elif current_section == 'overall':
-                    overall_review += (overall_review + ' ' if overall_review else '') + trimmed_line
-        
-        return (
-            pros or "Not specified",
-            cons or "Not specified", 
-            overall_review or "Not specified"
-        )
+        return parse_review_sections(content)
     
     def _navigate_to_next_page(self) -> bool:
         """Navigate to the next page of reviews."""
         print("🔍 Looking for next page...")
         
-        next_button = self.page.locator('.paginations-next:not(.is-disabled)').first
+        next_button = self.page.locator(NEXT_PAGE_SELECTOR).first
         if next_button.count() > 0:
             next_button.click()
             print("✅ Clicked next button")
             self._rate_limited_delay()
             return True
         
-        current_page_element = self.page.locator('.paginations li a.button.is-active').first
+        current_page_element = self.page.locator(ACTIVE_PAGE_SELECTOR).first
         if current_page_element.count() > 0:
             current_page_text = current_page_element.inner_text().strip()
             try:
                 current_page = int(current_page_text)
-                next_page = current_page + 1
+                next_page = str(current_page + 1)
                 
-                pagination_items = self.page.locator('.paginations li a.button').all()
-                for item in pagination_items:
-                    page_text = item.inner_text().strip()
-                    try:
-                        page_num = int(page_text)
-                        if page_num == next_page:
-                            item.click()
-                            print(f"✅ Clicked page {next_page}")
-                            self._rate_limited_delay()
-                            return True
-                    except ValueError:
-                        continue
+                # Read every button label in one round trip instead of one per button
+                pagination_items = self.page.locator(PAGE_BUTTON_SELECTOR)
+                page_texts = pagination_items.evaluate_all("(els) => els.map((a) => a.innerText.trim())")
+                if next_page in page_texts:
+                    pagination_items.nth(page_texts.index(next_page)).click()
+                    print(f"✅ Clicked page {next_page}")
+                    self._rate_limited_delay()
+                    return True
             except ValueError:
                 print(f"Could not parse current page number: {current_page_text}")
                 pass
@@ -525,9 +574,8 @@ class EnhancedNeweggScraper:
         return False
     
     def _scroll_down(self, pixels: int = 800):
-        """Scroll down the page."""
+        """Scroll down the page. Pacing is left to the rate limiter and adaptive delay."""
         self.page.mouse.wheel(0, pixels)
-        time.sleep(random.uniform(1, 2))
     
     def get_stats(self) -> Dict:
         """Get scraper statistics."""
@@ -537,12 +585,15 @@ class EnhancedNeweggScraper:
             'current_profile': self.current_profile.user_agent if self.current_profile else None
         }
 
-def create_enhanced_scraper(headless: bool = False, **kwargs) -> EnhancedNeweggScraper:
-    """Factory function to create enhanced scraper instances."""
-    return EnhancedNeweggScraper(headless=headless, **kwargs)
+def create_enhanced_scraper(headless: bool = False, browser: Optional[Browser] = None,
+                            **kwargs) -> EnhancedNeweggScraper:
+    """Factory function to create enhanced scraper instances sharing one browser."""
+    return EnhancedNeweggScraper(headless=headless, browser=browser, **kwargs)
 
 def scrape_newegg_product_enhanced(url: str, max_review_pages: Optional[int] = None, 
-                                  headless: bool = False, **kwargs) -> Dict:
+                                  headless: bool = False, browser: Optional[Browser] = None,
+                                  review_sink: Optional[Callable[[Dict, str, List[Dict]], None]] = None,
+                                  **kwargs) -> Dict:
     """
     Enhanced convenience function to scrape a Newegg product.
     
@@ -550,13 +601,71 @@ def scrape_newegg_product_enhanced(url: str, max_review_pages: Optional[int] = N
         url: Newegg product URL
         max_review_pages: Maximum number of review pages to scrape
         headless: Whether to run browser in headless mode
+        browser: Browser to scrape with. Defaults to this thread's shared browser.
+        review_sink: Per-page review callback, see EnhancedNeweggScraper.scrape_product
         **kwargs: Additional arguments for EnhancedNeweggScraper
     
     Returns:
         Dictionary with product info and reviews, ready for DuckDB insertion
     """
-    with EnhancedNeweggScraper(headless=headless, **kwargs) as scraper:
-        return scraper.scrape_product(url, max_review_pages)
+    with create_enhanced_scraper(headless=headless, browser=browser, **kwargs) as scraper:
+        return scraper.scrape_product(url, max_review_pages, review_sink=review_sink)
+
+def scrape_many(urls: List[str], pool_size: int = 4, max_review_pages: Optional[int] = None,
+                headless: bool = False, rate_limit_config: Optional[RateLimitConfig] = None,
+                result_sink: Optional[Callable[[Dict], None]] = None, **kwargs) -> List[Dict]:
+    """
+    Scrape several Newegg products concurrently.
+    
+    Each worker thread runs its own scraper on its own browser, since Playwright's
+    sync API cannot be shared across threads, and pulls URLs from a common queue.
+    All workers share one rate limiter, so it sets the overall request rate.
+    
+    Args:
+        urls: Newegg product URLs
+        pool_size: Number of worker threads (and browsers)
+        max_review_pages: Maximum number of review pages to scrape per product
+        headless: Whether to run browsers in headless mode
+        rate_limit_config: Rate limiting configuration for the shared limiter
+        result_sink: Called with each result in the worker thread that scraped it, e.g. to
+            insert it through a cursor of its own while other workers keep scraping
+        **kwargs: Additional arguments for EnhancedNeweggScraper
+    
+    Returns:
+        Results for the products that scraped successfully, in input order
+    """
+    url_queue: "queue.Queue[Tuple[int, str]]" = queue.Queue()
+    for index, url in enumerate(urls):
+        url_queue.put((index, url))
+    
+    rate_limiter = TokenBucketRateLimiter(rate_limit_config or RateLimitConfig())
+    results: List[Optional[Dict]] = [None] * len(urls)
+    
+    def worker():
+        scraper = create_enhanced_scraper(headless=headless, rate_limiter=rate_limiter, **kwargs)
+        try:
+            while True:
+                try:
+                    index, url = url_queue.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    result = scraper.scrape_product(url, max_review_pages)
+                    if result_sink is not None:
+                        result_sink(result)
+                    results[index] = result
+                except Exception as e:
+                    print(f"❌ Failed to scrape {url}: {e}")
+        finally:
+            scraper._cleanup()
+            shutdown_browser()
+    
+    workers = max(1, min(pool_size, len(urls)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for future in [executor.submit(worker) for _ in range(workers)]:
+            future.result()
+    
+    return [result for result in results if result is not None]
 
 if __name__ == "__main__":
     """Main function to run the enhanced scraper directly."""
@@ -586,8 +695,8 @@ if __name__ == "__main__":
         print(f"🔄 User Agent: {result['metadata']['user_agent'][:50]}...")
         
         # Save to JSON
-        with open("enhanced_scrape_result.json", "w") as f:
-            json.dump(result, f, indent=2)
+        with open("enhanced_scrape_result.json", "wb") as f:
+            f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2))
         print("\n💾 Results saved to enhanced_scrape_result.json")
         
     except Exception as e:
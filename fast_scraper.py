@@ -0,0 +1,106 @@
+"""
+Browserless product scraping with aiohttp and lxml.
+
+Newegg serves the product details in the page HTML, so metadata can be fetched
+and parsed without starting Chromium. Used when Config.USE_BROWSER is false;
+reviews are loaded by the page's scripts and still need the browser scrapers.
+"""
+
+import aiohttp
+import asyncio
+from datetime import datetime
+from typing import Dict, List, Optional
+from config import Config
+from product_parser import parse_product_html
+from user_agents import UserAgentRotator
+
+async def fetch_product(url: str, session: aiohttp.ClientSession,
+                        rotator: UserAgentRotator) -> Dict:
+    """
+    Fetch and parse one product page.
+
+    Args:
+        url: Newegg product URL
+        session: Shared aiohttp session
+        rotator: User agent rotator supplying the request profile
+
+    Returns:
+        Scrape result with product info and no reviews, ready for DuckDB insertion
+    """
+    profile = rotator.get_next_profile()
+    headers = {
+        **rotator.get_headers(profile),
+        'User-Agent': profile.user_agent,
+        # aiohttp can only decode brotli when the optional brotli package is installed
+        'Accept-Encoding': 'gzip, deflate',
+    }
+
+    async with session.get(url, headers=headers) as response:
+        response.raise_for_status()
+        page_html = await response.text()
+        final_url = str(response.url)
+
+    product_info = parse_product_html(page_html, final_url)
+    print(f"✅ Product info fetched: {product_info['title']}")
+
+    return {
+        "metadata": {
+            "product_url": url,
+            "scraped_at": datetime.now().isoformat(),
+            "total_review_pages": 0,
+            "total_reviews": 0,
+            "scraper_version": "3.0-fast",
+            "user_agent": profile.user_agent,
+            "browser_profile": f"{profile.sec_ch_ua_platform} - {profile.sec_ch_ua}"
+        },
+        "product": product_info,
+        "reviews": []
+    }
+
+async def fetch_products(urls: List[str], concurrency: Optional[int] = None,
+                         user_agent_strategy: str = "random") -> List[Dict]:
+    """
+    Fetch several product pages concurrently.
+
+    Args:
+        urls: Newegg product URLs
+        concurrency: Maximum requests in flight (defaults to Config.MAX_WORKERS)
+        user_agent_strategy: "random", "sequential", or "weighted"
+
+    Returns:
+        Results for the products that fetched successfully, in input order
+    """
+    semaphore = asyncio.Semaphore(concurrency or Config.MAX_WORKERS)
+    rotator = UserAgentRotator(user_agent_strategy)
+    timeout = aiohttp.ClientTimeout(total=60)
+
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        async def bounded_fetch(url: str) -> Dict:
+            async with semaphore:
+                return await fetch_product(url, session, rotator)
+
+        results = await asyncio.gather(*(bounded_fetch(url) for url in urls), return_exceptions=True)
+
+    products = []
+    for url, result in zip(urls, results):
+        if isinstance(result, Exception):
+            print(f"❌ Failed to fetch {url}: {result}")
+        else:
+            products.append(result)
+    return products
+
+def scrape_newegg_product_fast(url: str, **kwargs) -> Dict:
+    """
+    Fetch a single product's metadata without a browser.
+
+    Args:
+        url: Newegg product URL
+        **kwargs: Additional arguments for fetch_products
+
+    Returns:
+        Scrape result with product info and no reviews
+    """
+    results = asyncio.run(fetch_products([url], concurrency=1, **kwargs))
+    if not results:
+        raise RuntimeError(f"Could not fetch {url}")
+    return results[0]
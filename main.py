@@ -1,108 +1,259 @@
-from newegg_scraper import scrape_newegg_product, prepare_for_duckdb
-from enhanced_scraper import scrape_newegg_product_enhanced
 from duckdb_integration import NeweggDuckDB
 from config import Config
 # import json
 # from datetime import datetime
+import argparse
 import os
+import sys
+from typing import Dict, List
 
-def main():
-    """Main function to scrape Newegg products and store in DuckDB."""
+# Example product URL, scraped when no URLs are given
+DEFAULT_URL = "https://www.newegg.com/amd-ryzen-7-9000-series-ryzen-7-9800x3d-granite-ridge-zen-5-socket-am5-desktop-cpu-processor/p/N82E16819113877"
+
+def parse_args() -> argparse.Namespace:
+    """Parse the product URLs to scrape."""
+    parser = argparse.ArgumentParser(description='Scrape Newegg products into DuckDB')
     
-    # Print configuration
-    Config.print_config()
+    parser.add_argument('urls', nargs='*',
+                       help='Newegg product URLs to scrape')
     
-    # Example product URL - you can change this to any Newegg product
-    url = "https://www.newegg.com/amd-ryzen-7-9000-series-ryzen-7-9800x3d-granite-ridge-zen-5-socket-am5-desktop-cpu-processor/p/N82E16819113877"
+    parser.add_argument('--url-file', type=str,
+                       help='File with one product URL per line (blank lines and # comments are skipped)')
     
-    print("🚀 Newegg Product Scraper")
-    print("=" * 50)
-    print(f"Scraping: {url}")
-    print("=" * 50)
+    # Overrides for the matching environment settings
+    parser.add_argument('--scraper', choices=['basic', 'enhanced'],
+                       help='Scraper type (overrides SCRAPER_TYPE)')
     
-    # Initialize DuckDB
-    db = NeweggDuckDB(Config.DUCKDB_PATH)
+    parser.add_argument('--headless', action='store_true', default=None,
+                       help='Run the browser in headless mode (overrides HEADLESS)')
     
-    try:
-        # Choose scraper based on configuration
-        if Config.is_enhanced_scraper():
-            print("🚀 Using ENHANCED scraper with advanced features...")
-            
-            # Import enhanced scraper dependencies
-            from rate_limiter import RateLimitConfig
-            
-            # Configure enhanced scraper settings
-            rate_config = RateLimitConfig(
-                requests_per_second=Config.RATE_LIMIT_PER_SECOND,
-                burst_size=3,
-                adaptive=True,
-                error_threshold=0.1,
-                success_threshold=0.9
-            )
-            
-            # Scrape with enhanced features
-            result = scrape_newegg_product_enhanced(
-                url=url, 
-                max_review_pages=Config.get_max_review_pages(),
-                headless=Config.HEADLESS,
-                user_agent_strategy=Config.USER_AGENT_STRATEGY,
-                rate_limit_config=rate_config
-            )
-            
-        else:
-            print("📦 Using BASIC scraper...")
-            
-            # Scrape with basic scraper
-            result = scrape_newegg_product(
-                url=url, 
-                max_review_pages=Config.get_max_review_pages(),
-                headless=Config.HEADLESS
-            )
+    parser.add_argument('--max-pages', type=int,
+                       help='Max review pages per product, 0 for all (overrides MAX_REVIEW_PAGES)')
+    
+    parser.add_argument('--workers', type=int,
+                       help='Concurrent scrapers for several URLs (overrides MAX_WORKERS)')
+    
+    parser.add_argument('--db-path', type=str,
+                       help='DuckDB database path (overrides DUCKDB_PATH)')
+    
+    return parser.parse_args()
 
-        # print("🦆 Result: ", result)
-        
-        # Prepare data for DuckDB
-        # duckdb_data = prepare_for_duckdb(result)
+def load_urls(args: argparse.Namespace) -> List[str]:
+    """Collect URLs from the command line and --url-file, falling back to the example URL."""
+    urls = list(args.urls)
+    if args.url_file:
+        with open(args.url_file) as f:
+            urls.extend(line.strip() for line in f if line.strip() and not line.lstrip().startswith('#'))
+    return urls or [DEFAULT_URL]
+
+def get_rate_config():
+    """Build the enhanced scraper's rate limiting settings from Config."""
+    # Import enhanced scraper dependencies
+    from rate_limiter import RateLimitConfig
+    
+    return RateLimitConfig(
+        requests_per_second=Config.RATE_LIMIT_PER_SECOND,
+        burst_size=3,
+        adaptive=True,
+        error_threshold=0.1,
+        success_threshold=0.9
+    )
 
-        # print("🦆 DuckDB data: ", duckdb_data)
+def scrape_one(url: str, db: NeweggDuckDB) -> Dict:
+    """
+    Scrape a single product with the configured scraper and store it.
+    
+    Args:
+        url: Newegg product URL
+        db: Database to write to
+    
+    Returns:
+        Scrape result
+    """
+    # Choose scraper based on configuration
+    if not Config.USE_BROWSER:
+        print("⚡ Using FAST browserless scraper (product metadata only)...")
         
-        # Insert data into DuckDB
-        db.insert_scraped_data(result)
+        from fast_scraper import scrape_newegg_product_fast
         
-        # Display results
-        print("\n📊 SCRAPING RESULTS")
-        print("=" * 50)
-        print(f"Product: {result['product']['title']}")
-        print(f"Brand: {result['product']['brand']}")
-        print(f"Price: {result['product']['price']}")
-        print(f"Rating: {result['product']['rating']}")
-        print(f"Total Reviews: {result['metadata']['total_reviews']}")
-        print(f"Review Pages: {result['metadata']['total_review_pages']}")
+        result = scrape_newegg_product_fast(
+            url=url,
+            user_agent_strategy=Config.USER_AGENT_STRATEGY
+        )
+    
+    elif Config.is_enhanced_scraper():
+        print("🚀 Using ENHANCED scraper with advanced features...")
         
-        if Config.is_enhanced_scraper():
-            print(f"User Agent: {result['metadata']['user_agent'][:50]}...")
-            print(f"Browser Profile: {result['metadata']['browser_profile']}")
+        from enhanced_scraper import scrape_newegg_product_enhanced
         
-        # Get and display database summary
-        item_number = result['product']['item_number']
-        summary = db.get_product_summary(item_number)
+        # Scrape with enhanced features, writing each review page to DuckDB as it is read
+        result = scrape_newegg_product_enhanced(
+            url=url,
+            max_review_pages=Config.get_max_review_pages(),
+            headless=Config.HEADLESS,
+            review_sink=db.append_reviews_batch,
+            user_agent_strategy=Config.USER_AGENT_STRATEGY,
+            rate_limit_config=get_rate_config()
+        )
+    
+    else:
+        print("📦 Using BASIC scraper...")
+        
+        from newegg_scraper import scrape_newegg_product
+        
+        # Scrape with basic scraper
+        result = scrape_newegg_product(
+            url=url,
+            max_review_pages=Config.get_max_review_pages(),
+            headless=Config.HEADLESS
+        )
+    
+    # Insert data into DuckDB (streamed review pages are already stored). Each streamed
+    # page and this insert commit on their own, so no write transaction is held open
+    # while the browser works.
+    db.insert_scraped_data(result)
+    
+    return result
+
+def scrape_batch(urls: List[str], db: NeweggDuckDB) -> List[Dict]:
+    """
+    Scrape several products concurrently with the configured scraper and store them.
+    
+    Args:
+        urls: Newegg product URLs
+        db: Database to write to
+    
+    Returns:
+        Results for the products that scraped successfully, in input order
+    """
+    if not Config.USE_BROWSER:
+        print(f"⚡ Using FAST browserless scraper for {len(urls)} products...")
         
-        print(f"\n📊 DATABASE SUMMARY")
-        print("=" * 50)
-        print(f"Product Item Number: {item_number}")
-        print(f"Total Reviews in DB: {len(summary)}")
+        import asyncio
+        from fast_scraper import fetch_products
         
-        # Export to CSV if enabled
-        if Config.EXPORT_CSV:
-            print(f"\n💾 Exporting to CSV...")
-            db.export_to_csv(item_number, Config.OUTPUT_DIR)
-            print(f"✅ Data exported to {Config.OUTPUT_DIR}")
+        results = asyncio.run(fetch_products(urls, user_agent_strategy=Config.USER_AGENT_STRATEGY))
+        with db.transaction():
+            for result in results:
+                db.insert_scraped_data(result)
+        return results
+    
+    def insert(result: Dict):
+        # Runs in the worker thread, which needs its own cursor
+        cursor = db.thread_handle()
+        try:
+            db.insert_scraped_data(result, conn=cursor)
+        finally:
+            cursor.close()
+    
+    if Config.is_enhanced_scraper():
+        print(f"🚀 Using ENHANCED scraper for {len(urls)} products ({Config.MAX_WORKERS} workers)...")
         
-        print("\n✅ Scraping and database operations completed successfully!")
+        from enhanced_scraper import scrape_many
         
+        return scrape_many(
+            urls,
+            pool_size=Config.MAX_WORKERS,
+            max_review_pages=Config.get_max_review_pages(),
+            headless=Config.HEADLESS,
+            rate_limit_config=get_rate_config(),
+            result_sink=insert,
+            user_agent_strategy=Config.USER_AGENT_STRATEGY
+        )
+    
+    # Each worker keeps one browser for the batch and opens a context per product
+    print(f"📦 Using BASIC scraper for {len(urls)} products ({Config.MAX_WORKERS} workers)...")
+    
+    from newegg_scraper import scrape_newegg_products
+    
+    return scrape_newegg_products(
+        urls,
+        max_review_pages=Config.get_max_review_pages(),
+        headless=Config.HEADLESS,
+        pool_size=Config.MAX_WORKERS,
+        result_sink=insert
+    )
+
+def report(result: Dict, db: NeweggDuckDB):
+    """Print a scrape result and its database summary, exporting CSVs if enabled."""
+    # Display results
+    print("\n📊 SCRAPING RESULTS")
+    print("=" * 50)
+    print(f"Product: {result['product']['title']}")
+    print(f"Brand: {result['product']['brand']}")
+    print(f"Price: {result['product']['price']}")
+    print(f"Rating: {result['product']['rating']}")
+    print(f"Total Reviews: {result['metadata']['total_reviews']}")
+    print(f"Review Pages: {result['metadata']['total_review_pages']}")
+    
+    if Config.is_enhanced_scraper():
+        print(f"User Agent: {result['metadata']['user_agent'][:50]}...")
+        print(f"Browser Profile: {result['metadata']['browser_profile']}")
+    
+    # Get and display database summary
+    item_number = result['product']['item_number']
+    summary = db.get_product_summary(item_number)
+    
+    print(f"\n📊 DATABASE SUMMARY")
+    print("=" * 50)
+    print(f"Product Item Number: {item_number}")
+    print(f"Total Reviews in DB: {len(summary)}")
+    
+    # Export to CSV if enabled
+    if Config.EXPORT_CSV:
+        print(f"\n💾 Exporting to CSV...")
+        db.export_to_csv(item_number, Config.OUTPUT_DIR)
+        print(f"✅ Data exported to {Config.OUTPUT_DIR}")
+
+def main():
+    """Main function to scrape Newegg products and store in DuckDB."""
+    args = parse_args()
+    urls = load_urls(args)
+    
+    # Arguments are applied to Config directly, already typed
+    Config.apply_overrides(
+        SCRAPER_TYPE=args.scraper,
+        HEADLESS=args.headless,
+        MAX_REVIEW_PAGES=args.max_pages,
+        MAX_WORKERS=args.workers,
+        DUCKDB_PATH=args.db_path
+    )
+    
+    # Route library logging to the console and LOG_FILE
+    Config.setup_logging()
+    
+    # asyncio.run calls (fast scraper, review API replay) use uvloop when it is installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    # Print configuration and the URLs in a single write
+    lines = [Config.format_config(), "🚀 Newegg Product Scraper", "=" * 50]
+    lines += [f"Scraping: {url}" for url in urls]
+    lines.append("=" * 50)
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Initialize DuckDB
+    db = NeweggDuckDB(Config.DUCKDB_PATH)
+    
+    try:
+        if len(urls) == 1:
+            results = [scrape_one(urls[0], db)]
+        else:
+            results = scrape_batch(urls, db)
+        
+        for result in results:
+            report(result, db)
+        
+        if len(results) < len(urls):
+            print(f"\n⚠️ {len(urls) - len(results)} of {len(urls)} products failed to scrape")
+        print("\n✅ Scraping and database operations completed successfully!")
+    
     except Exception as e:
         print(f"❌ Error during scraping: {str(e)}")
         raise e
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
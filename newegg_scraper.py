@@ -1,11 +1,29 @@
-from playwright.sync_api import sync_playwright
-from bs4 import BeautifulSoup
+from playwright.sync_api import sync_playwright, Browser, TimeoutError as PlaywrightTimeoutError
 import time
 import random
 import re
+import queue
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Optional, Tuple
-import json
+from typing import Callable, Iterator, List, Dict, Optional, Tuple
+import orjson
+from lxml import html as lxml_html
+from browser_pool import CHROMIUM_ARGS, get_browser, shutdown_browser
+from result_cache import ResultCache, get_result_cache
+from review_api import REVIEW_API_PATTERN, CapturedReviewRequest, fetch_reviews, parse_review_payload
+from product_parser import (extract_item_number, parse_product_html,
+                            parse_review_fields, parse_review_sections)
+
+# Star count from a review's rating class (e.g. "rating rating-4") and its posted date
+_RATING_RE = re.compile(r'rating-(\d+)')
+_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+
+# Review elements on a review page
+REVIEW_CELL_SELECTOR = 'div.comments-cell.has-side-left.is-active'
+
+# CDP resource types that are never needed for scraping and are failed in the browser
+BLOCKED_RESOURCE_TYPES = ("Image", "Font", "Media", "Stylesheet")
 
 class NeweggScraper:
     """
@@ -13,11 +31,76 @@ class NeweggScraper:
     Designed to be DuckDB-ready with clean data structures.
     """
     
-    def __init__(self, headless: bool = True):
+    # Browser identity for every context, built once rather than per context
+    USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36'
+    VIEWPORT = {'width': 1920, 'height': 1080}
+    CONTEXT_HEADERS = {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'DNT': '1',
+        'Connection': 'keep-alive',
+        'Upgrade-Insecure-Requests': '1',
+        'Sec-Fetch-Dest': 'document',
+        'Sec-Fetch-Mode': 'navigate',
+        'Sec-Fetch-Site': 'none',
+        'Cache-Control': 'max-age=0',
+        'Sec-Ch-Ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
+        'Sec-Ch-Ua-Mobile': '?0',
+        'Sec-Ch-Ua-Platform': '"macOS"'
+    }
+    
+    # Header overlay for review API requests; only Referer varies per request.
+    # Built on CONTEXT_HEADERS, which the context already sends with every request,
+    # so the overlay can't drift from the page's own fingerprint.
+    _REVIEW_API_HEADERS = {
+        **CONTEXT_HEADERS,
+        'User-Agent': USER_AGENT,
+        'Origin': 'https://www.newegg.com',
+        'X-Requested-With': 'XMLHttpRequest',
+        'Accept': 'application/json, text/plain, */*',
+        'Content-Type': 'application/json',
+        'Sec-Fetch-Dest': 'empty',
+        'Sec-Fetch-Mode': 'cors',
+        'Sec-Fetch-Site': 'same-origin',
+        'Cache-Control': 'no-cache',
+        'Pragma': 'no-cache'
+    }
+    
+    def __init__(self, headless: bool = True, browser: Optional[Browser] = None,
+                 context_recycle_interval: Optional[int] = None, cache_dir: Optional[str] = None,
+                 cache_ttl: Optional[float] = None):
+        """
+        Initialize the scraper.
+        
+        Args:
+            headless: Whether to run browser in headless mode
+            browser: Browser to open the context on. Defaults to launching a private one.
+            context_recycle_interval: Page loads (product pages and review pages) after which
+                the context is replaced by a fresh one with the same cookies. None (the default)
+                never recycles, which suits a scraper used for a single product.
+            cache_dir: Result cache directory. Defaults to the shared cache configured by
+                CACHE_DIR, CACHE_TTL and CACHE_ENABLED.
+            cache_ttl: Seconds a cached result is reused (defaults to Config.CACHE_TTL)
+        """
         self.headless = headless
-        self.browser = None
+        self.browser = browser
+        self._owns_browser = browser is None
         self.context = None
         self.page = None
+        self._current_url = ""  # page URL as of the last navigation, for Referer
+        # Review API responses seen since the last review page was read, and the
+        # first review API request, replayed for later pages
+        self._review_payloads = deque(maxlen=4)
+        self._review_request: Optional[CapturedReviewRequest] = None
+        self.context_recycle_interval = context_recycle_interval
+        self._pages_since_recycle = 0
+        
+        # Basic results lack the enhanced scraper's metadata, so they are cached apart
+        if cache_dir is not None or cache_ttl is not None:
+            self.result_cache = ResultCache(cache_dir, cache_ttl, name="basic_results")
+        else:
+            self.result_cache = get_result_cache("basic_results")
     
     def __enter__(self):
         """Context manager entry for browser setup."""
@@ -30,107 +113,177 @@ class NeweggScraper:
     
     def _setup_browser(self):
         """Initialize browser with anti-detection measures."""
+        if self.browser is None:
+            self._launch_browser()
+        self._new_context()
+    
+    def _launch_browser(self):
+        """Launch a private Chromium instance for this scraper."""
         playwright = sync_playwright().start()
         
         self.browser = playwright.chromium.launch(
             headless=self.headless,
-            args=[
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-web-security',
-                '--disable-features=VizDisplayCompositor',
-                '--disable-extensions',
-                '--disable-plugins',
-                '--disable-images',
-                '--disable-javascript',
-                '--disable-background-timer-throttling',
-                '--disable-backgrounding-occluded-windows',
-                '--disable-renderer-backgrounding',
-                '--disable-features=TranslateUI',
-                '--disable-ipc-flooding-protection',
-                '--disable-gpu',
-                '--disable-software-rasterizer',
-                '--disable-background-networking',
-                '--disable-default-apps',
-                '--disable-sync',
-                '--metrics-recording-only',
-                '--no-first-run',
-                '--safebrowsing-disable-auto-update',
-                '--disable-client-side-phishing-detection',
-                '--disable-component-update',
-                '--disable-domain-reliability'
-            ]
+            args=CHROMIUM_ARGS
         )
-        
+    
+    def _new_context(self, storage_state: Optional[Dict] = None):
+        """Open the browser context and page the scrape runs in."""
         self.context = self.browser.new_context(
-            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
-            viewport={'width': 1920, 'height': 1080},
-            extra_http_headers={
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Cache-Control': 'max-age=0',
-                'Sec-Ch-Ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-                'Sec-Ch-Ua-Mobile': '?0',
-                'Sec-Ch-Ua-Platform': '"macOS"'
-            }
+            storage_state=storage_state,
+            user_agent=self.USER_AGENT,
+            viewport=self.VIEWPORT,
+            extra_http_headers=self.CONTEXT_HEADERS
         )
         
         self.page = self.context.new_page()
+        self._pages_since_recycle = 0
+        self._review_payloads.clear()
+        self.page.on("response", self._on_response)
         self._setup_request_interception()
     
+    def _on_response(self, response):
+        """Keep the JSON of review API responses, which hold the reviews the page renders."""
+        if not REVIEW_API_PATTERN.search(response.url):
+            return
+        try:
+            self._review_payloads.append(response.json())
+        except Exception:
+            pass
+    
+    def _maybe_recycle_context(self) -> bool:
+        """
+        Replace the context once it has loaded context_recycle_interval pages.
+        
+        Playwright and Chromium keep growing a long-lived context's memory, so a
+        scraper reused for many products (or paging through many reviews) swaps in
+        a fresh one, carrying the cookies and local storage over. The new page is
+        blank; see _recycle_at_review_page for getting back mid-pagination.
+        
+        Returns:
+            True if the context was recycled
+        """
+        if not self.context_recycle_interval or self._pages_since_recycle < self.context_recycle_interval:
+            return False
+        
+        state = self.context.storage_state()
+        self.page.close()
+        self.context.close()
+        self._new_context(storage_state=state)
+        print("♻️  Recycled browser context")
+        return True
+    
+    def _recycle_at_review_page(self, page_number: int) -> bool:
+        """
+        Recycle the context between review pages if it is due, then reopen page_number.
+        
+        Returns:
+            False if the context was recycled and the review page couldn't be reached again
+        """
+        if not self._maybe_recycle_context():
+            return True
+        
+        self.page.goto(self._current_url, timeout=60000)
+        self._settle()
+        return self._navigate_to_reviews() and self._go_to_review_page(page_number)
+    
     def _cleanup(self):
-        """Clean up browser resources."""
-        if self.browser:
+        """Clean up browser resources, leaving a browser passed in running."""
+        if self.context:
+            self.context.close()
+        self.context = None
+        self.page = None
+        if self._owns_browser and self.browser:
             self.browser.close()
     
     def _setup_request_interception(self):
-        """Set up request interception for API calls."""
-        def handle_request(route):
-            request = route.request
-            if 'api/ProductReview' in request.url:
-                headers = {
-                    **request.headers,
-                    'Referer': self.page.url,
-                    'Origin': 'https://www.newegg.com',
-                    'X-Requested-With': 'XMLHttpRequest',
-                    'Accept': 'application/json, text/plain, */*',
-                    'Content-Type': 'application/json',
-                    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/138.0.0.0 Safari/537.36',
-                    'Sec-Fetch-Dest': 'empty',
-                    'Sec-Fetch-Mode': 'cors',
-                    'Sec-Fetch-Site': 'same-origin',
-                    'Accept-Language': 'en-US,en;q=0.9',
-                    'Accept-Encoding': 'gzip, deflate, br',
-                    'Connection': 'keep-alive',
-                    'Cache-Control': 'no-cache',
-                    'Pragma': 'no-cache',
-                    'Sec-Ch-Ua': '"Not)A;Brand";v="8", "Chromium";v="138", "Google Chrome";v="138"',
-                    'Sec-Ch-Ua-Mobile': '?0',
-                    'Sec-Ch-Ua-Platform': '"macOS"'
-                }
-                route.continue_(headers=headers)
-            else:
-                route.continue_()
+        """
+        Set up request interception for API calls.
+        
+        Uses the Chrome DevTools Fetch domain filtered to the review API and the
+        blocked resource types, so only those requests are paused in the browser and
+        every other subresource loads without a round trip to Python (unlike
+        page.route("**/*")). Images, fonts, media and stylesheets are failed there.
+        """
+        cdp = self.context.new_cdp_session(self.page)
         
-        self.page.route("**/*", handle_request)
+        def handle_paused(event):
+            if event.get("resourceType") in BLOCKED_RESOURCE_TYPES:
+                cdp.send("Fetch.failRequest", {"requestId": event["requestId"], "errorReason": "BlockedByClient"})
+                return
+            
+            headers = {
+                **event['request']['headers'],
+                **self._REVIEW_API_HEADERS,
+                'Referer': self._current_url
+            }
+            # Keep the first one so later pages can be requested directly
+            request = event["request"]
+            if self._review_request is None:
+                self._review_request = CapturedReviewRequest.from_parts(
+                    request["url"], request["method"], headers, request.get("postData")
+                )
+            cdp.send("Fetch.continueRequest", {
+                "requestId": event["requestId"],
+                "headers": [{"name": name, "value": value} for name, value in headers.items()]
+            })
+        
+        cdp.on("Fetch.requestPaused", handle_paused)
+        cdp.send("Fetch.enable", {
+            "patterns": [{"urlPattern": "*api/ProductReview*", "requestStage": "Request"}] + [
+                {"urlPattern": "*", "resourceType": resource_type, "requestStage": "Request"}
+                for resource_type in BLOCKED_RESOURCE_TYPES
+            ]
+        })
     
     def _human_delay(self, min_seconds: float = 1.0, max_seconds: float = 3.0):
         """Add human-like delay."""
         time.sleep(random.uniform(min_seconds, max_seconds))
     
+    def _settle(self, min_seconds: float = 0.2, max_seconds: float = 0.6):
+        """
+        Wait for the page to be ready, then pause briefly.
+        
+        Waits on the DOM being loaded rather than a fixed sleep. If that doesn't
+        happen within a few seconds the scrape goes on; the extraction steps wait
+        for the elements they need themselves.
+        """
+        try:
+            self.page.wait_for_load_state('domcontentloaded', timeout=3000)
+        except PlaywrightTimeoutError:
+            pass
+        time.sleep(random.uniform(min_seconds, max_seconds))
+    
+    def _click_review_page(self, element):
+        """Click a pagination control and wait for the review API response it triggers."""
+        try:
+            with self.page.expect_response(lambda response: REVIEW_API_PATTERN.search(response.url) is not None,
+                                           timeout=5000):
+                element.click()
+        except PlaywrightTimeoutError:
+            # Not loaded through the API. The page has had the whole timeout to
+            # render it, and review extraction waits for the cells on its own.
+            pass
+        self._settle()
+    
     def _scroll_down(self, pixels: int = 800):
-        """Scroll down the page."""
+        """
+        Scroll down the page.
+        
+        mouse.wheel returns before the page has moved, so this waits (one check per
+        animation frame) until the scroll has covered the distance or hit the bottom
+        of the page, then settles for anything it lazy-loaded.
+        """
+        start = self.page.evaluate("window.scrollY")
         self.page.mouse.wheel(0, pixels)
-        self._human_delay(1, 2)
+        try:
+            self.page.wait_for_function(
+                """([start, pixels]) => window.scrollY >= start + pixels
+                    || window.innerHeight + window.scrollY >= document.documentElement.scrollHeight - 1""",
+                arg=[start, pixels], polling='raf', timeout=2000
+            )
+        except PlaywrightTimeoutError:
+            pass
+        self._settle()
     
     def scrape_product(self, url: str, max_review_pages: Optional[int] = None) -> Dict:
         """
@@ -145,9 +298,22 @@ class NeweggScraper:
         """
         print(f"🔍 Scraping product: {url}")
         
-        # Load the product page
+        # Serve recent results from the on-disk cache without touching the browser
+        if self.result_cache is not None:
+            cached = self.result_cache.get(url, max_review_pages)
+            if cached is not None:
+                print(f"♻️  Using cached result from {cached['metadata']['scraped_at']}")
+                return cached
+        
+        self._maybe_recycle_context()
+        
+        # Load the product page, dropping review traffic from the last product
+        self._review_payloads.clear()
+        self._review_request = None
         self.page.goto(url, timeout=60000)
-        self._human_delay(2, 4)
+        self._current_url = self.page.url
+        self._pages_since_recycle += 1
+        self._settle()
         
         # Extract product information
         product_info = self._extract_product_info()
@@ -169,79 +335,24 @@ class NeweggScraper:
         }
         
         print(f"✅ Scraping complete: {result['metadata']['total_reviews']} reviews from {result['metadata']['total_review_pages']} pages")
+        
+        if self.result_cache is not None:
+            self.result_cache.set(url, max_review_pages, result)
         return result
     
     def _extract_product_info(self) -> Dict:
         """Extract product information from the current page."""
         print("📦 Extracting product information...")
         
-        # Get page content
-        html = self.page.content()
-        soup = BeautifulSoup(html, "lxml")
-        
-        # Extract with multiple selector fallbacks
-        product_info = {
-            "title": self._extract_text(soup, [
-                "h1.product-title",
-                ".product-title",
-                "h1",
-                "[data-testid='product-title']"
-            ], "Title not found"),
-            
-            "brand": self._extract_text(soup, [
-                "div.product-breadcrumb a",
-                ".breadcrumbs a[href*='AMD']",
-                ".seller-store-link a",
-                "a[href*='AMD/BrandStore']"
-            ], "Brand not found"),
-            
-            "price": self._extract_text(soup, [
-                "li.price-current strong",
-                ".price-current strong",
-                ".price-current",
-                "span.price-current-label + strong"
-            ], "Price not found"),
-            
-            "rating": self._extract_text(soup, [
-                "i.rating",
-                "span.rating",
-                ".product-rating i.rating"
-            ], "No rating"),
-            
-            "reviews_count": self._extract_text(soup, [
-                "span.item-rating-num",
-                ".product-rating span[title*='reviews']",
-                ".product-reviews span"
-            ], "0"),
-            
-            "description": self._extract_text(soup, [
-                "div.product-bullets ul",
-                ".product-bullets",
-                "ul.product-bullets"
-            ], "Description not found"),
-
-            "product_url": self.page.url,
-            
-            "item_number": self._extract_item_number(self.page.url)
-        }
+        # Same lxml parser and selector fallbacks as the other scrapers
+        product_info = parse_product_html(self.page.content(), self.page.url)
         
         print(f"✅ Product info extracted: {product_info['title']}")
         return product_info
     
-    def _extract_text(self, soup: BeautifulSoup, selectors: List[str], default: str) -> str:
-        """Extract text using multiple selector fallbacks."""
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                text = element.get_text(strip=True)
-                if text and text != "$":
-                    return text
-        return default
-    
     def _extract_item_number(self, url: str) -> str:
         """Extract item number from URL."""
-        match = re.search(r'/p/([A-Z0-9]+)', url)
-        return match.group(1) if match else "Unknown"
+        return extract_item_number(url)
     
     def _scrape_reviews(self, max_pages: Optional[int] = None) -> List[List[Dict]]:
         """Scrape reviews from all available pages."""
@@ -273,6 +384,18 @@ class NeweggScraper:
                 print(f"🛑 Reached maximum page limit ({max_pages})")
                 break
             
+            # Once page 1 has shown the API request, fetch the rest directly
+            if current_page == 1 and self._review_request is not None:
+                api_pages = self._fetch_pages_via_api(max_pages)
+                if api_pages is not None:
+                    all_reviews.extend(api_pages)
+                    break
+            
+            # Long paginations recycle the context here rather than waiting for the next product
+            if not self._recycle_at_review_page(current_page):
+                print(f"❌ Could not get back to review page {current_page} after recycling")
+                break
+            
             # Try to go to next page
             if not self._navigate_to_next_page():
                 print("🏁 No more pages available")
@@ -283,6 +406,41 @@ class NeweggScraper:
         
         return all_reviews
     
+    def _fetch_pages_via_api(self, max_pages: Optional[int]) -> Optional[List[List[Dict]]]:
+        """
+        Fetch review pages 2..N concurrently through the captured review API request.
+        
+        Returns:
+            Review pages in order, or None to fall back to clicking through the pagination
+        """
+        # Highest page number shown in the pagination, read in one call
+        page_labels = self.page.locator('.paginations li a.button').all_inner_texts()
+        total_pages = max((int(label) for label in map(str.strip, page_labels) if label.isdigit()), default=0)
+        if not total_pages:
+            return None
+        
+        last_page = min(total_pages, max_pages) if max_pages is not None else total_pages
+        page_numbers = list(range(2, last_page + 1))
+        if not page_numbers:
+            return []
+        
+        cookies = "; ".join(f"{c['name']}={c['value']}" for c in self.context.cookies(self.page.url))
+        print(f"⚡ Fetching review pages 2-{last_page} through the review API...")
+        
+        try:
+            pages = fetch_reviews(self._review_request, page_numbers, cookies=cookies)
+        except Exception as e:
+            print(f"⚠️ Review API fetch failed, clicking through pages instead: {e}")
+            return None
+        
+        if not all(pages.get(page_number) for page_number in page_numbers):
+            print("⚠️ Review API response not recognized, clicking through pages instead")
+            return None
+        
+        for page_number in page_numbers:
+            print(f"✅ Extracted {len(pages[page_number])} reviews from page {page_number}")
+        return [pages[page_number] for page_number in page_numbers]
+    
     def _navigate_to_reviews(self) -> bool:
         """Navigate to the reviews section of the product page."""
         print("🔍 Looking for Reviews tab...")
@@ -303,12 +461,12 @@ class NeweggScraper:
                 element = self.page.locator(selector).first
                 if element.count() > 0:
                     element.scroll_into_view_if_needed()
-                    self._human_delay(1, 2)
+                    self._settle()
                     
                     if element.is_visible():
                         element.click()
                         print(f"✅ Clicked Reviews tab with selector: {selector}")
-                        self._human_delay(1, 3)
+                        self._settle()
                         
                         # Scroll down to load reviews
                         self._scroll_down(600)
@@ -322,20 +480,27 @@ class NeweggScraper:
     
     def _extract_page_reviews(self, page_number: int) -> List[Dict]:
         """Extract reviews from the current page."""
+        # Prefer the review API response this page was loaded from, which needs no
+        # rendering or DOM parsing. Page 1 is often server-rendered and has none.
+        if self._review_payloads:
+            reviews = parse_review_payload(self._review_payloads[-1], page_number)
+            self._review_payloads.clear()
+            if reviews:
+                return reviews
+        
         # Wait for reviews to load
         try:
-            self.page.wait_for_selector('div.comments-cell.has-side-left.is-active', timeout=15000)
+            self.page.wait_for_selector(REVIEW_CELL_SELECTOR, timeout=15000)
         except Exception:
             print("⚠️ No review elements found on this page")
             return []
         
-        # Extract reviews using Python instead of JavaScript
-        reviews = []
-        
-        # Find all review elements
-        review_elements = self.page.locator('div.comments-cell.has-side-left.is-active').all()
+        # Serialize just the review cells in one call and read them locally
+        cells_html = self.page.locator(REVIEW_CELL_SELECTOR).evaluate_all("(els) => els.map((el) => el.outerHTML)")
+        elements = lxml_html.fragments_fromstring("".join(cells_html)) if cells_html else []
         
-        for i, element in enumerate(review_elements):
+        reviews = []
+        for i, element in enumerate(elements):
             try:
                 review_data = self._extract_single_review(element, i + 1, page_number)
                 reviews.append(review_data)
@@ -345,47 +510,38 @@ class NeweggScraper:
         
         return reviews
     
-    def _extract_single_review(self, element, review_index: int, page_number: int) -> Dict:
-        """Extract data from a single review element."""
+    def _extract_single_review(self, element: lxml_html.HtmlElement, review_index: int, page_number: int) -> Dict:
+        """Extract data from a single review element, parsed from its outerHTML."""
+        fields = parse_review_fields(element)
+        
         # Extract title
-        title_element = element.locator('.comments-title-content, .review-title, .comment-title, h3, h4, .title').first
-        title = title_element.inner_text().strip() if title_element.count() > 0 else f"Review {review_index}"
+        title = fields["title"] if fields["title"] is not None else f"Review {review_index}"
         
         # Extract rating
-        rating_element = element.locator('.rating').first
         rating = "N/A"
-        if rating_element.count() > 0:
-            rating_class = rating_element.get_attribute("class") or ""
-            rating_match = re.search(r'rating-(\d+)', rating_class)
+        if fields["rating_class"] is not None:
+            rating_match = _RATING_RE.search(fields["rating_class"])
             rating = f"{rating_match.group(1)}/5" if rating_match else "N/A"
         
         # Extract content
-        content_element = element.locator('.comments-content, .review-content, .comment-content, .review-text, .content, p').first
-        content = content_element.inner_text().strip() if content_element.count() > 0 else "No content found"
+        content = fields["content"] if fields["content"] is not None else "No content found"
         
         # Extract author
-        author_element = element.locator('.comments-name, .review-author, .comment-author, .author, .user-name, .username').first
-        author = author_element.inner_text().strip() if author_element.count() > 0 else "Anonymous"
+        author = fields["author"] if fields["author"] is not None else "Anonymous"
         
         # Extract date
-        date_element = element.locator('.comments-text').first
         date = "N/A"
-        if date_element.count() > 0:
-            date_text = date_element.inner_text().strip()
-            date_match = re.search(r'(\d{1,2}/\d{1,2}/\d{4})', date_text)
+        if fields["details"] is not None:
+            date_match = _DATE_RE.search(fields["details"])
             date = date_match.group(1) if date_match else "N/A"
         
         # Extract verification status
-        verified_element = element.locator('.comments-verified-owner').first
-        is_verified = verified_element.count() > 0
+        is_verified = fields["verified"]
         
         # Extract ownership duration
-        ownership_element = element.locator('.comments-cell-side .comments-text:not(.comments-verified-owner)').first
         ownership = "N/A"
-        if ownership_element.count() > 0:
-            ownership_text = ownership_element.inner_text().strip()
-            if "Ownership:" in ownership_text:
-                ownership = ownership_text.split("Ownership:")[1].strip()
+        if fields["ownership"] is not None and "Ownership:" in fields["ownership"]:
+            ownership = fields["ownership"].split("Ownership:")[1].strip()
         
         # Parse pros, cons, and overall review from content
         pros, cons, overall_review = self._parse_review_sections(content)
@@ -409,51 +565,21 @@ class NeweggScraper:
     
     def _parse_review_sections(self, content: str) -> Tuple[str, str, str]:
         """Parse pros, cons, and overall review from review content."""
-        pros = ""
-        cons = ""
-        overall_review = ""
-        
-        if not content:
-            return "Not specified", "Not specified", "Not specified"
-        
-        lines = content.split('\n')
-        current_section = ""
-        
-        for line in lines:
-            trimmed_line = line.strip()
-            if trimmed_line.lower().startswith('pros:'):
-                current_section = 'pros'
-                pros = trimmed_line.replace('pros:', '').strip()
-            elif trimmed_line.lower().startswith('cons:'):
-                current_section = 'cons'
-                cons = trimmed_line.replace('cons:', '').strip()
-            elif trimmed_line.lower().startswith('overall review:') or trimmed_line.lower().startswith('overall:'):
-                current_section = 'overall'
-                overall_review = trimmed_line.replace('overall review:', '').replace('overall:', '').strip()
-            elif trimmed_line and current_section:
-                if current_section == 'pros':
-                    pros += (pros + ' ' if pros else '') + trimmed_line
-                elif current_section == 'cons':
-                    cons += (cons + ' ' if cons else '') + trimmed_line
-                elif current_section == 'overall':
-                    overall_review += (overall_review + ' ' if overall_review else '') + trimmed_line
-        
-        return (
-            pros or "Not specified",
-            cons or "Not specified", 
-            overall_review or "Not specified"
-        )
+        return parse_review_sections(content)
     
     def _navigate_to_next_page(self) -> bool:
         """Navigate to the next page of reviews."""
         print("🔍 Looking for next page...")
         
+        # Responses from here on belong to the page being opened
+        self._review_payloads.clear()
+        
         # Check for next button
         next_button = self.page.locator('.paginations-next:not(.is-disabled)').first
         if next_button.count() > 0:
-            next_button.click()
+            self._click_review_page(next_button)
+            self._pages_since_recycle += 1
             print("✅ Clicked next button")
-            self._human_delay(2, 4)
             return True
         
         # Check for pagination numbers
@@ -471,9 +597,9 @@ class NeweggScraper:
                     try:
                         page_num = int(page_text)
                         if page_num == next_page:
-                            item.click()
+                            self._click_review_page(item)
+                            self._pages_since_recycle += 1
                             print(f"✅ Clicked page {next_page}")
-                            self._human_delay(2, 4)
                             return True
                     except ValueError:
                         continue
@@ -483,6 +609,44 @@ class NeweggScraper:
         
         print("❌ No next page found")
         return False
+    
+    def _go_to_review_page(self, page_number: int) -> bool:
+        """
+        Jump to a review page from page 1, clicking the furthest page button not past it.
+        
+        The pagination only lists pages near the active one, so this can take several
+        clicks. Used to pick up where a recycled context left off.
+        
+        Returns:
+            True if page_number is the active page
+        """
+        last_page = None
+        while True:
+            active = self.page.locator('.paginations li a.button.is-active').first
+            if active.count() == 0:
+                return page_number == 1
+            try:
+                current_page = int(active.inner_text().strip())
+            except ValueError:
+                return False
+            if current_page == page_number:
+                return True
+            # The last click didn't move the pagination, so another won't either
+            if last_page is not None and current_page <= last_page:
+                return False
+            last_page = current_page
+            
+            target = None
+            target_page = current_page
+            for item in self.page.locator('.paginations li a.button').all():
+                label = item.inner_text().strip()
+                if label.isdigit() and target_page < int(label) <= page_number:
+                    target, target_page = item, int(label)
+            if target is None:
+                return False
+            
+            self._review_payloads.clear()
+            self._click_review_page(target)
 
 def scrape_newegg_product(url: str, max_review_pages: Optional[int] = None, headless: bool = True) -> Dict:
     """
@@ -499,7 +663,139 @@ def scrape_newegg_product(url: str, max_review_pages: Optional[int] = None, head
     with NeweggScraper(headless=headless) as scraper:
         return scraper.scrape_product(url, max_review_pages)
 
+class NeweggScraperPool:
+    """
+    Scrape several Newegg products concurrently on shared browsers.
+    
+    Each worker thread keeps one Chromium (see browser_pool) and one scraper for
+    the whole batch, so no product pays for a browser launch. The scraper's context
+    lives across products and is recycled every context_recycle_interval page loads.
+    Playwright's sync API is bound to its thread, which is why workers get a
+    browser each rather than sharing one.
+    """
+    
+    def __init__(self, pool_size: int = 4, headless: bool = True, context_recycle_interval: int = 10):
+        """
+        Initialize the pool.
+        
+        Args:
+            pool_size: Number of worker threads (and browsers)
+            headless: Whether to run browsers in headless mode
+            context_recycle_interval: Page loads after which a worker's context is recycled,
+                0 to never recycle
+        """
+        self.pool_size = pool_size
+        self.headless = headless
+        self.context_recycle_interval = context_recycle_interval
+    
+    def acquire(self) -> NeweggScraper:
+        """Get a scraper with a new context on the calling thread's shared browser, to reuse across products."""
+        scraper = NeweggScraper(headless=self.headless, browser=get_browser(self.headless),
+                                context_recycle_interval=self.context_recycle_interval)
+        scraper._setup_browser()
+        return scraper
+    
+    def release(self, scraper: NeweggScraper):
+        """Close a scraper's context, keeping the thread's browser running."""
+        scraper._cleanup()
+    
+    def scrape_many(self, urls: List[str], max_review_pages: Optional[int] = None,
+                    result_sink: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """
+        Scrape several products, with pool_size running at a time.
+        
+        Args:
+            urls: Newegg product URLs
+            max_review_pages: Maximum number of review pages to scrape per product
+            result_sink: Called with each result in the worker thread that scraped it
+        
+        Returns:
+            Results for the products that scraped successfully, in input order
+        """
+        url_queue: "queue.Queue[Tuple[int, str]]" = queue.Queue()
+        for index, url in enumerate(urls):
+            url_queue.put((index, url))
+        
+        results: List[Optional[Dict]] = [None] * len(urls)
+        
+        def worker():
+            # One scraper per worker, so its page-load count (and context) carries
+            # over between products and recycling happens on schedule
+            scraper = None
+            try:
+                while True:
+                    try:
+                        index, url = url_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        if scraper is None:
+                            scraper = self.acquire()
+                        result = scraper.scrape_product(url, max_review_pages)
+                        if result_sink is not None:
+                            result_sink(result)
+                        results[index] = result
+                    except Exception as e:
+                        print(f"❌ Failed to scrape {url}: {e}")
+                        # The page may be left mid-navigation; start the next product on a new context
+                        if scraper is not None:
+                            self.release(scraper)
+                            scraper = None
+            finally:
+                if scraper is not None:
+                    self.release(scraper)
+                shutdown_browser()
+        
+        workers = max(1, min(self.pool_size, len(urls)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for future in [executor.submit(worker) for _ in range(workers)]:
+                future.result()
+        
+        return [result for result in results if result is not None]
+
+def scrape_newegg_products(urls: List[str], max_review_pages: Optional[int] = None,
+                           headless: bool = True, pool_size: int = 4,
+                           result_sink: Optional[Callable[[Dict], None]] = None,
+                           context_recycle_interval: int = 10) -> List[Dict]:
+    """
+    Convenience function to scrape several Newegg products concurrently.
+    
+    Args:
+        urls: Newegg product URLs
+        max_review_pages: Maximum number of review pages to scrape per product
+        headless: Whether to run browsers in headless mode
+        pool_size: Number of products scraped at a time
+        result_sink: Called with each result in the worker thread that scraped it
+        context_recycle_interval: Page loads after which a worker's context is recycled,
+            0 to never recycle
+    
+    Returns:
+        Results for the products that scraped successfully, in input order
+    """
+    pool = NeweggScraperPool(pool_size=pool_size, headless=headless,
+                             context_recycle_interval=context_recycle_interval)
+    return pool.scrape_many(urls, max_review_pages, result_sink=result_sink)
+
 # Example usage and DuckDB preparation
+
+# Scraped review fields, in column order
+REVIEW_FIELDS = (
+    "review_id", "page_number", "review_index", "title", "rating", "author", "date",
+    "is_verified", "ownership", "pros", "cons", "overall_review", "full_content", "timestamp"
+)
+
+# Product and scrape values repeated on every review row, and where they come from
+_DENORMALIZED_FIELDS = {
+    "product_url": ("metadata", "product_url"),
+    "product_title": ("product", "title"),
+    "product_brand": ("product", "brand"),
+    "product_price": ("product", "price"),
+    "product_rating": ("product", "rating"),
+    "product_reviews_count": ("product", "reviews_count"),
+    "product_item_number": ("product", "item_number"),
+    "scraped_at": ("metadata", "scraped_at"),
+}
+
 def prepare_for_duckdb(scraped_data: Dict) -> Dict:
     """
     Prepare scraped data for DuckDB insertion.
@@ -508,37 +804,85 @@ def prepare_for_duckdb(scraped_data: Dict) -> Dict:
         scraped_data: Data from scrape_newegg_product
     
     Returns:
-        Dictionary with flattened data structures ready for DuckDB
+        Dictionary with flattened data structures ready for DuckDB. The reviews
+        table is column-oriented: one list per column, all the same length.
     """
     product = scraped_data["product"]
     reviews = scraped_data["reviews"]
     metadata = scraped_data["metadata"]
     
-    # Flatten reviews for easier DuckDB insertion
-    flattened_reviews = []
-    for page_reviews in reviews:
-        for review in page_reviews:
-            # Add product info to each review for denormalized table
-            flattened_review = {
-                **review,
-                "product_url": metadata["product_url"],
-                "product_title": product["title"],
-                "product_brand": product["brand"],
-                "product_price": product["price"],
-                "product_rating": product["rating"],
-                "product_reviews_count": product["reviews_count"],
-                "product_item_number": product["item_number"],
-                "scraped_at": metadata["scraped_at"]
-            }
-            flattened_reviews.append(flattened_review)
+    # Flatten reviews, then lay them out one list per column for bulk loading
+    flattened = [review for page_reviews in reviews for review in page_reviews]
+    reviews_table = {field: [review.get(field) for review in flattened] for field in REVIEW_FIELDS}
+    
+    # Add product info to each review for denormalized table
+    sources = {"product": product, "metadata": metadata}
+    for column, (source, key) in _DENORMALIZED_FIELDS.items():
+        reviews_table[column] = [sources[source][key]] * len(flattened)
     
     return {
         "product_table": [product],
-        "reviews_table": flattened_reviews,
+        "reviews_table": reviews_table,
         "metadata_table": [metadata]
     }
 
+def reviews_frame(duckdb_data: Dict):
+    """
+    Build a pandas DataFrame from prepare_for_duckdb's reviews table.
+    
+    The repeated product columns are categoricals, so each distinct value is stored
+    once. DuckDB can scan the frame directly, e.g. conn.from_df(frame).
+    
+    Args:
+        duckdb_data: Output of prepare_for_duckdb
+    
+    Returns:
+        pandas DataFrame with one row per review
+    """
+    import pandas as pd
+    
+    columns = duckdb_data["reviews_table"]
+    return pd.DataFrame({
+        column: pd.Categorical(values) if column in _DENORMALIZED_FIELDS else values
+        for column, values in columns.items()
+    })
+
+def iter_review_rows(duckdb_data: Dict) -> Iterator[Dict]:
+    """Yield prepare_for_duckdb's reviews table one row dict at a time."""
+    columns = duckdb_data["reviews_table"]
+    names = list(columns)
+    for values in zip(*columns.values()):
+        yield dict(zip(names, values))
+
+def write_reviews_jsonl(duckdb_data: Dict, path: str) -> int:
+    """
+    Write prepare_for_duckdb's reviews one JSON object per line.
+    
+    Rows are serialized as they are produced, so no second copy of the review set
+    is built. DuckDB reads the file with read_json_auto.
+    
+    Args:
+        duckdb_data: Output of prepare_for_duckdb
+        path: JSON Lines file to write
+    
+    Returns:
+        Number of reviews written
+    """
+    count = 0
+    with open(path, "wb") as f:
+        for row in iter_review_rows(duckdb_data):
+            f.write(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE))
+            count += 1
+    return count
+
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Scrape the example Newegg product')
+    parser.add_argument('--pretty', action='store_true',
+                       help='Indent scraped_data.json for reading')
+    args = parser.parse_args()
+    
     # Example usage
     url = "https://www.newegg.com/amd-ryzen-7-9000-series-ryzen-7-9800x3d-granite-ridge-zen-5-socket-am5-desktop-cpu-processor/p/N82E16819113877"
     
@@ -553,9 +897,10 @@ if __name__ == "__main__":
     print(f"Total reviews: {result['metadata']['total_reviews']}")
     print(f"Review pages: {result['metadata']['total_review_pages']}")
     
-    # Save to JSON for inspection
-    with open("scraped_data.json", "w") as f:
-        json.dump(result, f, indent=2)
+    # Save the flattened reviews for DuckDB, and the full result for insert_from_json
+    review_count = write_reviews_jsonl(duckdb_data, "scraped_reviews.jsonl")
+    with open("scraped_data.json", "wb") as f:
+        f.write(orjson.dumps(result, option=orjson.OPT_INDENT_2 if args.pretty else 0))
     
-    print("\n💾 Data saved to scraped_data.json")
+    print(f"\n💾 {review_count} reviews saved to scraped_reviews.jsonl, full result to scraped_data.json")
     print("🦆 Data ready for DuckDB insertion!") 
\ No newline at end of file
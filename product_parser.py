@@ -0,0 +1,205 @@
+"""
+Product page parsing shared by the scrapers.
+
+Each field has a list of XPath fallbacks, translated from the original CSS
+selectors and compiled once at import. They are tried in priority order rather
+than as one union, because a union returns matches in document order and would
+let a lower-priority selector win (e.g. the bare ".price-current" text over its
+"strong" price).
+
+Review cells are parsed here too, so a review page snapshot can be read
+without asking the browser for each field.
+"""
+
+import re
+from typing import Dict, List, Tuple
+from lxml import etree, html as lxml_html
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching elements with a CSS class, like '.name' in a selector."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+# XPath equivalents of the CSS selector fallbacks, tried in order per field,
+# with the default used when none of them has text
+PRODUCT_XPATHS: Dict[str, Tuple[List[str], str]] = {
+    "title": ([
+        f"//h1[{_has_class('product-title')}]",
+        f"//*[{_has_class('product-title')}]",
+        "//h1",
+        "//*[@data-testid='product-title']"
+    ], "Title not found"),
+    "brand": ([
+        f"//div[{_has_class('product-breadcrumb')}]//a",
+        f"//*[{_has_class('breadcrumbs')}]//a[contains(@href, 'AMD')]",
+        f"//*[{_has_class('seller-store-link')}]//a",
+        "//a[contains(@href, 'AMD/BrandStore')]"
+    ], "Brand not found"),
+    "price": ([
+        f"//li[{_has_class('price-current')}]//strong",
+        f"//*[{_has_class('price-current')}]//strong",
+        f"//*[{_has_class('price-current')}]",
+        f"//span[{_has_class('price-current-label')}]/following-sibling::*[1][self::strong]"
+    ], "Price not found"),
+    "rating": ([
+        f"//i[{_has_class('rating')}]",
+        f"//span[{_has_class('rating')}]",
+        f"//*[{_has_class('product-rating')}]//i[{_has_class('rating')}]"
+    ], "No rating"),
+    "reviews_count": ([
+        f"//span[{_has_class('item-rating-num')}]",
+        f"//*[{_has_class('product-rating')}]//span[contains(@title, 'reviews')]",
+        f"//*[{_has_class('product-reviews')}]//span"
+    ], "0"),
+    "description": ([
+        f"//div[{_has_class('product-bullets')}]//ul",
+        f"//*[{_has_class('product-bullets')}]",
+        f"//ul[{_has_class('product-bullets')}]"
+    ], "Description not found"),
+}
+
+# Compiled once; each returns matches in document order
+_COMPILED_XPATHS = {
+    field: ([etree.XPath(xpath) for xpath in xpaths], default)
+    for field, (xpaths, default) in PRODUCT_XPATHS.items()
+}
+
+_ITEM_NUMBER_RE = re.compile(r'/p/([A-Z0-9]+)')
+
+def _element_text(element) -> str:
+    """Concatenate an element's stripped text nodes, like BeautifulSoup's get_text(strip=True)."""
+    return "".join(text.strip() for text in element.itertext())
+
+def _first_text(tree, xpaths: List[etree.XPath], default: str) -> str:
+    """Text of the first match of the first XPath that yields usable text."""
+    for xpath in xpaths:
+        matches = xpath(tree)
+        if matches:
+            text = _element_text(matches[0])
+            if text and text != "$":
+                return text
+    return default
+
+def _first_of(*steps: str) -> etree.XPath:
+    """First element in document order matching any of the relative steps, like locator(...).first."""
+    return etree.XPath("(" + " | ".join(f".//{step}" for step in steps) + ")[1]")
+
+# Review elements on a review page, and the fallbacks for each field inside one
+REVIEW_CELL_XPATH = etree.XPath(
+    f"//div[{_has_class('comments-cell')} and {_has_class('has-side-left')} and {_has_class('is-active')}]"
+)
+_REVIEW_FIELD_XPATHS = {
+    "title": _first_of(f"*[{_has_class('comments-title-content')}]", f"*[{_has_class('review-title')}]",
+                       f"*[{_has_class('comment-title')}]", "h3", "h4", f"*[{_has_class('title')}]"),
+    "rating": _first_of(f"*[{_has_class('rating')}]"),
+    "content": _first_of(f"*[{_has_class('comments-content')}]", f"*[{_has_class('review-content')}]",
+                         f"*[{_has_class('comment-content')}]", f"*[{_has_class('review-text')}]",
+                         f"*[{_has_class('content')}]", "p"),
+    "author": _first_of(f"*[{_has_class('comments-name')}]", f"*[{_has_class('review-author')}]",
+                        f"*[{_has_class('comment-author')}]", f"*[{_has_class('author')}]",
+                        f"*[{_has_class('user-name')}]", f"*[{_has_class('username')}]"),
+    "details": _first_of(f"*[{_has_class('comments-text')}]"),
+    "verified": _first_of(f"*[{_has_class('comments-verified-owner')}]"),
+    "ownership": _first_of(
+        f"*[{_has_class('comments-cell-side')}]//*[{_has_class('comments-text')} "
+        f"and not({_has_class('comments-verified-owner')})]"
+    ),
+}
+
+# Elements that start a new line in rendered text
+_BLOCK_TAGS = {'address', 'article', 'blockquote', 'dd', 'div', 'dl', 'dt', 'footer', 'h1', 'h2', 'h3',
+               'h4', 'h5', 'h6', 'header', 'li', 'ol', 'p', 'section', 'table', 'tr', 'ul'}
+
+def inner_text(element) -> str:
+    """
+    Approximate an element's rendered innerText.
+
+    Block elements and <br> break lines, runs of whitespace collapse to one space
+    and blank lines are dropped, so review sections stay on lines of their own.
+    """
+    parts: List[str] = []
+
+    def walk(node):
+        block = node.tag in _BLOCK_TAGS
+        if block or node.tag == 'br':
+            parts.append("\n")
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            if isinstance(child.tag, str) and child.tag not in ('script', 'style'):
+                walk(child)
+            if child.tail:
+                parts.append(child.tail)
+        if block:
+            parts.append("\n")
+
+    walk(element)
+    lines = (" ".join(line.split()) for line in "".join(parts).split("\n"))
+    return "\n".join(line for line in lines if line)
+
+def parse_review_fields(cell) -> Dict:
+    """
+    Read the raw fields of one review cell.
+
+    Args:
+        cell: Review element matched by REVIEW_CELL_XPATH
+
+    Returns:
+        Dictionary with title, content, author, details and ownership texts and the
+        rating element's class (each None when its element is missing), plus whether
+        the review is from a verified owner
+    """
+    found = {field: xpath(cell) for field, xpath in _REVIEW_FIELD_XPATHS.items()}
+    fields = {
+        field: inner_text(found[field][0]) if found[field] else None
+        for field in ("title", "content", "author", "details", "ownership")
+    }
+    fields["rating_class"] = (found["rating"][0].get("class") or "") if found["rating"] else None
+    fields["verified"] = bool(found["verified"])
+    return fields
+
+# Section labels at the start of a review content line, e.g. "Pros:" or "Overall Review:"
+SECTION_RE = re.compile(r'^\s*(pros|cons|overall(?:\s+review)?)\s*:\s*', re.IGNORECASE | re.MULTILINE)
+
+def parse_review_sections(content: str) -> Tuple[str, str, str]:
+    """Parse pros, cons, and overall review from review content."""
+    if not content:
+        return "Not specified", "Not specified", "Not specified"
+
+    # split() alternates [prelude, label, body, label, body, ...]; text before
+    # the first label is ignored and a repeated label keeps its last body
+    parts = SECTION_RE.split(content)
+    sections = {}
+    for label, body in zip(parts[1::2], parts[2::2]):
+        key = label.split()[0].lower()
+        sections[key] = " ".join(line.strip() for line in body.splitlines() if line.strip())
+
+    return (
+        sections.get('pros') or "Not specified",
+        sections.get('cons') or "Not specified",
+        sections.get('overall') or "Not specified"
+    )
+
+def extract_item_number(url: str) -> str:
+    """Extract item number from URL."""
+    match = _ITEM_NUMBER_RE.search(url)
+    return match.group(1) if match else "Unknown"
+
+def parse_product_html(page_html: str, url: str) -> Dict:
+    """
+    Parse product information from a Newegg product page.
+
+    Args:
+        page_html: Product page HTML
+        url: Final URL of the page
+
+    Returns:
+        Product info dictionary in the same shape the browser scrapers produce
+    """
+    tree = lxml_html.fromstring(page_html)
+    product_info = {
+        field: _first_text(tree, xpaths, default)
+        for field, (xpaths, default) in _COMPILED_XPATHS.items()
+    }
+    product_info["product_url"] = url
+    product_info["item_number"] = extract_item_number(url)
+    return product_info
@@ -7,9 +7,12 @@ Works with both local and Docker databases.
 import argparse
 import sys
 import os
-from duckdb_integration import NeweggDuckDB
 from config import Config
 
+# Rows formatted per write, so large results start printing at once and are never
+# formatted as one big string. Column widths are sized from the first chunk.
+PRINT_CHUNK_ROWS = 1000
+
 def print_dataframe(df, title: str):
     """Print a DataFrame with a title."""
     print(f"\n{title}")
@@ -20,8 +23,46 @@ def print_dataframe(df, title: str):
         print(df.to_string(index=False))
     print("=" * 80)
 
-def main():
-    """Main function for database queries."""
+def _fit(value: str, width: int) -> str:
+    """Pad a value to a column width, cutting it short with '…' if it is wider."""
+    if len(value) > width:
+        return value[:width - 1] + "…"
+    return value.rjust(width)
+
+def print_result(result, title: str):
+    """
+    Print a DuckDB query result with a title, without building a DataFrame.
+    
+    Args:
+        result: Connection or cursor holding an executed query
+        title: Heading printed above the rows
+    """
+    columns = [column[0] for column in result.description]
+    
+    print(f"\n{title}")
+    print("=" * 80)
+    widths = None
+    while True:
+        # Keep multi-line review text on one row, as DataFrame.to_string does
+        rows = [[str(value).replace("\n", "\\n") for value in row]
+                for row in result.fetchmany(PRINT_CHUNK_ROWS)]
+        if not rows:
+            break
+        
+        lines = []
+        if widths is None:
+            # Sized once, so later chunks stay lined up with the header
+            widths = [max(len(column), *(len(row[i]) for row in rows)) for i, column in enumerate(columns)]
+            lines.append(" ".join(column.rjust(width) for column, width in zip(columns, widths)))
+        lines += [" ".join(_fit(value, width) for value, width in zip(row, widths)) for row in rows]
+        sys.stdout.write("\n".join(lines) + "\n")
+    
+    if widths is None:
+        print("No data found.")
+    print("=" * 80)
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
     parser = argparse.ArgumentParser(description='Query Newegg DuckDB Database')
     
     parser.add_argument('--db-path', type=str,
@@ -54,8 +95,74 @@ def main():
     parser.add_argument('--docker', action='store_true',
                        help='Use Docker database path (/app/data/newegg_data.duckdb)')
     
+    return parser
+
+def handle_list_products(db, _):
+    """List all products in the database."""
+    products = db.get_product_summary()
+    print_dataframe(products, "📦 ALL PRODUCTS")
+
+def handle_product_summary(db, item_number: str):
+    """Print one product's summary."""
+    summary = db.get_product_summary(item_number)
+    print_dataframe(summary, f"📊 PRODUCT SUMMARY: {item_number}")
+
+def handle_reviews(db, item_number: str):
+    """Print a preview listing of a product's reviews."""
+    reviews = db.get_reviews(item_number)
+    try:
+        print_result(reviews, f"📝 REVIEWS: {item_number}")
+    finally:
+        reviews.close()
+
+def handle_rating_distribution(db, item_number: str):
+    """Print a product's rating distribution."""
+    ratings = db.get_rating_distribution(item_number)
+    print_dataframe(ratings, f"⭐ RATING DISTRIBUTION: {item_number}")
+
+def handle_search(db, value):
+    """Print reviews matching a search term."""
+    item_number, search_term = value
+    results = db.search_reviews(item_number, search_term)
+    print_dataframe(results, f"🔍 SEARCH RESULTS for '{search_term}' in {item_number}")
+
+def handle_recent_reviews(db, value):
+    """Print a product's most recent reviews."""
+    item_number, limit = value
+    recent = db.get_recent_reviews(item_number, int(limit))
+    print_dataframe(recent, f"🕒 RECENT REVIEWS: {item_number} (last {limit})")
+
+def handle_high_rated(db, value):
+    """Print a product's reviews at or above a rating."""
+    item_number, min_rating = value
+    high_rated = db.get_reviews_by_rating(item_number, int(min_rating))
+    print_dataframe(high_rated, f"🔥 HIGH-RATED REVIEWS: {item_number} ({min_rating}+ stars)")
+
+def handle_export_csv(db, item_number: str):
+    """Export a product's data to CSV files in the current directory."""
+    print(f"💾 Exporting data for {item_number}...")
+    db.export_to_csv(item_number, ".")
+    print("✅ Export completed!")
+
+# Query options and their handlers; the first option given on the command line wins
+DISPATCH = {
+    "list_products": handle_list_products,
+    "product_summary": handle_product_summary,
+    "reviews": handle_reviews,
+    "rating_distribution": handle_rating_distribution,
+    "search": handle_search,
+    "recent_reviews": handle_recent_reviews,
+    "high_rated": handle_high_rated,
+    "export_csv": handle_export_csv,
+}
+
+def main():
+    """Main function for database queries."""
+    parser = build_parser()
     args = parser.parse_args()
     
+    Config.setup_logging()
+    
     # Set database path
     if args.docker:
         # Use Docker path
@@ -71,6 +178,9 @@ def main():
         db_path = Config.DUCKDB_PATH
         print(f"🔧 Using database path: {db_path}")
     
+    # Imported here so --help doesn't pay for loading DuckDB and pandas
+    from duckdb_integration import NeweggDuckDB
+    
     # Initialize database
     try:
         db = NeweggDuckDB(db_path)
@@ -85,58 +195,11 @@ def main():
         sys.exit(1)
     
     try:
-        # List all products
-        if args.list_products:
-            products = db.get_product_summary()
-            print_dataframe(products, "📦 ALL PRODUCTS")
-        
-        # Product summary
-        elif args.product_summary:
-            summary = db.get_product_summary(args.product_summary)
-            print_dataframe(summary, f"📊 PRODUCT SUMMARY: {args.product_summary}")
-        
-        # Reviews
-        elif args.reviews:
-            reviews_query = """
-                SELECT title, rating, author, date, is_verified, 
-                       SUBSTR(full_content, 1, 200) as content_preview
-                FROM reviews 
-                WHERE product_item_number = ?
-                ORDER BY date DESC
-                LIMIT 20
-            """
-            reviews = db.conn.execute(reviews_query, [args.reviews]).df()
-            print_dataframe(reviews, f"📝 REVIEWS: {args.reviews}")
-        
-        # Rating distribution
-        elif args.rating_distribution:
-            ratings = db.get_rating_distribution(args.rating_distribution)
-            print_dataframe(ratings, f"⭐ RATING DISTRIBUTION: {args.rating_distribution}")
-        
-        # Search reviews
-        elif args.search:
-            item_number, search_term = args.search
-            results = db.search_reviews(item_number, search_term)
-            print_dataframe(results, f"🔍 SEARCH RESULTS for '{search_term}' in {item_number}")
-        
-        # Recent reviews
-        elif args.recent_reviews:
-            item_number, limit = args.recent_reviews
-            recent = db.get_recent_reviews(item_number, int(limit))
-            print_dataframe(recent, f"🕒 RECENT REVIEWS: {item_number} (last {limit})")
-        
-        # High-rated reviews
-        elif args.high_rated:
-            item_number, min_rating = args.high_rated
-            high_rated = db.get_reviews_by_rating(item_number, int(min_rating))
-            print_dataframe(high_rated, f"🔥 HIGH-RATED REVIEWS: {item_number} ({min_rating}+ stars)")
-        
-        # Export to CSV
-        elif args.export_csv:
-            print(f"💾 Exporting data for {args.export_csv}...")
-            db.export_to_csv(args.export_csv, ".")
-            print("✅ Export completed!")
-        
+        for name, handler in DISPATCH.items():
+            value = getattr(args, name)
+            if value:
+                handler(db, value)
+                break
         else:
             # No arguments provided, show help
             parser.print_help()
@@ -151,4 +214,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -1,10 +1,11 @@
 import time
 import random
 import asyncio
-from typing import Dict, Optional, Callable
+from typing import AsyncIterator, Dict, Optional, Callable, Tuple
 from dataclasses import dataclass
 from collections import deque
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 @dataclass
@@ -18,73 +19,121 @@ class RateLimitConfig:
     error_threshold: float = 0.1  # 10% error rate triggers backoff
     success_threshold: float = 0.9  # 90% success rate allows speedup
 
+class RollingWindow(deque):
+    """
+    Fixed-size window of recent values that keeps a running total.
+    
+    Adding a value subtracts the one it displaces, so the total and mean are
+    O(1) rather than a sum over the window on every read.
+    """
+    
+    def __init__(self, maxlen: int):
+        super().__init__(maxlen=maxlen)
+        self.total = 0
+    
+    def append(self, value):
+        if len(self) == self.maxlen:
+            self.total -= self[0]
+        super().append(value)
+        self.total += value
+    
+    def clear(self):
+        super().clear()
+        self.total = 0
+    
+    def mean(self) -> float:
+        """Mean of the window, or 0 when empty."""
+        return self.total / len(self) if self else 0
+
 class TokenBucketRateLimiter:
     """
     Token bucket rate limiter with adaptive behavior.
     Implements exponential backoff on errors and adaptive speedup on success.
+    
+    The bucket is kept as a single timestamp (GCRA): the theoretical arrival time
+    of the next request. Every token taken pushes it one interval further, and the
+    bucket is empty while it runs more than burst_size intervals ahead of now.
     """
     
     def __init__(self, config: RateLimitConfig):
         self.config = config
-        self.tokens = config.burst_size
-        self.last_refill = time.time()
+        self.tat = time.monotonic()  # starts with a full bucket
         self.refill_rate = config.requests_per_second
         
-        # Adaptive rate limiting
+        # Adaptive rate limiting, judged on the most recent outcomes only
         self.current_rate = config.requests_per_second
-        self.error_count = 0
-        self.success_count = 0
-        self.response_times = deque(maxlen=100)
-        self.error_times = deque(maxlen=100)
+        self.total_requests = 0
+        self.outcomes = RollingWindow(maxlen=200)  # True for success
+        self.response_times = RollingWindow(maxlen=100)  # seconds, most recent successes
+        
+        # Fixed adjustment bounds and factors, worked out once
+        self._rate_max = config.requests_per_second * 2.0
+        self._rate_min = config.requests_per_second * 0.1
+        self._speedup = 1.1
+        
+        # Window statistics, recomputed only after a request is recorded
+        self._stats_dirty = True
+        self._stats_cache: Dict = {}
         
         # Thread safety
         self.lock = threading.Lock()
     
-    def _refill_tokens(self):
-        """Refill tokens based on time elapsed."""
-        now = time.time()
-        time_passed = now - self.last_refill
-        tokens_to_add = time_passed * self.refill_rate
+    def _available_tokens(self) -> float:
+        """Tokens currently in the bucket, derived from the arrival timestamp."""
+        interval = 1 / self.refill_rate
+        backlog = max(0.0, self.tat - time.monotonic())
+        return max(0.0, self.config.burst_size - backlog / interval)
+    
+    def _try_acquire(self) -> float:
+        """
+        Take a token if one is available.
         
-        self.tokens = min(self.config.burst_size, self.tokens + tokens_to_add)
-        self.last_refill = now
+        Returns:
+            0 if a token was taken, otherwise the seconds until the next one is due
+        """
+        with self.lock:
+            now = time.monotonic()
+            interval = 1 / self.refill_rate
+            # Worked from the backlog so a full bucket gives exactly 0, rather than
+            # the rounding residue of subtracting now back out
+            backlog = max(0.0, self.tat - now)
+            wait = backlog - (self.config.burst_size - 1) * interval
+            if wait <= 0:
+                self.tat = now + backlog + interval
+                return 0.0
+            return wait
+    
+    def _next_wait(self, wait: float, deadline: Optional[float]) -> Optional[float]:
+        """Clamp a wait to the acquire deadline. Returns None once the deadline has passed."""
+        if deadline is None:
+            return wait
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        return min(wait, remaining)
     
     def _adaptive_adjustment(self, success: bool, response_time: float):
         """Adjust rate based on success/failure and response time."""
-        now = time.time()
-        
+        self.total_requests += 1
+        self._stats_dirty = True
+        self.outcomes.append(success)
         if success:
-            self.success_count += 1
-            self.response_times.append((now, response_time))
-            
-            # Calculate success rate
-            total_requests = self.success_count + self.error_count
-            if total_requests >= 10:
-                success_rate = self.success_count / total_requests
-                
-                if success_rate > self.config.success_threshold:
-                    # Speed up if consistently successful
-                    self.current_rate = min(
-                        self.current_rate * 1.1,
-                        self.config.requests_per_second * 2.0
-                    )
-                    self.refill_rate = self.current_rate
-        else:
-            self.error_count += 1
-            self.error_times.append(now)
-            
-            # Calculate error rate
-            total_requests = self.success_count + self.error_count
-            if total_requests >= 10:
-                error_rate = self.error_count / total_requests
-                
-                if error_rate > self.config.error_threshold:
-                    # Slow down on errors
-                    self.current_rate = max(
-                        self.current_rate * 0.5,
-                        self.config.requests_per_second * 0.1
-                    )
-                    self.refill_rate = self.current_rate
+            self.response_times.append(response_time)
+        
+        if len(self.outcomes) < 10:
+            return
+        
+        success_rate = self.outcomes.mean()
+        
+        if success and success_rate > self.config.success_threshold:
+            # Speed up if consistently successful
+            self.current_rate = min(self.current_rate * self._speedup, self._rate_max)
+            self.refill_rate = self.current_rate
+        elif not success and 1 - success_rate > self.config.error_threshold:
+            # Slow down on errors, by a random factor around half so workers
+            # sharing an error burst don't all settle on the same rate
+            self.current_rate = max(self.current_rate * random.uniform(0.3, 0.7), self._rate_min)
+            self.refill_rate = self.current_rate
     
     def acquire(self, timeout: Optional[float] = None) -> bool:
         """
@@ -96,44 +145,68 @@ class TokenBucketRateLimiter:
         Returns:
             True if token acquired, False if timeout
         """
-        start_time = time.time()
+        deadline = time.monotonic() + timeout if timeout else None
         
         while True:
-            with self.lock:
-                self._refill_tokens()
-                
-                if self.tokens >= 1:
-                    self.tokens -= 1
-                    return True
-                
-                if timeout and (time.time() - start_time) > timeout:
-                    return False
+            wait = self._try_acquire()
+            if not wait:
+                return True
             
-            # Wait before trying again
-            time.sleep(0.1)
+            # Sleep until the next token is due rather than polling for it
+            wait = self._next_wait(wait, deadline)
+            if wait is None:
+                return False
+            time.sleep(wait)
+    
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """
+        Acquire a token without blocking the event loop.
+        
+        Args:
+            timeout: Maximum time to wait for a token
+            
+        Returns:
+            True if token acquired, False if timeout
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        
+        while True:
+            wait = self._try_acquire()
+            if not wait:
+                return True
+            
+            wait = self._next_wait(wait, deadline)
+            if wait is None:
+                return False
+            await asyncio.sleep(wait)
     
     def record_request(self, success: bool, response_time: float):
         """Record the result of a request for adaptive rate limiting."""
         if self.config.adaptive:
-            self._adaptive_adjustment(success, response_time)
+            with self.lock:
+                self._adaptive_adjustment(success, response_time)
     
     def get_stats(self) -> Dict:
         """Get current rate limiter statistics."""
-        total_requests = self.success_count + self.error_count
-        success_rate = self.success_count / total_requests if total_requests > 0 else 0
-        error_rate = self.error_count / total_requests if total_requests > 0 else 0
-        
-        avg_response_time = 0
-        if self.response_times:
-            avg_response_time = sum(time for _, time in self.response_times) / len(self.response_times)
+        with self.lock:
+            if self._stats_dirty:
+                # Rates cover the recent outcome window, like the adaptive adjustment
+                success_rate = self.outcomes.mean()
+                error_rate = 1 - success_rate if self.outcomes else 0
+                
+                self._stats_cache = {
+                    'total_requests': self.total_requests,
+                    'success_rate': success_rate,
+                    'error_rate': error_rate,
+                    'avg_response_time': self.response_times.mean()
+                }
+                self._stats_dirty = False
+            stats = self._stats_cache
         
         return {
             'current_rate': self.current_rate,
-            'tokens_available': self.tokens,
-            'total_requests': total_requests,
-            'success_rate': success_rate,
-            'error_rate': error_rate,
-            'avg_response_time': avg_response_time
+            'tokens_available': self._available_tokens(),
+            **stats
         }
 
 class ConcurrentScraper:
@@ -142,72 +215,133 @@ class ConcurrentScraper:
     Manages multiple scrapers with proper resource management.
     """
     
-    def __init__(self, max_workers: int = 3, rate_limit_config: Optional[RateLimitConfig] = None):
+    def __init__(self, max_workers: int = 3, rate_limit_config: Optional[RateLimitConfig] = None,
+                 result_cache=None, max_review_pages: Optional[int] = None):
         """
         Initialize concurrent scraper.
         
         Args:
             max_workers: Maximum number of concurrent scrapers
             rate_limit_config: Rate limiting configuration
+            result_cache: The scrapers' result cache (e.g. get_result_cache("basic_results")
+                for NeweggScraper), checked before a URL takes a worker. None to skip it.
+            max_review_pages: Review page limit passed to scrape_product and used as the cache key
         """
         self.max_workers = max_workers
+        self.result_cache = result_cache
+        self.max_review_pages = max_review_pages
         self.rate_limiter = TokenBucketRateLimiter(rate_limit_config or RateLimitConfig())
         self.semaphore = asyncio.Semaphore(max_workers)
+        # Sized to the concurrency limit and kept apart from the loop's default executor
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scrape")
+        # One scraper per executor thread, factory and kwargs, reused across URLs.
+        # Browser scrapers are bound to the thread that first used them, so they are
+        # pooled per thread rather than handed between threads.
+        self._thread_scrapers = threading.local()
         self.active_tasks = set()
         self.results = []
         self.errors = []
+        self.completed = 0
     
-    async def scrape_products(self, urls: list, scraper_factory: Callable, **kwargs):
+    async def iter_products(self, urls: list, scraper_factory: Callable,
+                            **kwargs) -> AsyncIterator[Tuple[int, Dict]]:
         """
-        Scrape multiple products concurrently.
+        Scrape multiple products concurrently, yielding each result as it finishes.
+        
+        Callers can store every result as it arrives rather than holding the whole
+        batch. Failures are recorded in self.errors and not yielded. Leaving the
+        loop early cancels the scrapes still waiting for a worker.
         
         Args:
             urls: List of product URLs to scrape
             scraper_factory: Function that creates a scraper instance
             **kwargs: Additional arguments for the scraper
         
-        Returns:
-            List of scraping results
+        Yields:
+            (index into urls, scraping result) in completion order
         """
+        # Counts and errors describe the latest call, so a long-lived scraper doesn't grow them forever
+        self.completed = 0
+        self.errors = []
+        
+        # Recently scraped URLs are answered from the result cache without taking
+        # a rate limiter token or a worker
+        cached = []
         tasks = []
         
-        for url in urls:
+        for i, url in enumerate(urls):
+            result = self.result_cache.get(url, self.max_review_pages) if self.result_cache is not None else None
+            if result is not None:
+                cached.append((i, result))
+                continue
+            
             task = asyncio.create_task(
-                self._scrape_single_product(url, scraper_factory, **kwargs)
+                self._scrape_indexed(i, url, scraper_factory, **kwargs)
             )
             tasks.append(task)
             self.active_tasks.add(task)
+            task.add_done_callback(self.active_tasks.discard)
         
-        # Wait for all tasks to complete
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            # Scrapes are already running while the cached results are handed over
+            for i, result in cached:
+                self.completed += 1
+                yield i, result
+            
+            # Hand results over in the order they finish
+            for future in asyncio.as_completed(tasks):
+                i, result = await future
+                if isinstance(result, Exception):
+                    self.errors.append({
+                        'url': urls[i],
+                        'error': str(result),
+                        'timestamp': datetime.now().isoformat()
+                    })
+                    continue
+                
+                self.completed += 1
+                yield i, result
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def scrape_products(self, urls: list, scraper_factory: Callable, **kwargs):
+        """
+        Scrape multiple products concurrently.
         
-        # Process results
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                self.errors.append({
-                    'url': urls[i],
-                    'error': str(result),
-                    'timestamp': datetime.now().isoformat()
-                })
-            else:
-                self.results.append(result)
+        Args:
+            urls: List of product URLs to scrape
+            scraper_factory: Function that creates a scraper instance
+            **kwargs: Additional arguments for the scraper
+        
+        Returns:
+            List of scraping results for this call, in input order (failures are recorded in self.errors)
+        """
+        results = [None] * len(urls)
+        async for i, result in self.iter_products(urls, scraper_factory, **kwargs):
+            results[i] = result
         
+        self.results = [result for result in results if result is not None]
         return self.results
     
+    async def _scrape_indexed(self, index: int, url: str, scraper_factory: Callable, **kwargs) -> Tuple[int, object]:
+        """Scrape a product, returning its index with the result or the exception it raised."""
+        try:
+            return index, await self._scrape_single_product(url, scraper_factory, **kwargs)
+        except Exception as e:
+            return index, e
+    
     async def _scrape_single_product(self, url: str, scraper_factory: Callable, **kwargs):
         """Scrape a single product with rate limiting."""
         async with self.semaphore:
             # Wait for rate limiter
-            while not self.rate_limiter.acquire(timeout=1.0):
-                await asyncio.sleep(0.1)
+            await self.rate_limiter.acquire_async()
             
-            start_time = time.time()
+            start_time = time.monotonic()
             success = False
             
             try:
-                # Create scraper and scrape
-                scraper = scraper_factory(**kwargs)
-                result = await self._run_scraper(scraper, url)
+                result = await self._run_scraper(scraper_factory, kwargs, url)
                 success = True
                 return result
                 
@@ -215,18 +349,72 @@ class ConcurrentScraper:
                 success = False
                 raise e
             finally:
-                response_time = time.time() - start_time
+                response_time = time.monotonic() - start_time
                 self.rate_limiter.record_request(success, response_time)
     
-    async def _run_scraper(self, scraper, url: str):
+    def _thread_scraper(self, scraper_factory: Callable, kwargs: Dict):
+        """Get the calling executor thread's scraper for a factory and kwargs, creating it on first use."""
+        scrapers = getattr(self._thread_scrapers, 'scrapers', None)
+        if scrapers is None:
+            scrapers = self._thread_scrapers.scrapers = {}
+        
+        # kwargs may hold unhashable settings such as a RateLimitConfig, so they are keyed by repr
+        key = (scraper_factory, repr(sorted(kwargs.items())))
+        scraper = scrapers.get(key)
+        if scraper is None:
+            scraper = scrapers[key] = scraper_factory(**kwargs)
+        return scraper
+    
+    def _scrape_in_thread(self, scraper_factory: Callable, kwargs: Dict, url: str):
+        """Scrape a URL with this thread's pooled scraper."""
+        return self._thread_scraper(scraper_factory, kwargs).scrape_product(url, self.max_review_pages)
+    
+    def _close_thread_scrapers(self, barrier: threading.Barrier):
+        """
+        Close the calling executor thread's scrapers and its shared browser.
+        
+        Every worker thread runs this once: the barrier holds each job until all
+        of them have started, so no thread can pick up a second one.
+        """
+        barrier.wait()
+        scrapers = getattr(self._thread_scrapers, 'scrapers', None)
+        if not scrapers:
+            return
+        
+        for scraper in scrapers.values():
+            exit_scraper = getattr(scraper, '__exit__', None)
+            if exit_scraper is not None:
+                try:
+                    exit_scraper(None, None, None)
+                except Exception:
+                    pass
+        scrapers.clear()
+        
+        # Imported here so the rate limiter itself doesn't need Playwright
+        from browser_pool import shutdown_browser
+        shutdown_browser()
+    
+    async def _run_scraper(self, scraper_factory: Callable, kwargs: Dict, url: str):
         """Run the scraper in a thread pool to avoid blocking."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, scraper.scrape_product, url)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self._scrape_in_thread, scraper_factory, kwargs, url)
+    
+    async def aclose(self):
+        """Close the pooled scrapers and their browsers, then shut down the scraper threads."""
+        # One job per possible worker thread; a blocked job keeps its thread busy, so
+        # the executor hands each of them to a different thread
+        barrier = threading.Barrier(self.max_workers)
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(self.executor, self._close_thread_scrapers, barrier)
+            for _ in range(self.max_workers)
+        ))
+        await asyncio.to_thread(self.executor.shutdown, wait=True)
     
     def get_stats(self) -> Dict:
         """Get scraping statistics."""
         return {
-            'total_results': len(self.results),
+            'total_results': self.completed,
             'total_errors': len(self.errors),
             'active_tasks': len(self.active_tasks),
             'rate_limiter_stats': self.rate_limiter.get_stats()
@@ -241,9 +429,11 @@ class AdaptiveDelay:
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.current_delay = base_delay
-        self.response_times = deque(maxlen=50)
+        self.response_times = RollingWindow(maxlen=50)
         self.error_count = 0
         self.success_count = 0
+        self.attempt = 0  # consecutive errors
+        self._rand = random.random  # bound once, calculate_delay runs per request
     
     def calculate_delay(self, last_response_time: Optional[float] = None, 
                        had_error: bool = False) -> float:
@@ -259,16 +449,20 @@ class AdaptiveDelay:
         """
         if had_error:
             self.error_count += 1
-            # Exponential backoff on errors
-            self.current_delay = min(self.current_delay * 1.5, self.max_delay)
+            self.attempt += 1
+            # Exponential backoff with full jitter: anywhere from no wait up to the
+            # capped backoff, so workers that failed together retry apart
+            self.current_delay = min(self.max_delay, self.base_delay * (2 ** self.attempt))
+            return self._rand() * self.current_delay
         else:
             self.success_count += 1
+            self.attempt = 0
             if last_response_time:
                 self.response_times.append(last_response_time)
             
             # Adjust based on response times
             if len(self.response_times) >= 10:
-                avg_response_time = sum(self.response_times) / len(self.response_times)
+                avg_response_time = self.response_times.mean()
                 
                 if avg_response_time < 1.0:  # Fast responses
                     self.current_delay = max(self.current_delay * 0.9, self.base_delay * 0.5)
@@ -276,7 +470,7 @@ class AdaptiveDelay:
                     self.current_delay = min(self.current_delay * 1.2, self.max_delay)
         
         # Add some randomness to avoid patterns
-        jitter = random.uniform(0.8, 1.2)
+        jitter = 0.8 + 0.4 * self._rand()
         return self.current_delay * jitter
     
     def reset(self):
@@ -284,4 +478,5 @@ class AdaptiveDelay:
         self.current_delay = self.base_delay
         self.response_times.clear()
         self.error_count = 0
-        self.success_count = 0 
\ No newline at end of file
+        self.success_count = 0
+        self.attempt = 0 
\ No newline at end of file
@@ -0,0 +1,102 @@
+"""
+On-disk cache of scrape results.
+
+Re-scraping the same product within the TTL is served from a small SQLite file
+instead of a browser session. Results are keyed by URL and review page limit,
+since a result scraped with fewer pages can't stand in for a deeper scrape.
+"""
+
+import orjson
+import os
+import sqlite3
+import time
+from typing import Dict, Optional
+from config import Config
+
+class ResultCache:
+    """SQLite-backed (url, max_review_pages) -> scrape result cache with a TTL."""
+
+    def __init__(self, cache_dir: Optional[str] = None, ttl: Optional[float] = None,
+                 name: str = "results"):
+        """
+        Initialize the cache, creating its database file if needed.
+
+        Args:
+            cache_dir: Directory for the cache file (defaults to Config.CACHE_DIR)
+            ttl: Seconds a result stays valid (defaults to Config.CACHE_TTL)
+            name: Cache file name. Scrapers whose results differ in shape use separate files.
+        """
+        cache_dir = cache_dir or Config.CACHE_DIR
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, f"{name}.sqlite")
+        self.ttl = Config.CACHE_TTL if ttl is None else ttl
+
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS results (
+                    key TEXT PRIMARY KEY,
+                    stored_at REAL NOT NULL,
+                    result BLOB NOT NULL
+                )
+            """)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a short-lived connection, so the cache can be used from any thread."""
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def _key(url: str, max_review_pages: Optional[int]) -> str:
+        """Cache key for a URL and page limit."""
+        return f"{max_review_pages or 'all'} {url}"
+
+    def get(self, url: str, max_review_pages: Optional[int] = None) -> Optional[Dict]:
+        """
+        Get a cached result that is still within the TTL.
+
+        Args:
+            url: Product URL
+            max_review_pages: Review page limit the result was scraped with
+
+        Returns:
+            Cached scrape result, or None on a miss or expired entry
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT stored_at, result FROM results WHERE key = ?",
+                (self._key(url, max_review_pages),)
+            ).fetchone()
+
+        if row is None or time.time() - row[0] > self.ttl:
+            return None
+        return orjson.loads(row[1])
+
+    def set(self, url: str, max_review_pages: Optional[int], result: Dict):
+        """
+        Store a scrape result.
+
+        Args:
+            url: Product URL
+            max_review_pages: Review page limit the result was scraped with
+            result: Scrape result to cache
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO results (key, stored_at, result) VALUES (?, ?, ?)",
+                (self._key(url, max_review_pages), time.time(), orjson.dumps(result))
+            )
+
+_caches: Dict[str, ResultCache] = {}
+
+def get_result_cache(name: str = "results") -> Optional[ResultCache]:
+    """
+    Get a process-wide result cache, or None when Config.CACHE_ENABLED is off.
+
+    Args:
+        name: Cache file name, see ResultCache
+    """
+    if not Config.CACHE_ENABLED:
+        return None
+    cache = _caches.get(name)
+    if cache is None:
+        cache = _caches[name] = ResultCache(name=name)
+    return cache
@@ -0,0 +1,246 @@
+"""
+Direct access to Newegg's review API.
+
+The product page loads each review page through a request to api/ProductReview.
+The browser scrapers capture that request once and replay it with aiohttp for
+the remaining pages instead of clicking through the pagination. The payload
+format is undocumented, so parsing is best effort and callers fall back to the
+browser when it yields nothing.
+"""
+
+import aiohttp
+import asyncio
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# URLs of review API requests, for routing them without seeing every other request
+REVIEW_API_PATTERN = re.compile(r'api/ProductReview')
+
+# Request fields holding the review page number, e.g. PageIndex or PageNumber
+_PAGE_KEY_RE = re.compile(r'^page(?:index|number)?$', re.IGNORECASE)
+
+# Headers aiohttp computes itself; brotli is only decodable with the optional brotli package
+_SKIPPED_HEADERS = {'host', 'content-length', 'accept-encoding', 'cookie'}
+
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})')
+_US_DATE_RE = re.compile(r'(\d{1,2}/\d{1,2}/\d{4})')
+
+def _set_page(payload: Dict, page_number: int) -> bool:
+    """Set the page number field anywhere in a request payload. Returns whether one was found."""
+    found = False
+    for key, value in payload.items():
+        if isinstance(value, dict):
+            found = _set_page(value, page_number) or found
+        elif _PAGE_KEY_RE.match(key) and isinstance(value, int):
+            payload[key] = page_number
+            found = True
+    return found
+
+@dataclass
+class CapturedReviewRequest:
+    """A review API request seen in the browser, replayable for other pages."""
+    url: str
+    method: str
+    headers: Dict[str, str]
+    post_data: Optional[str]
+
+    @classmethod
+    def from_request(cls, request, headers: Dict[str, str]) -> "CapturedReviewRequest":
+        """
+        Capture a Playwright request.
+
+        Args:
+            request: Playwright Request for the review API
+            headers: Headers the request was sent with
+        """
+        return cls.from_parts(request.url, request.method, headers, request.post_data)
+
+    @classmethod
+    def from_parts(cls, url: str, method: str, headers: Dict[str, str],
+                   post_data: Optional[str]) -> "CapturedReviewRequest":
+        """
+        Capture a request from its parts, e.g. a CDP Fetch.requestPaused event.
+
+        Args:
+            url: Request URL
+            method: HTTP method
+            headers: Headers the request was sent with
+            post_data: Request body, if any
+        """
+        kept = {
+            name: value for name, value in headers.items()
+            if not name.startswith(':') and name.lower() not in _SKIPPED_HEADERS
+        }
+        return cls(url, method, kept, post_data)
+
+    def for_page(self, page_number: int) -> Tuple[str, Optional[str]]:
+        """
+        Build the URL and body requesting another review page.
+
+        The page number may sit in a JSON body, in a JSON-encoded query value
+        (Newegg sends reviewRequestStr={...}) or in a plain query parameter.
+
+        Raises:
+            ValueError: If no page number field can be found
+        """
+        if self.post_data:
+            try:
+                body = json.loads(self.post_data)
+            except ValueError:
+                body = None
+            if isinstance(body, dict) and _set_page(body, page_number):
+                return self.url, json.dumps(body)
+
+        parts = urlsplit(self.url)
+        query = []
+        found = False
+        for key, value in parse_qsl(parts.query, keep_blank_values=True):
+            if _PAGE_KEY_RE.match(key):
+                value = str(page_number)
+                found = True
+            elif value.startswith('{'):
+                try:
+                    payload = json.loads(value)
+                except ValueError:
+                    payload = None
+                if isinstance(payload, dict) and _set_page(payload, page_number):
+                    value = json.dumps(payload, separators=(',', ':'))
+                    found = True
+            query.append((key, value))
+
+        if not found:
+            raise ValueError("No page number field in the captured review request")
+        return urlunsplit(parts._replace(query=urlencode(query))), self.post_data
+
+def _find_review_list(payload) -> List[Dict]:
+    """Find the first list of review-like objects (having Title and Rating) in a payload."""
+    if isinstance(payload, list):
+        if payload and all(isinstance(item, dict) for item in payload) \
+                and 'Title' in payload[0] and 'Rating' in payload[0]:
+            return payload
+        items = payload
+    elif isinstance(payload, dict):
+        items = payload.values()
+    else:
+        return []
+
+    for item in items:
+        found = _find_review_list(item)
+        if found:
+            return found
+    return []
+
+def _first(review: Dict, keys: Iterable[str]):
+    """Value of the first present, non-empty key."""
+    for key in keys:
+        value = review.get(key)
+        if value not in (None, ''):
+            return value
+    return None
+
+def _format_date(value) -> str:
+    """Normalize an API date to the m/d/yyyy form shown on the page."""
+    if not value:
+        return "N/A"
+    text = str(value)
+    match = _US_DATE_RE.search(text)
+    if match:
+        return match.group(1)
+    match = _ISO_DATE_RE.search(text)
+    if match:
+        year, month, day = match.groups()
+        return f"{int(month)}/{int(day)}/{year}"
+    return "N/A"
+
+def parse_review_payload(payload, page_number: int) -> List[Dict]:
+    """
+    Map a review API response onto the scrapers' review records.
+
+    Args:
+        payload: Decoded JSON response
+        page_number: Review page the response belongs to
+
+    Returns:
+        Review dictionaries shaped like the browser scrapers' output (empty if none were recognized)
+    """
+    reviews = []
+    timestamp = datetime.now().isoformat()
+    for index, review in enumerate(_find_review_list(payload), start=1):
+        rating = _first(review, ('Rating',))
+        pros = _first(review, ('Pros',)) or ""
+        cons = _first(review, ('Cons',)) or ""
+        overall = _first(review, ('Comments', 'OverallReview', 'Content')) or ""
+        content = "\n".join(
+            f"{label}: {text}" for label, text in
+            (("Pros", pros), ("Cons", cons), ("Overall Review", overall)) if text
+        )
+
+        reviews.append({
+            "review_id": f"page_{page_number}_review_{index}",
+            "page_number": page_number,
+            "review_index": index,
+            "title": _first(review, ('Title',)) or f"Review {index}",
+            "rating": f"{int(rating)}/5" if str(rating).isdigit() else "N/A",
+            "author": _first(review, ('DisplayName', 'NickName', 'LoginNickName')) or "Anonymous",
+            "date": _format_date(_first(review, ('InDate', 'PublishDate', 'ReviewDate', 'EditDate'))),
+            "is_verified": bool(_first(review, ('IsVerifiedOwner', 'VerifiedOwner', 'IsBuyer', 'PurchaseVerified'))),
+            "ownership": str(_first(review, ('Ownership', 'OwnershipPeriod', 'LengthOfOwnership')) or "N/A"),
+            "pros": pros or "Not specified",
+            "cons": cons or "Not specified",
+            "overall_review": overall or "Not specified",
+            "full_content": content or "No content found",
+            "timestamp": timestamp
+        })
+    return reviews
+
+async def fetch_review_pages(captured: CapturedReviewRequest, page_numbers: List[int],
+                             cookies: Optional[str] = None, concurrency: int = 4,
+                             before_request: Optional[Callable[[], object]] = None) -> Dict[int, List[Dict]]:
+    """
+    Fetch and parse several review pages concurrently.
+
+    Args:
+        captured: Review API request captured from the browser
+        page_numbers: Pages to fetch
+        cookies: Cookie header from the browser context
+        concurrency: Maximum requests in flight
+        before_request: Blocking call run (in a worker thread) before each request, e.g. a rate limiter acquire
+
+    Returns:
+        Parsed reviews keyed by page number
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    headers = dict(captured.headers)
+    if cookies:
+        headers['Cookie'] = cookies
+
+    async with aiohttp.ClientSession(headers=headers, timeout=aiohttp.ClientTimeout(total=60)) as session:
+        async def fetch(page_number: int) -> Tuple[int, List[Dict]]:
+            async with semaphore:
+                if before_request is not None:
+                    await asyncio.to_thread(before_request)
+                url, body = captured.for_page(page_number)
+                async with session.request(captured.method, url, data=body) as response:
+                    response.raise_for_status()
+                    payload = await response.json(content_type=None)
+            return page_number, parse_review_payload(payload, page_number)
+
+        pages = await asyncio.gather(*(fetch(page_number) for page_number in page_numbers))
+
+    return dict(pages)
+
+def fetch_reviews(captured: CapturedReviewRequest, page_numbers: List[int], **kwargs) -> Dict[int, List[Dict]]:
+    """
+    Blocking wrapper around fetch_review_pages for the sync scrapers.
+
+    Playwright's sync API marks its own event loop as running in the thread that
+    drives it, so asyncio.run() can't be called there. The fetch runs on a fresh
+    loop in a helper thread instead.
+    """
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="review-api") as executor:
+        return executor.submit(asyncio.run, fetch_review_pages(captured, page_numbers, **kwargs)).result()
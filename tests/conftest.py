@@ -0,0 +1,128 @@
+"""Shared fixtures for the scraper tests."""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+from datetime import datetime
+
+import pytest
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def review_payload(page_number: int, per_page: int = 2) -> dict:
+    """A review API response shaped like Newegg's, nested a level deep."""
+    return {
+        "Summary": {"TotalCount": per_page * 3},
+        "SearchResult": {
+            "CustomerReviewList": [
+                {
+                    "Title": f"Page {page_number} review {index}",
+                    "Rating": 5 - index,
+                    "Pros": "Fast",
+                    "Cons": "",
+                    "Comments": "Works well",
+                    "DisplayName": f"user{index}",
+                    "InDate": "2024-03-07T10:00:00",
+                    "IsVerifiedOwner": index == 1,
+                    "Ownership": "1 month",
+                }
+                for index in range(1, per_page + 1)
+            ]
+        },
+    }
+
+def scraped_result(item_number: str = "N82E16819113877", pages: int = 2, per_page: int = 3) -> dict:
+    """A scrape result shaped like scrape_product's output."""
+    url = f"https://www.newegg.com/p/{item_number}"
+    reviews = [
+        [
+            {
+                "review_id": f"page_{page}_review_{index}",
+                "page_number": page,
+                "review_index": index,
+                "title": f"Review {page}-{index}",
+                "rating": "N/A" if index == 3 else f"{index + 2}/5",
+                "author": "bob",
+                "date": "1/5/2024",
+                "is_verified": index % 2 == 0,
+                "ownership": "1 month",
+                "pros": "fast",
+                "cons": "hot",
+                "overall_review": "good",
+                "full_content": "Pros: fast\nCons: hot\nOverall Review: good",
+                "timestamp": "2024-01-05T12:00:00",
+            }
+            for index in range(1, per_page + 1)
+        ]
+        for page in range(1, pages + 1)
+    ]
+    return {
+        "product": {
+            "title": "AMD Ryzen 7 9800X3D", "brand": "AMD", "price": "$479.00", "rating": "4.8",
+            "reviews_count": "(1,234)", "description": "CPU", "product_url": url,
+            "item_number": item_number,
+        },
+        "reviews": reviews,
+        "metadata": {
+            "product_url": url, "scraped_at": datetime(2024, 1, 5, 12).isoformat(),
+            "total_review_pages": pages, "total_reviews": pages * per_page, "scraper_version": "2.0",
+        },
+    }
+
+class StubReviewServer:
+    """Local aiohttp server answering api/ProductReview with canned pages."""
+
+    def __init__(self):
+        self.requests = []
+        self._loop = asyncio.new_event_loop()
+        self._runner = None
+        self.port = None
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        payload = json.loads(request.query["reviewRequestStr"])
+        self.requests.append({"page": payload["PageIndex"], "cookie": request.headers.get("Cookie")})
+        return web.json_response(review_payload(payload["PageIndex"]))
+
+    async def _start(self):
+        app = web.Application()
+        app.router.add_get("/product/api/ProductReview", self._handle)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+
+    def start(self):
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result(timeout=10)
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result(timeout=10)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def url(self, page_number: int = 1) -> str:
+        query = json.dumps({"ItemNumber": "19-113-877", "PageIndex": page_number})
+        return f"http://127.0.0.1:{self.port}/product/api/ProductReview?reviewRequestStr={query}"
+
+@pytest.fixture
+def review_server():
+    server = StubReviewServer()
+    server.start()
+    yield server
+    server.stop()
+
+@pytest.fixture
+def sync_playwright_session():
+    """A started sync Playwright driver, which leaves a running event loop in this thread."""
+    sync_api = pytest.importorskip("playwright.sync_api")
+    try:
+        playwright = sync_api.sync_playwright().start()
+    except Exception as e:
+        pytest.skip(f"Playwright driver unavailable: {e}")
+    # A round trip through the driver, as any page call would make
+    assert "iPhone 13" in playwright.devices
+    yield playwright
+    playwright.stop()
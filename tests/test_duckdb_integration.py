@@ -0,0 +1,136 @@
+import pytest
+
+from duckdb_integration import NeweggDuckDB, close_pooled_connections
+from conftest import scraped_result
+
+ITEM = "N82E16819113877"
+
+@pytest.fixture
+def db():
+    database = NeweggDuckDB(":memory:")
+    yield database
+    database.close()
+
+def _reviews(db, item_number=ITEM):
+    return db.conn.execute(
+        "SELECT review_id, rating, rating_int, title FROM reviews "
+        "WHERE product_item_number = ? ORDER BY page_number, review_index", [item_number]
+    ).fetchall()
+
+def test_append_reviews_batch_writes_one_page(db):
+    result = scraped_result(pages=2, per_page=3)
+
+    db.append_reviews_batch(result["product"], result["metadata"]["scraped_at"], result["reviews"][0])
+
+    rows = _reviews(db)
+    assert [row[0] for row in rows] == [f"{ITEM}:page_1_review_{index}" for index in (1, 2, 3)]
+    assert [row[2] for row in rows] == [3, 4, None]
+    assert db.conn.execute("SELECT price_value, reviews_count_value FROM products").fetchall() == [(479.0, 1234)]
+
+def test_append_reviews_batch_upserts_existing_reviews(db):
+    result = scraped_result(pages=1, per_page=2)
+    product, scraped_at, page = result["product"], result["metadata"]["scraped_at"], result["reviews"][0]
+
+    db.append_reviews_batch(product, scraped_at, page)
+    page[0]["title"] = "Edited"
+    page[0]["rating"] = "1/5"
+    db.append_reviews_batch(product, scraped_at, page)
+
+    rows = _reviews(db)
+    assert len(rows) == 2
+    assert rows[0][1:] == ("1/5", 1, "Edited")
+
+def test_insert_scraped_data_after_streamed_pages(db):
+    result = scraped_result(pages=2, per_page=3)
+    for page in result["reviews"]:
+        db.append_reviews_batch(result["product"], result["metadata"]["scraped_at"], page)
+
+    db.insert_scraped_data({**result, "reviews": []})
+    db.insert_scraped_data(result)
+
+    assert len(_reviews(db)) == 6
+    summary = db.get_product_summary(ITEM)
+    assert summary["actual_reviews"].tolist() == [6]
+    assert db.conn.execute("SELECT total_reviews FROM scraping_metadata").fetchall() == [(6,)]
+
+def test_products_are_kept_apart(db):
+    db.insert_scraped_data(scraped_result())
+    db.insert_scraped_data(scraped_result("N82E16819113878", pages=1))
+
+    assert len(_reviews(db)) == 6
+    assert len(_reviews(db, "N82E16819113878")) == 3
+
+def test_transaction_rolls_back_on_error(db):
+    result = scraped_result(pages=1)
+
+    with pytest.raises(RuntimeError):
+        with db.transaction() as conn:
+            db.insert_scraped_data(result, conn)
+            raise RuntimeError("abort")
+
+    assert _reviews(db) == []
+    assert db.conn.execute("SELECT COUNT(*) FROM products").fetchone() == (0,)
+
+def test_insert_from_json_matches_insert_scraped_data(db, tmp_path):
+    path = tmp_path / "scraped_data.json"
+    path.write_bytes(__import__("orjson").dumps(scraped_result()))
+
+    db.insert_from_json(str(path))
+
+    assert [row[2] for row in _reviews(db)] == [3, 4, None, 3, 4, None]
+
+def test_fts_index_is_rebuilt_once_per_change(db, monkeypatch):
+    rebuilds = []
+    monkeypatch.setattr(db, "_rebuild_fts_index", lambda: rebuilds.append(1))
+    monkeypatch.setattr(db, "_has_fts_index", lambda: bool(rebuilds))
+
+    # Inserts leave the index alone, however many products a batch holds
+    db.insert_scraped_data(scraped_result())
+    db.insert_scraped_data(scraped_result("N82E16819113878", pages=1))
+    assert rebuilds == []
+
+    db._ensure_fts_index()
+    db._ensure_fts_index()
+    assert len(rebuilds) == 1
+
+    result = scraped_result(pages=1)
+    result["metadata"]["scraped_at"] = "2024-02-01T00:00:00"
+    db.insert_scraped_data(result)
+    db._ensure_fts_index()
+    assert len(rebuilds) == 2
+
+def test_get_reviews_result_survives_other_queries(db):
+    db.insert_scraped_data(scraped_result(pages=1, per_page=2))
+
+    reviews = db.get_reviews(ITEM)
+    db.conn.execute("SELECT 42").fetchall()
+
+    try:
+        assert sorted(row[0] for row in reviews.fetchall()) == ["Review 1-1", "Review 1-2"]
+        assert [column[0] for column in reviews.description][:2] == ["title", "rating"]
+    finally:
+        reviews.close()
+
+def test_query_cache_is_shared_by_instances_on_a_pooled_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(NeweggDuckDB, "_fts_install_failed", True)
+    path = str(tmp_path / "shared.duckdb")
+    a, b = NeweggDuckDB(path), NeweggDuckDB(path)
+    try:
+        a.insert_scraped_data(scraped_result())
+        assert len(a.get_product_summary()) == 1
+
+        b.insert_scraped_data(scraped_result("N82E16819113878", pages=1))
+
+        assert len(a.get_product_summary()) == 2
+        assert len(b.get_product_summary()) == 2
+    finally:
+        close_pooled_connections()
+
+def test_rollback_drops_results_cached_inside_the_transaction(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction():
+            db.insert_scraped_data(scraped_result())
+            assert len(db.get_product_summary()) == 1
+            raise RuntimeError("abort")
+
+    assert db.get_product_summary().empty
@@ -0,0 +1,50 @@
+import enhanced_scraper
+from enhanced_scraper import EnhancedNeweggScraper
+from result_cache import ResultCache
+from conftest import scraped_result
+
+URL = "https://www.newegg.com/p/N82E16819113877"
+
+class FakePage:
+    def goto(self, url, timeout):
+        pass
+
+def _scraper(monkeypatch, tmp_path, result):
+    cache = ResultCache(str(tmp_path), ttl=3600)
+    monkeypatch.setattr(enhanced_scraper, "get_result_cache", lambda: cache)
+    monkeypatch.setattr(enhanced_scraper.random, "random", lambda: 1.0)
+
+    scraper = EnhancedNeweggScraper(headless=True)
+    scraper._ensure_browser = lambda: None
+    scraper.current_profile = scraper.user_agent_rotator.get_next_profile()
+    scraper._new_context = lambda: setattr(scraper, "page", FakePage())
+    scraper._close_context = lambda: None
+    scraper._rate_limited_delay = lambda: None
+    scraper._extract_product_info = lambda: result["product"]
+    scraper._iter_review_pages = lambda max_pages: iter(result["reviews"])
+    return scraper, cache
+
+def test_review_sink_scrape_is_cached(monkeypatch, tmp_path):
+    result = scraped_result(pages=2, per_page=2)
+    scraper, cache = _scraper(monkeypatch, tmp_path, result)
+    pages = []
+
+    scraped = scraper.scrape_product(URL, 2, review_sink=lambda product, scraped_at, page: pages.append(page))
+
+    assert scraped["reviews"] == []
+    assert scraped["metadata"]["total_reviews"] == 4
+    assert pages == result["reviews"]
+    assert cache.get(URL, 2)["reviews"] == result["reviews"]
+
+def test_cached_result_is_replayed_through_the_review_sink(monkeypatch, tmp_path):
+    result = scraped_result(pages=2, per_page=2)
+    scraper, cache = _scraper(monkeypatch, tmp_path, result)
+    cache.set(URL, 2, result)
+    scraper._new_context = None  # a cache hit must not open the browser
+    pages = []
+
+    scraped = scraper.scrape_product(URL, 2, review_sink=lambda product, scraped_at, page: pages.append(page))
+
+    assert scraped["reviews"] == []
+    assert scraped["product"] == result["product"]
+    assert pages == result["reviews"]
@@ -0,0 +1,48 @@
+import orjson
+
+from newegg_scraper import (REVIEW_FIELDS, iter_review_rows, prepare_for_duckdb, reviews_frame,
+                            write_reviews_jsonl)
+from conftest import scraped_result
+
+def test_prepare_for_duckdb_lays_reviews_out_by_column():
+    data = prepare_for_duckdb(scraped_result(pages=2, per_page=3))
+    reviews = data["reviews_table"]
+
+    assert data["product_table"][0]["item_number"] == "N82E16819113877"
+    assert len(data["metadata_table"]) == 1
+    assert set(REVIEW_FIELDS) <= set(reviews)
+    assert {len(values) for values in reviews.values()} == {6}
+    assert reviews["review_id"][3] == "page_2_review_1"
+    assert reviews["product_item_number"] == ["N82E16819113877"] * 6
+    assert reviews["product_url"][0] == "https://www.newegg.com/p/N82E16819113877"
+
+def test_prepare_for_duckdb_without_reviews():
+    data = prepare_for_duckdb(scraped_result(pages=0))
+
+    assert all(values == [] for values in data["reviews_table"].values())
+    assert list(iter_review_rows(data)) == []
+
+def test_iter_review_rows_rebuilds_row_dicts():
+    result = scraped_result(pages=1, per_page=2)
+    rows = list(iter_review_rows(prepare_for_duckdb(result)))
+
+    assert len(rows) == 2
+    assert {field: rows[1][field] for field in REVIEW_FIELDS} == result["reviews"][0][1]
+    assert rows[1]["product_title"] == "AMD Ryzen 7 9800X3D"
+
+def test_write_reviews_jsonl(tmp_path):
+    data = prepare_for_duckdb(scraped_result(pages=2, per_page=2))
+    path = tmp_path / "reviews.jsonl"
+
+    count = write_reviews_jsonl(data, str(path))
+
+    lines = path.read_bytes().splitlines()
+    assert count == len(lines) == 4
+    assert [orjson.loads(line) for line in lines] == list(iter_review_rows(data))
+
+def test_reviews_frame_uses_categoricals_for_product_columns():
+    frame = reviews_frame(prepare_for_duckdb(scraped_result()))
+
+    assert len(frame) == 6
+    assert frame["product_brand"].dtype.name == "category"
+    assert frame["title"].dtype.name == "object"
@@ -0,0 +1,175 @@
+import time
+
+import newegg_scraper
+from newegg_scraper import NeweggScraper, NeweggScraperPool
+from review_api import CapturedReviewRequest
+
+class FakeLocator:
+    def __init__(self, texts):
+        self._texts = texts
+
+    def all_inner_texts(self):
+        return self._texts
+
+class FakePage:
+    url = "https://www.newegg.com/p/N82E16819113877"
+
+    def __init__(self, page_labels):
+        self._page_labels = page_labels
+
+    def locator(self, selector):
+        return FakeLocator(self._page_labels)
+
+class FakeContext:
+    def cookies(self, url):
+        return [{"name": "NV%5FDVINFO", "value": "1"}, {"name": "session", "value": "abc"}]
+
+def _scraper(tmp_path, review_server, page_labels):
+    scraper = NeweggScraper(cache_dir=str(tmp_path))
+    scraper.page = FakePage(page_labels)
+    scraper.context = FakeContext()
+    scraper._review_request = CapturedReviewRequest(review_server.url(), "GET", {}, None)
+    return scraper
+
+def test_fetch_pages_via_api_in_sync_playwright_session(tmp_path, review_server, sync_playwright_session):
+    scraper = _scraper(tmp_path, review_server, ["1", "2", "3", " 4 ", "Next"])
+
+    pages = scraper._fetch_pages_via_api(max_pages=3)
+
+    assert [page[0]["page_number"] for page in pages] == [2, 3]
+    assert sorted(request["page"] for request in review_server.requests) == [2, 3]
+    assert review_server.requests[0]["cookie"] == "NV%5FDVINFO=1; session=abc"
+
+def test_fetch_pages_via_api_without_pagination(tmp_path, review_server):
+    scraper = _scraper(tmp_path, review_server, [])
+
+    assert scraper._fetch_pages_via_api(max_pages=None) is None
+    assert review_server.requests == []
+
+class FakePagerButton:
+    def __init__(self, pager, label):
+        self._pager = pager
+        self._label = label
+
+    def count(self):
+        return 1
+
+    def inner_text(self):
+        return self._label
+
+class FakePager:
+    """Pagination showing the active page, its two neighbours either side and the last page."""
+
+    def __init__(self, last_page, active=1):
+        self.last_page = last_page
+        self.active = active
+        self.clicks = []
+
+    def buttons(self):
+        pages = sorted({*range(max(1, self.active - 2), min(self.last_page, self.active + 2) + 1), self.last_page})
+        return [FakePagerButton(self, str(page)) for page in pages]
+
+    def locator(self, selector):
+        pager = self
+
+        class Locator:
+            first = FakePagerButton(pager, str(pager.active))
+
+            def all(self):
+                return pager.buttons()
+
+        return Locator()
+
+def test_go_to_review_page_jumps_through_a_windowed_pagination(tmp_path):
+    scraper = NeweggScraper(cache_dir=str(tmp_path))
+    scraper.page = pager = FakePager(last_page=20)
+
+    def click(button):
+        pager.clicks.append(button.inner_text())
+        pager.active = int(button.inner_text())
+
+    scraper._click_review_page = click
+
+    assert scraper._go_to_review_page(8)
+    assert pager.clicks == ["3", "5", "7", "8"]
+    assert not scraper._go_to_review_page(30)
+
+def test_recycle_at_review_page_reopens_the_page(tmp_path):
+    scraper = NeweggScraper(cache_dir=str(tmp_path), context_recycle_interval=2)
+    scraper._current_url = "https://www.newegg.com/p/N82E16819113877"
+    calls = []
+    scraper._maybe_recycle_context = lambda: calls.append("recycle") or True
+    scraper.page = type("Page", (), {"goto": lambda self, url, timeout: calls.append(url)})()
+    scraper._settle = lambda: None
+    scraper._navigate_to_reviews = lambda: calls.append("reviews") or True
+    scraper._go_to_review_page = lambda page_number: calls.append(page_number) or True
+
+    assert scraper._recycle_at_review_page(4)
+    assert calls == ["recycle", scraper._current_url, "reviews", 4]
+
+def test_recycle_at_review_page_when_not_due(tmp_path):
+    scraper = NeweggScraper(cache_dir=str(tmp_path), context_recycle_interval=10)
+    scraper._pages_since_recycle = 9
+
+    assert scraper._recycle_at_review_page(4)
+
+def test_pool_worker_reuses_its_scraper_across_products(monkeypatch):
+    acquired, released = [], []
+
+    class PooledScraper:
+        def scrape_product(self, url, max_review_pages):
+            if url.endswith("bad"):
+                raise RuntimeError("navigation failed")
+            return {"url": url, "scraper": id(self)}
+
+    pool = NeweggScraperPool(pool_size=1)
+    monkeypatch.setattr(pool, "acquire", lambda: acquired.append(PooledScraper()) or acquired[-1])
+    monkeypatch.setattr(pool, "release", released.append)
+    monkeypatch.setattr(newegg_scraper, "shutdown_browser", lambda: None)
+
+    results = pool.scrape_many(["u1", "u2", "bad", "u3"])
+
+    assert [result["url"] for result in results] == ["u1", "u2", "u3"]
+    # One scraper for u1, u2 and the failure, a new one after it
+    assert len(acquired) == 2
+    assert released == acquired
+
+def test_scroll_down_waits_on_the_scroll_not_a_fixed_sleep(tmp_path):
+    calls = []
+
+    class ScrollPage:
+        mouse = type("Mouse", (), {"wheel": lambda self, x, y: calls.append(("wheel", y))})()
+
+        def evaluate(self, expression):
+            return 1200
+
+        def wait_for_function(self, expression, arg, polling, timeout):
+            calls.append(("wait", arg, polling))
+            raise newegg_scraper.PlaywrightTimeoutError("still scrolling")
+
+        def wait_for_load_state(self, state, timeout):
+            calls.append(("load", state))
+
+    scraper = NeweggScraper(cache_dir=str(tmp_path))
+    scraper.page = ScrollPage()
+
+    start = time.monotonic()
+    scraper._scroll_down(600)
+
+    assert time.monotonic() - start < 1
+    assert calls == [("wheel", 600), ("wait", [1200, 600], "raf"), ("load", "domcontentloaded")]
+
+def test_go_to_review_page_gives_up_when_a_click_does_not_advance(tmp_path):
+    scraper = NeweggScraper(cache_dir=str(tmp_path))
+    scraper.page = pager = FakePager(last_page=20)
+    scraper._click_review_page = lambda button: pager.clicks.append(button.inner_text())
+
+    assert not scraper._go_to_review_page(8)
+    assert pager.clicks == ["3"]
+
+def test_recycling_is_opt_in(tmp_path):
+    scraper = NeweggScraper(cache_dir=str(tmp_path))
+    scraper._pages_since_recycle = 1000
+
+    assert not scraper._maybe_recycle_context()
+    assert NeweggScraperPool().context_recycle_interval == 10
@@ -0,0 +1,39 @@
+import pandas as pd
+
+import query_db
+
+class FakeResult:
+    description = [("title",), ("rating",)]
+
+    def __init__(self, rows):
+        self._rows = list(rows)
+
+    def fetchmany(self, size):
+        rows, self._rows = self._rows[:size], self._rows[size:]
+        return rows
+
+def _table_lines(output):
+    lines = output.splitlines()
+    return lines[3:-1]
+
+def test_print_result_keeps_later_chunks_aligned(monkeypatch, capsys):
+    monkeypatch.setattr(query_db, "PRINT_CHUNK_ROWS", 2)
+
+    query_db.print_result(FakeResult([("ok", "5/5"), ("fine", "4/5"), ("a much longer title", "3/5")]), "Reviews")
+
+    lines = _table_lines(capsys.readouterr().out)
+    assert lines[0] == "title rating"
+    assert len({len(line) for line in lines}) == 1
+    assert lines[3] == "a mu…    3/5"
+
+def test_print_result_without_rows(capsys):
+    query_db.print_result(FakeResult([]), "Reviews")
+
+    assert "No data found." in capsys.readouterr().out
+
+def test_print_dataframe_prints_one_table(capsys):
+    df = pd.DataFrame({"rating": ["5/5", "4/5"], "count": [10, 2]})
+
+    query_db.print_dataframe(df, "Ratings")
+
+    assert _table_lines(capsys.readouterr().out) == df.to_string(index=False).splitlines()
@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+
+from rate_limiter import ConcurrentScraper, RateLimitConfig, TokenBucketRateLimiter
+
+def test_burst_is_granted_immediately():
+    limiter = TokenBucketRateLimiter(RateLimitConfig(requests_per_second=10, burst_size=3))
+
+    start = time.monotonic()
+    assert all(limiter.acquire(timeout=1) for _ in range(3))
+    assert time.monotonic() - start < 0.05
+
+def test_empty_bucket_waits_one_interval():
+    limiter = TokenBucketRateLimiter(RateLimitConfig(requests_per_second=20, burst_size=1))
+    limiter.acquire()
+
+    start = time.monotonic()
+    assert limiter.acquire(timeout=1)
+    assert 0.03 <= time.monotonic() - start < 0.2
+
+def test_acquire_times_out_when_no_token_is_due():
+    limiter = TokenBucketRateLimiter(RateLimitConfig(requests_per_second=0.5, burst_size=1))
+    limiter.acquire()
+
+    start = time.monotonic()
+    assert limiter.acquire(timeout=0.1) is False
+    assert time.monotonic() - start < 0.5
+
+class RecordingScraper:
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.scraped = []
+        self.closed = False
+        RecordingScraper.instances.append(self)
+
+    def scrape_product(self, url, max_review_pages=None):
+        self.scraped.append((url, max_review_pages))
+        return {"url": url}
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.closed = True
+
+class FakeCache:
+    def __init__(self, results):
+        self.results = results
+        self.lookups = []
+
+    def get(self, url, max_review_pages=None):
+        self.lookups.append((url, max_review_pages))
+        return self.results.get(url)
+
+def _run(coro):
+    return asyncio.run(coro)
+
+def test_concurrent_scraper_uses_the_given_cache_and_page_limit():
+    RecordingScraper.instances = []
+    cache = FakeCache({"cached": {"url": "cached", "from_cache": True}})
+    scraper = ConcurrentScraper(max_workers=1, rate_limit_config=RateLimitConfig(requests_per_second=100),
+                                result_cache=cache, max_review_pages=2)
+
+    async def scrape():
+        try:
+            return await scraper.scrape_products(["cached", "fresh"], RecordingScraper)
+        finally:
+            await scraper.aclose()
+
+    results = _run(scrape())
+
+    assert results == [{"url": "cached", "from_cache": True}, {"url": "fresh"}]
+    assert cache.lookups == [("cached", 2), ("fresh", 2)]
+    assert RecordingScraper.instances[0].scraped == [("fresh", 2)]
+
+def test_concurrent_scraper_without_a_cache_scrapes_everything():
+    RecordingScraper.instances = []
+    scraper = ConcurrentScraper(max_workers=1, rate_limit_config=RateLimitConfig(requests_per_second=100))
+
+    async def scrape():
+        try:
+            return await scraper.scrape_products(["a", "b"], RecordingScraper)
+        finally:
+            await scraper.aclose()
+
+    assert len(_run(scrape())) == 2
+    assert RecordingScraper.instances[0].scraped == [("a", None), ("b", None)]
+
+def test_pooled_scrapers_are_keyed_on_kwargs():
+    RecordingScraper.instances = []
+    scraper = ConcurrentScraper(max_workers=1, rate_limit_config=RateLimitConfig(requests_per_second=100))
+
+    async def scrape():
+        try:
+            await scraper.scrape_products(["a"], RecordingScraper, headless=True)
+            await scraper.scrape_products(["b"], RecordingScraper, headless=False)
+            await scraper.scrape_products(["c"], RecordingScraper, headless=True)
+        finally:
+            await scraper.aclose()
+
+    _run(scrape())
+
+    assert [instance.kwargs for instance in RecordingScraper.instances] == [{"headless": True}, {"headless": False}]
+    assert [instance.scraped for instance in RecordingScraper.instances] == [
+        [("a", None), ("c", None)], [("b", None)]
+    ]
+
+def test_aclose_closes_every_worker_threads_scrapers(monkeypatch):
+    import browser_pool
+
+    RecordingScraper.instances = []
+    shutdowns = []
+    monkeypatch.setattr(browser_pool, "shutdown_browser", lambda: shutdowns.append(threading.get_ident()))
+
+    class SlowScraper(RecordingScraper):
+        def scrape_product(self, url, max_review_pages=None):
+            time.sleep(0.05)
+            self.thread = threading.get_ident()
+            return super().scrape_product(url, max_review_pages)
+
+    scraper = ConcurrentScraper(max_workers=3, rate_limit_config=RateLimitConfig(requests_per_second=1000, burst_size=10))
+
+    async def scrape():
+        await scraper.scrape_products([f"u{i}" for i in range(6)], SlowScraper)
+        await scraper.aclose()
+
+    _run(scrape())
+
+    threads = {instance.thread for instance in RecordingScraper.instances}
+    assert len(threads) == len(RecordingScraper.instances) > 1
+    assert all(instance.closed for instance in RecordingScraper.instances)
+    assert sorted(shutdowns) == sorted(threads)
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+
+from review_api import CapturedReviewRequest, fetch_reviews, parse_review_payload
+from conftest import review_payload
+
+def test_parse_review_payload_maps_nested_reviews():
+    reviews = parse_review_payload(review_payload(3), 3)
+
+    assert [review["review_id"] for review in reviews] == ["page_3_review_1", "page_3_review_2"]
+    first = reviews[0]
+    assert first["rating"] == "4/5"
+    assert first["date"] == "3/7/2024"
+    assert first["author"] == "user1"
+    assert first["is_verified"] is True
+    assert first["cons"] == "Not specified"
+    assert first["full_content"] == "Pros: Fast\nOverall Review: Works well"
+
+def test_parse_review_payload_ignores_unrecognized_payloads():
+    assert parse_review_payload({"Message": "error"}, 1) == []
+    assert parse_review_payload([{"Title": "no rating"}], 1) == []
+
+def test_for_page_rewrites_json_query_value():
+    captured = CapturedReviewRequest.from_parts(
+        'https://www.newegg.com/product/api/ProductReview?reviewRequestStr={"PageIndex":1,"ItemNumber":"x"}',
+        "GET", {":authority": "www.newegg.com", "Accept": "application/json", "Cookie": "a=b"}, None)
+
+    url, body = captured.for_page(4)
+
+    assert captured.headers == {"Accept": "application/json"}
+    assert body is None
+    assert '"PageIndex":4' in url.replace("%22", '"').replace("%3A", ":").replace("%2C", ",")
+
+def test_for_page_rewrites_json_body():
+    captured = CapturedReviewRequest("https://example.com/api/ProductReview", "POST", {},
+                                     json.dumps({"Paging": {"PageNumber": 1}}))
+
+    _, body = captured.for_page(2)
+
+    assert json.loads(body) == {"Paging": {"PageNumber": 2}}
+
+def test_for_page_without_page_field_raises():
+    with pytest.raises(ValueError):
+        CapturedReviewRequest("https://example.com/api/ProductReview?q=1", "GET", {}, None).for_page(2)
+
+def test_fetch_reviews(review_server):
+    captured = CapturedReviewRequest(review_server.url(), "GET", {}, None)
+    calls = []
+
+    pages = fetch_reviews(captured, [2, 3], cookies="session=1", before_request=lambda: calls.append(1))
+
+    assert sorted(pages) == [2, 3]
+    assert pages[3][0]["title"] == "Page 3 review 1"
+    assert sorted(request["page"] for request in review_server.requests) == [2, 3]
+    assert all(request["cookie"] == "session=1" for request in review_server.requests)
+    assert len(calls) == 2
+
+def test_fetch_reviews_from_sync_playwright_thread(review_server, sync_playwright_session):
+    captured = CapturedReviewRequest(review_server.url(), "GET", {}, None)
+
+    pages = fetch_reviews(captured, [2])
+
+    assert pages[2][1]["title"] == "Page 2 review 2"
@@ -1,5 +1,7 @@
+import heapq
 import random
-from typing import Dict, List, Optional
+import sys
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 @dataclass
@@ -13,6 +15,15 @@ class BrowserProfile:
     sec_ch_ua_platform: str
     viewport_width: int
     viewport_height: int
+    
+    def __post_init__(self):
+        """Intern the header strings so every result and request shares one copy."""
+        self.user_agent = sys.intern(self.user_agent)
+        self.accept_language = sys.intern(self.accept_language)
+        self.accept_encoding = sys.intern(self.accept_encoding)
+        self.sec_ch_ua = sys.intern(self.sec_ch_ua)
+        self.sec_ch_ua_mobile = sys.intern(self.sec_ch_ua_mobile)
+        self.sec_ch_ua_platform = sys.intern(self.sec_ch_ua_platform)
 
 class UserAgentRotator:
     """
@@ -31,6 +42,10 @@ class UserAgentRotator:
         self.current_index = 0
         self.profiles = self._create_browser_profiles()
         self.usage_count = {i: 0 for i in range(len(self.profiles))}
+        self._usage_heap = self._build_usage_heap()
+        # Headers built per profile object, keyed by id() since profiles are mutable dataclasses
+        self._headers_cache: Dict[int, Tuple[BrowserProfile, Dict[str, str]]] = {}
+        self._viewport_cache: Dict[int, Tuple[BrowserProfile, Dict[str, int]]] = {}
     
     def _create_browser_profiles(self) -> List[BrowserProfile]:
         """Create realistic browser profiles."""
@@ -114,6 +129,17 @@ class UserAgentRotator:
             )
         ]
     
+    def _build_usage_heap(self) -> List[Tuple[int, float, int]]:
+        """
+        Heap of (usage count, random tie-break, profile index) for the weighted strategy.
+        
+        The random key spreads picks across equally used profiles, like choosing
+        at random among them.
+        """
+        heap = [(count, random.random(), i) for i, count in self.usage_count.items()]
+        heapq.heapify(heap)
+        return heap
+    
     def get_next_profile(self) -> BrowserProfile:
         """Get the next browser profile based on rotation strategy."""
         if self.rotation_strategy == "random":
@@ -123,9 +149,8 @@ class UserAgentRotator:
             self.current_index = (self.current_index + 1) % len(self.profiles)
         elif self.rotation_strategy == "weighted":
             # Weighted selection - prefer less used profiles
-            min_usage = min(self.usage_count.values())
-            candidates = [i for i, count in self.usage_count.items() if count == min_usage]
-            profile_index = random.choice(candidates)
+            count, _, profile_index = self._usage_heap[0]
+            heapq.heapreplace(self._usage_heap, (count + 1, random.random(), profile_index))
         else:
             profile_index = 0
         
@@ -133,11 +158,20 @@ class UserAgentRotator:
         return self.profiles[profile_index]
     
     def get_headers(self, profile: Optional[BrowserProfile] = None) -> Dict[str, str]:
-        """Get HTTP headers for a browser profile."""
+        """
+        Get HTTP headers for a browser profile.
+        
+        The dict is built once per profile and shared between calls, so callers
+        must copy it before changing it.
+        """
         if profile is None:
             profile = self.get_next_profile()
         
-        return {
+        cached = self._headers_cache.get(id(profile))
+        if cached is not None and cached[0] is profile:
+            return cached[1]
+        
+        headers = {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,image/apng,*/*;q=0.8',
             'Accept-Language': profile.accept_language,
             'Accept-Encoding': profile.accept_encoding,
@@ -152,16 +186,28 @@ class UserAgentRotator:
             'Sec-Ch-Ua-Mobile': profile.sec_ch_ua_mobile,
             'Sec-Ch-Ua-Platform': profile.sec_ch_ua_platform
         }
+        self._headers_cache[id(profile)] = (profile, headers)
+        return headers
     
     def get_viewport(self, profile: Optional[BrowserProfile] = None) -> Dict[str, int]:
-        """Get viewport dimensions for a browser profile."""
+        """
+        Get viewport dimensions for a browser profile.
+        
+        Like get_headers, the dict is built once per profile and shared between calls.
+        """
         if profile is None:
             profile = self.get_next_profile()
         
-        return {
+        cached = self._viewport_cache.get(id(profile))
+        if cached is not None and cached[0] is profile:
+            return cached[1]
+        
+        viewport = {
             'width': profile.viewport_width,
             'height': profile.viewport_height
         }
+        self._viewport_cache[id(profile)] = (profile, viewport)
+        return viewport
     
     def get_usage_stats(self) -> Dict[str, int]:
         """Get usage statistics for each profile."""
@@ -171,4 +217,5 @@ class UserAgentRotator:
     
     def reset_usage_stats(self):
         """Reset usage statistics."""
-        self.usage_count = {i: 0 for i in range(len(self.profiles))} 
\ No newline at end of file
+        self.usage_count = {i: 0 for i in range(len(self.profiles))}
+        self._usage_heap = self._build_usage_heap() 
\ No newline at end of file